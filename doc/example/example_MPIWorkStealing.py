@@ -0,0 +1,74 @@
+"""
+This file serves as an example how to use MPIWorkStealingEngine
+to optimize across nodes and also as a test for the
+MPIWorkStealingEngine.
+
+Run it via, e.g., ``mpiexec -np 3 python example_MPIWorkStealing.py``.
+"""
+import numpy as np
+import scipy as sp
+
+import pypesto
+import pypesto.optimize as optimize
+
+# you need to manually import the MPIWorkStealingEngine
+from pypesto.engine.mpi_work_stealing import MPIWorkStealingEngine
+from pypesto.store import OptimizationResultHDF5Writer, ProblemHDF5Writer
+
+
+def setup_rosen_problem(n_starts: int = 2):
+    """
+    Set up the rosenbrock problem and return a pypesto.Problem.
+    """
+    objective = pypesto.Objective(
+        fun=sp.optimize.rosen,
+        grad=sp.optimize.rosen_der,
+        hess=sp.optimize.rosen_hess,
+    )
+
+    dim_full = 10
+    lb = -5 * np.ones((dim_full, 1))
+    ub = 5 * np.ones((dim_full, 1))
+
+    # fixing startpoints
+    startpoints = pypesto.startpoint.latin_hypercube(
+        n_starts=n_starts, lb=lb, ub=ub
+    )
+    problem = pypesto.Problem(
+        objective=objective, lb=lb, ub=ub, x_guesses=startpoints
+    )
+    return problem
+
+
+if __name__ == "__main__":
+    # the same script runs on all ranks. On worker ranks, entering the
+    # engine context executes tasks until the scheduler closes the engine.
+    with MPIWorkStealingEngine() as engine:
+        # set all your code into this if condition.
+        # This way only the scheduler rank performs the code
+        # and distributes the work of the optimization.
+        if engine.is_scheduler:
+            # set number of starts
+            n_starts = 20
+            # create problem
+            problem = setup_rosen_problem(n_starts=n_starts)
+            # create optimizer
+            optimizer = optimize.FidesOptimizer(verbose=40)
+
+            # the engine can be used for several analyses, workers keep
+            # the problem cached in between
+            for _ in range(2):
+                result = optimize.minimize(
+                    problem=problem,
+                    optimizer=optimizer,
+                    n_starts=n_starts,
+                    engine=engine,
+                    progress_bar=False,
+                )
+
+            # saving optimization results to hdf5
+            file_name = "temp_result_work_stealing.h5"
+            opt_result_writer = OptimizationResultHDF5Writer(file_name)
+            problem_writer = ProblemHDF5Writer(file_name)
+            problem_writer.write(problem, overwrite=True)
+            opt_result_writer.write(result, overwrite=True)
@@ -0,0 +1,73 @@
+"""Micro-benchmark of the call overhead of cheap objectives.
+
+Compares the regular objective call with a :class:`pypesto.objective.CallPlan`
+for a parameter prior and a quadratic function, with and without fixed
+parameters.
+
+Run via ``python example_call_plan_benchmark.py``.
+"""
+
+import timeit
+from functools import partial
+
+import numpy as np
+
+import pypesto
+from pypesto.objective import CallPlan, NegLogParameterPriors
+from pypesto.objective.priors import get_parameter_prior_dict
+
+N_EVALS = 100_000
+DIM = 10
+
+
+def create_problems():
+    """Create the objectives to benchmark."""
+    priors = NegLogParameterPriors(
+        [
+            get_parameter_prior_dict(i_par, "normal", [0, 1])
+            for i_par in range(DIM)
+        ]
+    )
+    quadratic = pypesto.Objective(
+        fun=lambda x: x @ x,
+        grad=lambda x: 2 * x,
+    )
+
+    problems = {}
+    for name, objective in [("priors", priors), ("quadratic", quadratic)]:
+        problems[name] = pypesto.Problem(
+            objective, lb=-np.ones(DIM), ub=np.ones(DIM)
+        )
+        problems[f"{name}, fixed"] = pypesto.Problem(
+            objective,
+            lb=-np.ones(DIM),
+            ub=np.ones(DIM),
+            x_fixed_indices=[0, DIM // 2],
+            x_fixed_vals=[0.1, 0.2],
+        )
+    return problems
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(  # noqa: T201
+        f"{'objective':<16} {'sensi':<8} {'call':>10} {'plan':>10} ratio"
+    )
+    for name, problem in create_problems().items():
+        x = rng.uniform(-1, 1, problem.dim)
+        for sensi_orders in [(0,), (0, 1)]:
+            plan = CallPlan(problem.objective, sensi_orders)
+            time_call = timeit.timeit(
+                partial(problem.objective, x, sensi_orders), number=N_EVALS
+            )
+            time_plan = timeit.timeit(partial(plan, x), number=N_EVALS)
+            print(  # noqa: T201
+                f"{name:<16} {str(sensi_orders):<8} "
+                f"{1e6 * time_call / N_EVALS:8.2f}us "
+                f"{1e6 * time_plan / N_EVALS:8.2f}us "
+                f"{time_call / time_plan:5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
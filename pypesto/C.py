@@ -77,6 +77,7 @@ TIME = "time"  # time
 N_FVAL = "n_fval"  # number of function evaluations
 N_GRAD = "n_grad"  # number of gradient evaluations
 N_HESS = "n_hess"  # number of Hessian evaluations
+N_HESSP = "n_hessp"  # number of Hessian vector product evaluations
 N_RES = "n_res"  # number of residual evaluations
 N_SRES = "n_sres"  # number of residual sensitivity evaluations
 START_TIME = "start_time"  # start time
@@ -7,8 +7,12 @@ multi-threaded or cluster-based. Note that it is not checked whether a single
 task itself is internally parallelized.
 """
 
+from .asynchronous import AsyncioEngine
 from .base import Engine
+from .journal import ResumableEngine
 from .multi_process import MultiProcessEngine
 from .multi_thread import MultiThreadEngine
+from .resources import ResourcePlan
 from .single_core import SingleCoreEngine
+from .supervisor import TaskFailedError
 from .task import Task
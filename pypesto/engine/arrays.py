@@ -0,0 +1,134 @@
+"""Transfer of large numpy arrays via memory-mapped files.
+
+Pickling large arrays, and sending them through the pipes of a process
+pool, copies the data several times. Instead, arrays exceeding a size
+threshold are written to ``.npy`` files, and the pickled payload only
+contains their file names. The receiving process memory-maps these files,
+such that the data is only read when accessed, and is backed by the
+operating system's page cache instead of a private copy.
+"""
+
+import io
+import logging
+import os
+import uuid
+from typing import Any, Union
+
+import cloudpickle as pickle
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# default minimum size in bytes of arrays transferred via files
+DEFAULT_ARRAY_THRESHOLD = 2**20
+
+
+def load_array(path: str, remove: bool) -> np.ndarray:
+    """Memory-map an array stored via :meth:`ArrayDirectory.reduce`.
+
+    The array is mapped copy-on-write, i.e. it can be modified without
+    affecting the file or other processes.
+
+    Parameters
+    ----------
+    path:
+        The ``.npy`` file.
+    remove:
+        Whether to remove the file after mapping it. The mapping stays
+        valid on POSIX systems.
+    """
+    array = np.load(path, mmap_mode="c").view(np.ndarray)
+    if remove:
+        try:
+            os.remove(path)
+        except OSError:
+            # e.g. on Windows, mapped files cannot be removed, they are
+            #  removed together with the directory
+            pass
+    return array
+
+
+class ArrayDirectory:
+    """Directory-backed transfer of large numpy arrays.
+
+    Parameters
+    ----------
+    directory:
+        The directory to store the arrays in.
+    threshold:
+        Minimum size in bytes of arrays to store in files. Smaller arrays
+        are pickled as usual.
+    """
+
+    def __init__(self, directory: str, threshold: int):
+        self.directory: str = directory
+        self.threshold: int = threshold
+
+    def should_store(self, obj: Any) -> bool:
+        """Check whether an object is an array to store in a file."""
+        return (
+            isinstance(obj, np.ndarray)
+            and not obj.dtype.hasobject
+            and obj.nbytes >= self.threshold
+        )
+
+    def reduce(self, array: np.ndarray, remove: bool) -> tuple:
+        """Store an array and return its pickle reduction.
+
+        Parameters
+        ----------
+        array:
+            The array.
+        remove:
+            Whether the file is removed once the array was loaded, i.e. the
+            payload can only be unpickled once.
+        """
+        path = os.path.join(self.directory, f"{uuid.uuid4().hex}.npy")
+        np.save(path, array, allow_pickle=False)
+        return load_array, (path, remove)
+
+    def dumps(self, obj: Any, remove: bool = False) -> bytes:
+        """Pickle an object, storing large arrays in files."""
+        with io.BytesIO() as file:
+            ArrayPickler(file, self, remove=remove).dump(obj)
+            return file.getvalue()
+
+
+class ArrayPickler(pickle.CloudPickler):
+    """Pickler storing large arrays via an :class:`ArrayDirectory`.
+
+    Parameters
+    ----------
+    file:
+        The file to write to.
+    arrays:
+        The array directory, or None to pickle arrays as usual.
+    remove:
+        See :meth:`ArrayDirectory.reduce`.
+    """
+
+    def __init__(
+        self,
+        file,
+        arrays: Union[ArrayDirectory, None] = None,
+        remove: bool = False,
+    ):
+        super().__init__(file)
+        self.arrays = arrays
+        self.remove = remove
+
+    def reducer_override(self, obj: Any):
+        """Store large arrays in files, reduce other objects as usual."""
+        if self.arrays is not None and self.arrays.should_store(obj):
+            return self.arrays.reduce(obj, remove=self.remove)
+        return super().reducer_override(obj)
+
+
+def work_arrays(args: tuple) -> bytes:
+    """Execute a work item, storing large arrays in the result in files.
+
+    Each result is unpickled exactly once in the main process, thus the
+    files are removed on loading.
+    """
+    arrays, work_fun, work_item = args
+    return arrays.dumps(work_fun(work_item), remove=True)
@@ -0,0 +1,154 @@
+"""Engine for concurrent execution of asynchronous tasks."""
+
+import asyncio
+import copy
+import logging
+import queue
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+from ..util import tqdm
+from .base import Engine
+from .task import Task, order_by_cost
+
+logger = logging.getLogger(__name__)
+
+
+async def work(task: Task) -> Any:
+    """Execute task, asynchronously if supported."""
+    if hasattr(task, "execute_async"):
+        return await task.execute_async()
+    # run synchronous tasks in a thread, to not block the event loop, on a
+    # copy, as in MultiThreadEngine
+    return await asyncio.to_thread(copy.deepcopy(task).execute)
+
+
+class AsyncioEngine(Engine):
+    """
+    Execute tasks concurrently in an asyncio event loop.
+
+    Intended for I/O-bound tasks, e.g. evaluating objectives that wait for
+    remote simulation services or simulator subprocesses. Such tasks
+    spend most of their time waiting, so that many of them can be in flight
+    at the same time on a single core.
+
+    Tasks providing a coroutine method `execute_async` are awaited in the
+    event loop, see e.g. :class:`pypesto.objective.ObjectiveCallTask`,
+    which evaluates objectives via
+    :meth:`pypesto.objective.ObjectiveBase.call_async`.
+    Other tasks are deep-copied and executed via
+    :meth:`pypesto.engine.Task.execute` in a thread pool, as in
+    :class:`pypesto.engine.MultiThreadEngine`.
+
+    Asynchronous tasks are not copied, so tasks sharing an objective are
+    executed on the same instance, whose history records all evaluations.
+
+    The event loop runs in a separate thread, such that the engine can also
+    be used if an event loop is already running, e.g. in Jupyter notebooks.
+
+    Parameters
+    ----------
+    max_concurrency:
+        The maximum number of tasks executed at the same time.
+    order_by_cost:
+        Whether to start tasks in order of decreasing
+        :attr:`pypesto.engine.Task.cost`.
+    """
+
+    def __init__(
+        self, max_concurrency: int = 1000, order_by_cost: bool = True
+    ):
+        super().__init__()
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive.")
+        self.max_concurrency: int = max_concurrency
+        self.order_by_cost: bool = order_by_cost
+
+    def execute(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> list[Any]:
+        """Execute tasks concurrently.
+
+        Parameters
+        ----------
+        tasks:
+            List of tasks to execute.
+        progress_bar:
+            Whether to display a progress bar.
+
+        Returns
+        -------
+        A list of results.
+        """
+        results = [None] * len(tasks)
+        for i_task, result in self.execute_iter(
+            tasks, progress_bar=progress_bar
+        ):
+            results[i_task] = result
+        return results
+
+    def execute_iter(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Execute tasks concurrently, yielding results in order of completion.
+
+        See :meth:`pypesto.engine.Engine.execute_iter`.
+        """
+        n_tasks = len(tasks)
+        if not n_tasks:
+            return
+
+        if self.order_by_cost:
+            order = order_by_cost(tasks)
+        else:
+            order = list(range(n_tasks))
+
+        # (i_task, success, result_or_exception), filled by the event loop
+        results = queue.Queue()
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        future = asyncio.run_coroutine_threadsafe(
+            self._execute_all(tasks, order, results), loop
+        )
+        try:
+            for _ in tqdm(range(n_tasks), enable=progress_bar):
+                i_task, success, result = results.get()
+                if not success:
+                    raise result
+                yield i_task, result
+        finally:
+            # cancel pending tasks if the iterator was closed early
+            future.cancel()
+            asyncio.run_coroutine_threadsafe(_cancel_all(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def _execute_all(
+        self, tasks: list[Task], order: list[int], results: queue.Queue
+    ) -> None:
+        """Execute tasks with bounded concurrency, reporting to `results`."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def work_bounded(i_task: int) -> None:
+            async with semaphore:
+                try:
+                    result = await work(tasks[i_task])
+                except Exception as err:
+                    results.put((i_task, False, err))
+                else:
+                    results.put((i_task, True, result))
+
+        await asyncio.gather(*(work_bounded(i_task) for i_task in order))
+
+
+async def _cancel_all() -> None:
+    """Cancel all other tasks of the running event loop and await them."""
+    current = asyncio.current_task()
+    pending = [task for task in asyncio.all_tasks() if task is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
@@ -1,6 +1,7 @@
 """Abstract engine base class."""
 
 import abc
+from collections.abc import Iterator
 from typing import Any
 
 from .task import Task
@@ -26,3 +27,30 @@ class Engine(abc.ABC):
             Whether to display a progress bar.
         """
         raise NotImplementedError("This engine is not intended to be called.")
+
+    def execute_iter(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Execute tasks and yield results as they become available.
+
+        In contrast to :meth:`execute`, results are delivered in order of
+        completion, not in order of submission. Closing the returned
+        iterator early cancels the execution of all not yet started tasks,
+        as far as supported by the engine.
+
+        The default implementation waits for all tasks to finish.
+        Engines supporting streaming result delivery override this method.
+
+        Parameters
+        ----------
+        tasks:
+            List of tasks to execute.
+        progress_bar:
+            Whether to display a progress bar.
+
+        Yields
+        ------
+        Tuples ``(task_index, result)``, where ``task_index`` is the index
+        of the task in `tasks`.
+        """
+        yield from enumerate(self.execute(tasks, progress_bar=progress_bar))
@@ -0,0 +1,236 @@
+"""Journaling of task results, to resume interrupted executions."""
+
+import logging
+import os
+import struct
+from collections.abc import Iterator
+from typing import Any, Callable, Union
+
+import cloudpickle as pickle
+
+from .base import Engine
+from .single_core import SingleCoreEngine
+from .task import Task
+
+logger = logging.getLogger(__name__)
+
+# format of the record length header
+_HEADER = struct.Struct("<Q")
+
+
+def default_task_key(task: Task) -> str:
+    """Get the key identifying a task in a journal.
+
+    Uses the task class name, the task's `id` attribute, which e.g.
+    :class:`pypesto.optimize.task.OptimizerTask` provides, and the task's
+    :meth:`pypesto.engine.Task.fingerprint`, if any. Thus, journaled results
+    of tasks with the same id but e.g. different start points, problem or
+    optimizer are not reused.
+    """
+    if not hasattr(task, "id"):
+        raise ValueError(
+            f"Task of type {type(task).__name__} has no `id` attribute, "
+            "please provide a `task_key` function."
+        )
+    key = f"{type(task).__name__}:{task.id}"
+    fingerprint = task.fingerprint()
+    if fingerprint is not None:
+        key += f":{fingerprint}"
+    return key
+
+
+class TaskJournal:
+    """Append-only file of task results.
+
+    Each record consists of a task key and the corresponding result. Records
+    are flushed to disk as soon as they are added, such that results
+    survive if the process is killed. A partially written last record, e.g.
+    from a process killed while writing, is discarded on loading.
+
+    Parameters
+    ----------
+    filename:
+        The journal file. Created if it does not exist.
+    """
+
+    def __init__(self, filename: str):
+        self.filename: str = filename
+
+    def load(self) -> dict[str, Any]:
+        """Load all complete records.
+
+        Returns
+        -------
+        Mapping of task keys to results.
+        """
+        records = {}
+        if not os.path.exists(self.filename):
+            return records
+
+        valid_size = 0
+        with open(self.filename, "rb") as f:
+            while True:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    break
+                (size,) = _HEADER.unpack(header)
+                blob = f.read(size)
+                if len(blob) < size:
+                    break
+                try:
+                    key, result = pickle.loads(blob)
+                except Exception as err:
+                    logger.warning(
+                        f"Could not read record from journal "
+                        f"{self.filename}: {err}"
+                    )
+                    break
+                records[key] = result
+                valid_size = f.tell()
+
+        if valid_size < os.path.getsize(self.filename):
+            logger.warning(
+                f"Discarding incomplete record at the end of journal "
+                f"{self.filename}."
+            )
+            with open(self.filename, "r+b") as f:
+                f.truncate(valid_size)
+
+        return records
+
+    def add(self, key: str, result: Any) -> None:
+        """Append a record and flush it to disk."""
+        blob = pickle.dumps((key, result))
+        with open(self.filename, "ab") as f:
+            f.write(_HEADER.pack(len(blob)) + blob)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class ResumableEngine(Engine):
+    """Engine recording finished tasks to a journal, to resume execution.
+
+    Wraps another engine. Each result is appended to a journal file as
+    soon as its task has finished. When tasks are executed again with the
+    same journal, e.g. after the process was killed, tasks whose key is
+    found in the journal are not executed again, and their journaled
+    results are returned instead.
+
+    For example, to make a long multistart optimization resumable::
+
+        engine = ResumableEngine(
+            MultiProcessEngine(), filename="multistart.journal"
+        )
+        result = minimize(problem, n_starts=1000, engine=engine)
+
+    Running the same script again after an interruption only performs the
+    starts whose ids are not yet in the journal. With the default
+    `task_key`, journaled results are only reused for identically
+    configured tasks, see :func:`default_task_key`. For multistart
+    optimization, the start points must thus be reproducible, e.g. by
+    seeding the random number generator.
+
+    Parameters
+    ----------
+    engine:
+        The engine to execute tasks with. Defaults to
+        :class:`pypesto.engine.SingleCoreEngine`.
+    filename:
+        The journal file.
+    task_key:
+        Function returning a key that identifies a task across executions.
+        Defaults to :func:`default_task_key`, which uses the task's `id`.
+    """
+
+    def __init__(
+        self,
+        engine: Union[Engine, None] = None,
+        filename: str = "pypesto.journal",
+        task_key: Callable[[Task], str] = default_task_key,
+    ):
+        super().__init__()
+        if engine is None:
+            engine = SingleCoreEngine()
+        self.engine: Engine = engine
+        self.journal: TaskJournal = TaskJournal(filename)
+        self.task_key: Callable[[Task], str] = task_key
+
+    def execute(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> list[Any]:
+        """Execute tasks not yet in the journal.
+
+        Parameters
+        ----------
+        tasks:
+            List of tasks to execute.
+        progress_bar:
+            Whether to display a progress bar.
+
+        Returns
+        -------
+        A list of results.
+        """
+        results = [None] * len(tasks)
+        for i_task, result in self.execute_iter(
+            tasks, progress_bar=progress_bar
+        ):
+            results[i_task] = result
+        return results
+
+    def execute_iter(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Yield journaled results, then execute the remaining tasks.
+
+        See :meth:`pypesto.engine.Engine.execute_iter`.
+        """
+        keys = [self.task_key(task) for task in tasks]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Task keys must be unique.")
+
+        journaled = self.journal.load()
+
+        i_pending = []
+        for i_task, key in enumerate(keys):
+            if key in journaled:
+                yield i_task, journaled[key]
+            else:
+                i_pending.append(i_task)
+
+        if self.task_key is default_task_key:
+            # journaled ids, with a different fingerprint
+            journaled_ids = {key.rsplit(":", 1)[0] for key in journaled}
+            n_mismatch = sum(
+                keys[i_task].rsplit(":", 1)[0] in journaled_ids
+                and tasks[i_task].fingerprint() is not None
+                for i_task in i_pending
+            )
+            if n_mismatch:
+                logger.warning(
+                    f"Journal {self.journal.filename} contains results for "
+                    f"{n_mismatch} task ids with a different configuration, "
+                    "e.g. start point, problem or optimizer. These tasks "
+                    "are executed again."
+                )
+
+        if len(i_pending) < len(tasks):
+            logger.info(
+                f"Resuming from journal {self.journal.filename}: "
+                f"{len(tasks) - len(i_pending)} of {len(tasks)} tasks "
+                "already finished."
+            )
+        if not i_pending:
+            return
+
+        results_iter = self.engine.execute_iter(
+            [tasks[i_task] for i_task in i_pending],
+            progress_bar=progress_bar,
+        )
+        try:
+            for i_sub, result in results_iter:
+                i_task = i_pending[i_sub]
+                self.journal.add(keys[i_task], result)
+                yield i_task, result
+        finally:
+            results_iter.close()
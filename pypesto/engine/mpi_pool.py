@@ -1,6 +1,8 @@
 """Engines with multi-node parallelization."""
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import as_completed
 from typing import Any
 
 import cloudpickle as pickle
@@ -49,13 +51,38 @@ class MPIPoolEngine(Engine):
         -------
         A list of results.
         """
+        results = [None] * len(tasks)
+        for i_task, result in self.execute_iter(
+            tasks, progress_bar=progress_bar
+        ):
+            results[i_task] = result
+        return results
+
+    def execute_iter(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Pickle tasks and yield results in order of completion.
+
+        See :meth:`pypesto.engine.Engine.execute_iter`.
+        """
         pickled_tasks = [pickle.dumps(task) for task in tasks]
 
         n_procs = MPI.COMM_WORLD.Get_size()  # Size of communicator
         logger.info(f"Parallelizing on {n_procs-1} workers with one manager.")
 
         with MPIPoolExecutor() as executor:
-            results = executor.map(
-                work, tqdm(pickled_tasks, enable=progress_bar)
-            )
-        return results
+            futures = {
+                executor.submit(work, pickled_task): i_task
+                for i_task, pickled_task in enumerate(pickled_tasks)
+            }
+            try:
+                for future in tqdm(
+                    as_completed(futures),
+                    total=len(futures),
+                    enable=progress_bar,
+                ):
+                    yield futures[future], future.result()
+            finally:
+                # cancel pending tasks if the iterator was closed early
+                for future in futures:
+                    future.cancel()
@@ -0,0 +1,350 @@
+"""Engine with dynamic scheduling and work stealing over MPI ranks."""
+
+import logging
+import math
+import traceback
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+import cloudpickle as pickle
+from mpi4py import MPI
+
+from ..util import tqdm
+from .base import Engine
+from .shared import (
+    dump_shared_object,
+    dumps_task,
+    get_shared_objects,
+    loads_task,
+)
+from .supervisor import TaskFailedError
+from .task import Task, order_by_cost
+
+logger = logging.getLogger(__name__)
+
+# rank of the scheduler
+SCHEDULER = 0
+
+# message tags, worker -> scheduler
+TAG_REQUEST = 1
+TAG_RESULT = 2
+TAG_STOLEN = 3
+# message tags, scheduler -> worker
+TAG_WORK = 11
+TAG_STEAL = 12
+TAG_CANCEL = 13
+TAG_STOP = 14
+
+
+def worker_loop(comm) -> None:
+    """Execute tasks received from the scheduler until stopped.
+
+    The worker keeps a local queue of assigned work items
+    ``(i_task, pickled_task)``, and requests more once it is empty. Before
+    starting a queued task, pending messages of the scheduler are handled,
+    which may take back (steal) half of the queue for idle workers.
+
+    Shared objects, e.g. problems, are kept in the process-wide cache of
+    :mod:`pypesto.engine.shared` across batches, such that e.g. objective
+    state persists on the rank.
+    """
+    blobs = {}
+    local = deque()
+    requested = False
+    status = MPI.Status()
+    while True:
+        if not local and not requested:
+            comm.send(None, dest=SCHEDULER, tag=TAG_REQUEST)
+            requested = True
+
+        if local and not comm.iprobe(source=SCHEDULER):
+            i_task, pickled_task = local.popleft()
+            try:
+                task = loads_task(pickled_task, blobs.__getitem__)
+                pickled_result = pickle.dumps((True, task.execute()))
+            except Exception:
+                pickled_result = pickle.dumps((False, traceback.format_exc()))
+            comm.send(
+                (i_task, pickled_result),
+                dest=SCHEDULER,
+                tag=TAG_RESULT,
+            )
+            continue
+
+        message = comm.recv(source=SCHEDULER, status=status)
+        tag = status.Get_tag()
+        if tag == TAG_WORK:
+            new_blobs, work_items = message
+            blobs.update(new_blobs)
+            local.extend(work_items)
+            requested = False
+        elif tag == TAG_STEAL:
+            # give back the tasks that would be executed last
+            stolen = [local.pop() for _ in range(len(local) // 2)]
+            comm.send(stolen, dest=SCHEDULER, tag=TAG_STOLEN)
+        elif tag == TAG_CANCEL:
+            local.clear()
+        elif tag == TAG_STOP:
+            break
+
+
+class MPIWorkStealingEngine(Engine):
+    """
+    Parallelize the task execution over MPI ranks with work stealing.
+
+    Uses `mpi4py <https://mpi4py.readthedocs.io/en/stable/>`_.
+    Rank 0 runs the main program and schedules the tasks, all other ranks
+    are workers. In contrast to
+    :class:`pypesto.engine.mpi_pool.MPIPoolEngine`:
+
+    * Tasks are pickled only when they are sent to a worker, in chunks of
+      decreasing size, so the scheduler never holds the pickled payload of
+      all tasks.
+    * Idle workers pull tasks. Once no unassigned tasks remain, idle
+      workers steal half of the queued tasks of the worker with the
+      largest queue.
+    * Objects shared by tasks (:attr:`pypesto.engine.Task.shared_attributes`,
+      e.g. the problem) are sent to each rank only once, and kept in a
+      rank-local cache across calls to :meth:`execute`, such that e.g.
+      objective state is reused.
+    * Results are yielded as they arrive, see :meth:`execute_iter`.
+
+    The same script is started on all ranks, e.g. via
+    ``mpiexec -np #Workers+1 python YOURFILE.py``, and should be structured
+    as follows::
+
+        with MPIWorkStealingEngine() as engine:
+            if engine.is_scheduler:
+                result = minimize(problem, engine=engine)
+
+    On worker ranks, entering the context runs the worker loop until the
+    engine is closed on the scheduler rank.
+
+    Failed tasks are passed as :class:`pypesto.engine.TaskFailedError` to
+    :meth:`pypesto.engine.Task.on_failure`, which by default raises.
+
+    Parameters
+    ----------
+    comm:
+        The MPI communicator. Defaults to ``MPI.COMM_WORLD``.
+    chunk_factor:
+        Tasks are sent in chunks of size
+        ``ceil(n_unassigned / (chunk_factor * n_workers))``. Larger values
+        give smaller chunks and better load balancing, at the cost of more
+        messages.
+    order_by_cost:
+        Whether to schedule tasks in order of decreasing
+        :attr:`pypesto.engine.Task.cost`.
+    """
+
+    def __init__(
+        self,
+        comm=None,
+        chunk_factor: int = 4,
+        order_by_cost: bool = True,
+    ):
+        super().__init__()
+        if comm is None:
+            comm = MPI.COMM_WORLD
+        if comm.Get_size() < 2:
+            raise ValueError(
+                "MPIWorkStealingEngine requires at least 2 MPI ranks, "
+                "one scheduler and one worker."
+            )
+        self.comm = comm
+        self.chunk_factor: int = chunk_factor
+        self.order_by_cost: bool = order_by_cost
+
+        # workers waiting for tasks
+        self._idle: set[int] = set()
+        # shared object keys already sent to each worker
+        self._sent_keys: dict[int, set[str]] = {
+            rank: set() for rank in self.worker_ranks
+        }
+
+    @property
+    def is_scheduler(self) -> bool:
+        """Whether this is the scheduler rank."""
+        return self.comm.Get_rank() == SCHEDULER
+
+    @property
+    def worker_ranks(self) -> list[int]:
+        """The ranks of all workers."""
+        return [
+            rank for rank in range(self.comm.Get_size()) if rank != SCHEDULER
+        ]
+
+    def __enter__(self):
+        if not self.is_scheduler:
+            worker_loop(self.comm)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker loops. Only has an effect on the scheduler."""
+        if not self.is_scheduler:
+            return
+        for rank in self.worker_ranks:
+            self.comm.send(None, dest=rank, tag=TAG_STOP)
+
+    def execute(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> list[Any]:
+        """Distribute tasks to workers.
+
+        Parameters
+        ----------
+        tasks:
+            List of :class:`pypesto.engine.Task` to execute.
+        progress_bar:
+            Whether to display a progress bar.
+
+        Returns
+        -------
+        A list of results.
+        """
+        results = [None] * len(tasks)
+        for i_task, result in self.execute_iter(
+            tasks, progress_bar=progress_bar
+        ):
+            results[i_task] = result
+        return results
+
+    def execute_iter(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Distribute tasks and yield results in order of arrival.
+
+        See :meth:`pypesto.engine.Engine.execute_iter`.
+        """
+        if not self.is_scheduler:
+            raise RuntimeError(
+                "Tasks can only be executed on the scheduler rank, see "
+                "`MPIWorkStealingEngine.is_scheduler`."
+            )
+        n_tasks = len(tasks)
+        logger.info(
+            f"Scheduling {n_tasks} tasks on {len(self.worker_ranks)} "
+            "workers."
+        )
+
+        blobs = {}
+        keys = {}
+        for obj in get_shared_objects(tasks):
+            key, blob = dump_shared_object(obj)
+            blobs[key] = blob
+            keys[id(obj)] = key
+
+        if self.order_by_cost:
+            unassigned = deque(order_by_cost(tasks))
+        else:
+            unassigned = deque(range(n_tasks))
+        # stolen work items, already pickled
+        returned = deque()
+        # number of tasks queued at or running on each worker
+        n_assigned = dict.fromkeys(self.worker_ranks, 0)
+        # workers asked to give back tasks
+        stealing = set()
+
+        def dispatch(rank: int) -> None:
+            """Send tasks to an idle worker, or steal some for it."""
+            if returned:
+                work_items = list(returned)
+                returned.clear()
+            elif unassigned:
+                chunksize = math.ceil(
+                    len(unassigned)
+                    / (self.chunk_factor * len(self.worker_ranks))
+                )
+                work_items = []
+                for _ in range(chunksize):
+                    i_task = unassigned.popleft()
+                    work_items.append(
+                        (i_task, dumps_task(tasks[i_task], keys))
+                    )
+            else:
+                victim = max(n_assigned, key=n_assigned.get)
+                if n_assigned[victim] > 1 and victim not in stealing:
+                    self.comm.send(None, dest=victim, tag=TAG_STEAL)
+                    stealing.add(victim)
+                return
+            new_blobs = {
+                key: blob
+                for key, blob in blobs.items()
+                if key not in self._sent_keys[rank]
+            }
+            self._sent_keys[rank].update(new_blobs)
+            self.comm.send((new_blobs, work_items), dest=rank, tag=TAG_WORK)
+            self._idle.discard(rank)
+            n_assigned[rank] += len(work_items)
+
+        def receive() -> tuple[int, int, Any]:
+            """Receive the next message from any worker."""
+            status = MPI.Status()
+            message = self.comm.recv(
+                source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG, status=status
+            )
+            rank = status.Get_source()
+            tag = status.Get_tag()
+            if tag == TAG_REQUEST:
+                self._idle.add(rank)
+            elif tag == TAG_RESULT:
+                n_assigned[rank] -= 1
+            elif tag == TAG_STOLEN:
+                stealing.discard(rank)
+                n_assigned[rank] -= len(message)
+            return rank, tag, message
+
+        n_remaining = n_tasks
+        finished = False
+        try:
+            with tqdm(total=n_tasks, enable=progress_bar) as pbar:
+                for rank in list(self._idle):
+                    dispatch(rank)
+                while n_remaining:
+                    rank, tag, message = receive()
+                    if tag == TAG_RESULT:
+                        i_task, pickled_result = message
+                        success, result = pickle.loads(pickled_result)
+                        if not success:
+                            result = tasks[i_task].on_failure(
+                                TaskFailedError(
+                                    f"Task {i_task} failed on rank "
+                                    f"{rank}: {result}",
+                                    n_attempts=1,
+                                )
+                            )
+                        n_remaining -= 1
+                        pbar.update(1)
+                        yield i_task, result
+                    elif tag == TAG_STOLEN:
+                        returned.extend(message)
+                    for idle_rank in list(self._idle):
+                        dispatch(idle_rank)
+            finished = True
+        finally:
+            if not finished:
+                self._cancel(n_assigned, stealing)
+
+    def _cancel(self, n_assigned: dict[int, int], stealing: set[int]):
+        """Cancel all assigned tasks, and wait for workers to be idle.
+
+        Results of running tasks are discarded.
+        """
+        for rank in self.worker_ranks:
+            if rank not in self._idle:
+                self.comm.send(None, dest=rank, tag=TAG_CANCEL)
+        status = MPI.Status()
+        while stealing or len(self._idle) < len(self.worker_ranks):
+            self.comm.recv(
+                source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG, status=status
+            )
+            rank = status.Get_source()
+            tag = status.Get_tag()
+            if tag == TAG_REQUEST:
+                self._idle.add(rank)
+            elif tag == TAG_STOLEN:
+                stealing.discard(rank)
@@ -3,13 +3,20 @@
 import logging
 import multiprocessing
 import os
+import shutil
+import tempfile
+from collections.abc import Iterator
 from typing import Any, Union
 
 import cloudpickle as pickle
 
 from ..util import tqdm
+from .arrays import DEFAULT_ARRAY_THRESHOLD, ArrayDirectory, work_arrays
 from .base import Engine
-from .task import Task
+from .resources import ResourcePlan, apply_worker_resource_plan
+from .shared import SharedObjectDirectory, dumps_task, loads_task
+from .supervisor import TaskFailedError, WorkerSupervisor
+from .task import Task, order_by_cost
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +24,21 @@ logger = logging.getLogger(__name__)
 def work(pickled_task):
     """Unpickle and execute task."""
     task = pickle.loads(pickled_task)
+    apply_worker_resource_plan(task)
+    return task.execute()
+
+
+def work_indexed(args):
+    """Execute a work item, returning the result with the task index."""
+    i_task, work_fun, work_item = args
+    return i_task, work_fun(work_item)
+
+
+def work_shared(args):
+    """Unpickle task, resolving shared objects, and execute it."""
+    load_blob, pickled_task = args
+    task = loads_task(pickled_task, load_blob)
+    apply_worker_resource_plan(task)
     return task.execute()
 
 
@@ -29,21 +51,86 @@ class MultiProcessEngine(Engine):
     n_procs:
         The maximum number of processes to use in parallel.
         Defaults to the number of CPUs available on the system according to
-        `os.cpu_count()`.
+        `os.cpu_count()`, or to the number of workers of the
+        `resource_plan`, if given.
         The effectively used number of processes will be the minimum of
         `n_procs` and the number of tasks submitted. Defaults to ``None``.
     method:
         Start method, any of "fork", "spawn", "forkserver", or None,
         giving the system specific default context. Defaults to ``None``.
+    persistent:
+        Whether to keep the worker processes alive across calls to
+        :meth:`execute`. In this mode, the objects listed in
+        :attr:`pypesto.engine.Task.shared_attributes` (e.g. the problem)
+        are transferred to each worker only once and cached there under a
+        content key, such that subsequent tasks only carry small per-task
+        payloads. The engine then needs to be closed via :meth:`close`,
+        or be used as a context manager::
+
+            with MultiProcessEngine(persistent=True) as engine:
+                result = minimize(problem, engine=engine)
+                result = parameter_profile(problem, result, engine=engine)
+    chunksize:
+        Number of tasks sent to a worker process at once. Larger chunks
+        reduce the communication overhead for many cheap tasks, smaller
+        chunks improve load balancing for tasks of varying duration.
+        Not used in fault-tolerant mode, where tasks are sent one by one.
+    order_by_cost:
+        Whether to submit tasks in order of decreasing
+        :attr:`pypesto.engine.Task.cost`, to reduce waiting for
+        long-running tasks at the end of a batch.
+    task_timeout:
+        Maximum wall time in seconds for executing a single task. Workers
+        exceeding it are terminated and replaced.
+    n_retries:
+        Number of times a failed task is retried, on a fresh worker process
+        if the worker crashed or timed out.
+    max_tasks_per_worker:
+        Number of tasks after which a worker process is replaced by a fresh
+        one, to contain e.g. memory growth from leaky native extensions.
+    resource_plan:
+        Budget of cores per worker. Limits OpenMP/BLAS thread pools in the
+        worker processes, and sets the number of threads of the objectives
+        of the executed tasks, see :class:`pypesto.engine.ResourcePlan`.
+    array_threshold:
+        Minimum size in bytes of numpy arrays in tasks and results that are
+        transferred via memory-mapped files instead of being pickled, see
+        :mod:`pypesto.engine.arrays`. This avoids copying e.g. large
+        ensembles of parameter vectors, or simulated trajectories and
+        sensitivities, through the pipes between processes. The files are
+        created in the default directory for temporary files, which can be
+        set via the `TMPDIR` environment variable, e.g. to a memory-backed
+        file system like `/dev/shm`. None to pickle all arrays.
+
+    If `task_timeout` or `n_retries` is set, the engine operates in a
+    fault-tolerant mode: Tasks that raise an exception, crash their worker
+    process (e.g. due to a segmentation fault in a compiled model), or
+    exceed the time limit, are retried up to `n_retries` times, and are
+    then passed as :class:`pypesto.engine.TaskFailedError` to
+    :meth:`pypesto.engine.Task.on_failure`, whose return value is used as
+    the task result. This way, a single failing task does not abort the
+    whole batch. E.g. :class:`pypesto.optimize.task.OptimizerTask` reports
+    failed starts as results with ``exitflag=-1`` if
+    ``allow_failed_starts`` is set.
     """
 
     def __init__(
         self,
         n_procs: Union[int, None] = None,
         method: Union[str, None] = None,
+        persistent: bool = False,
+        chunksize: int = 1,
+        order_by_cost: bool = True,
+        task_timeout: Union[float, None] = None,
+        n_retries: int = 0,
+        max_tasks_per_worker: Union[int, None] = None,
+        resource_plan: Union[ResourcePlan, None] = None,
+        array_threshold: Union[int, None] = DEFAULT_ARRAY_THRESHOLD,
     ):
         super().__init__()
 
+        if n_procs is None and resource_plan is not None:
+            n_procs = resource_plan.n_workers
         if n_procs is None:
             n_procs = os.cpu_count()
             logger.info(
@@ -51,6 +138,131 @@ class MultiProcessEngine(Engine):
             )
         self.n_procs: int = n_procs
         self.method: str = method
+        self.persistent: bool = persistent
+        self.chunksize: int = chunksize
+        self.order_by_cost: bool = order_by_cost
+        self.task_timeout: Union[float, None] = task_timeout
+        self.n_retries: int = n_retries
+        self.max_tasks_per_worker: Union[int, None] = max_tasks_per_worker
+        self.resource_plan: Union[ResourcePlan, None] = resource_plan
+        self.array_threshold: Union[int, None] = array_threshold
+
+        self._pool = None
+        self._shared_objects: Union[SharedObjectDirectory, None] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self):
+        # worker pools cannot be transferred to other processes
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_shared_objects"] = None
+        return state
+
+    def close(self) -> None:
+        """Shut down persistent worker processes and clean up.
+
+        The engine can still be used afterwards, in which case new worker
+        processes are started.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._shared_objects is not None:
+            shutil.rmtree(self._shared_objects.directory, ignore_errors=True)
+            self._shared_objects = None
+
+    @property
+    def fault_tolerant(self) -> bool:
+        """Whether tasks are executed in fault-tolerant mode."""
+        return self.task_timeout is not None or self.n_retries > 0
+
+    def _create_pool(self, n_procs: int):
+        """Start a pool of worker processes."""
+        logger.debug(f"Starting pool of {n_procs} processes.")
+        ctx = multiprocessing.get_context(method=self.method)
+        initializer = None
+        if self.resource_plan is not None:
+            initializer = self.resource_plan.initialize_worker
+        if self.fault_tolerant:
+            return WorkerSupervisor(
+                ctx=ctx,
+                n_procs=n_procs,
+                task_timeout=self.task_timeout,
+                n_retries=self.n_retries,
+                max_tasks_per_worker=self.max_tasks_per_worker,
+                initializer=initializer,
+            )
+        return ctx.Pool(
+            processes=n_procs,
+            initializer=initializer,
+            maxtasksperchild=self.max_tasks_per_worker,
+        )
+
+    def _get_persistent_pool(self):
+        """Get the persistent worker pool, starting it if necessary."""
+        if self._pool is None:
+            self._pool = self._create_pool(self.n_procs)
+        if self._shared_objects is None:
+            self._shared_objects = SharedObjectDirectory(
+                tempfile.mkdtemp(prefix="pypesto_engine_")
+            )
+        return self._pool
+
+    def _terminate_pool(self) -> None:
+        """Terminate the persistent worker pool, cancelling pending tasks."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _get_work_items(
+        self, tasks: list[Task], arrays: Union[ArrayDirectory, None]
+    ) -> list[tuple]:
+        """Pickle tasks into work items for :func:`work_indexed`.
+
+        The work items are in order of submission. If `arrays` is given,
+        large arrays in tasks and results are transferred via files.
+        """
+        if self.order_by_cost:
+            order = order_by_cost(tasks)
+        else:
+            order = range(len(tasks))
+
+        if self.persistent:
+            self._get_persistent_pool()
+            keys = self._shared_objects.add(tasks)
+            work_items = [
+                (
+                    i_task,
+                    work_shared,
+                    (
+                        self._shared_objects,
+                        dumps_task(tasks[i_task], keys, arrays=arrays),
+                    ),
+                )
+                for i_task in order
+            ]
+        elif arrays is not None:
+            work_items = [
+                (i_task, work, arrays.dumps(tasks[i_task])) for i_task in order
+            ]
+        else:
+            work_items = [
+                (i_task, work, pickle.dumps(tasks[i_task])) for i_task in order
+            ]
+
+        if arrays is not None:
+            work_items = [
+                (i_task, work_arrays, (arrays, work_fun, work_item))
+                for i_task, work_fun, work_item in work_items
+            ]
+        return work_items
 
     def execute(
         self, tasks: list[Task], progress_bar: bool = None
@@ -68,22 +280,65 @@ class MultiProcessEngine(Engine):
         -------
         A list of results.
         """
+        results = [None] * len(tasks)
+        for i_task, result in self.execute_iter(
+            tasks, progress_bar=progress_bar
+        ):
+            results[i_task] = result
+        return results
+
+    def execute_iter(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Pickle tasks and yield results in order of completion.
+
+        See :meth:`pypesto.engine.Engine.execute_iter`.
+        """
         n_tasks = len(tasks)
 
-        pickled_tasks = [pickle.dumps(task) for task in tasks]
+        arrays = None
+        if self.array_threshold is not None:
+            arrays = ArrayDirectory(
+                tempfile.mkdtemp(prefix="pypesto_arrays_"),
+                threshold=self.array_threshold,
+            )
 
-        n_procs = min(self.n_procs, n_tasks)
-        logger.debug(f"Parallelizing on {n_procs} processes.")
+        pool = None
+        finished = False
+        try:
+            work_items = self._get_work_items(tasks, arrays)
 
-        ctx = multiprocessing.get_context(method=self.method)
+            if self.persistent:
+                pool = self._get_persistent_pool()
+            else:
+                n_procs = min(self.n_procs, n_tasks)
+                logger.debug(f"Parallelizing on {n_procs} processes.")
+                pool = self._create_pool(n_procs)
 
-        with ctx.Pool(processes=n_procs) as pool:
-            results = list(
-                tqdm(
-                    pool.imap(work, pickled_tasks),
-                    total=len(pickled_tasks),
-                    enable=progress_bar,
-                ),
-            )
+            if self.fault_tolerant:
+                results = pool.imap_unordered(work_items)
+            else:
+                results = pool.imap_unordered(
+                    work_indexed, work_items, chunksize=self.chunksize
+                )
 
-        return results
+            for i_task, result in tqdm(
+                results,
+                total=n_tasks,
+                enable=progress_bar,
+            ):
+                if isinstance(result, TaskFailedError):
+                    result = tasks[i_task].on_failure(result)
+                elif arrays is not None:
+                    result = pickle.loads(result)
+                yield i_task, result
+            finished = True
+        finally:
+            if pool is not None and not self.persistent:
+                pool.terminate()
+            elif pool is not None and not finished:
+                # the iterator was closed early or a task failed,
+                #  pending tasks cannot be cancelled otherwise
+                self._terminate_pool()
+            if arrays is not None:
+                shutil.rmtree(arrays.directory, ignore_errors=True)
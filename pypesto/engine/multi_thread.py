@@ -3,12 +3,14 @@
 import copy
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Union
 
 from ..util import tqdm
 from .base import Engine
-from .task import Task
+from .resources import ResourcePlan
+from .task import Task, order_by_cost
 
 logger = logging.getLogger(__name__)
 
@@ -27,20 +29,39 @@ class MultiThreadEngine(Engine):
     n_threads:
         The maximum number of threads to use in parallel.
         Defaults to the number of CPUs available on the system according to
-        `os.cpu_count()`.
+        `os.cpu_count()`, or to the number of workers of the
+        `resource_plan`, if given.
         The effectively used number of threads will be the minimum of
         `n_threads` and the number of tasks submitted.
+    order_by_cost:
+        Whether to submit tasks in order of decreasing
+        :attr:`pypesto.engine.Task.cost`, to reduce waiting for
+        long-running tasks at the end of a batch.
+    resource_plan:
+        Budget of cores per worker thread. Sets the number of threads of
+        the objectives of the executed tasks, see
+        :class:`pypesto.engine.ResourcePlan`. OpenMP/BLAS thread pools are
+        shared by all threads of a process and are not limited.
     """
 
-    def __init__(self, n_threads: Union[int, None] = None):
+    def __init__(
+        self,
+        n_threads: Union[int, None] = None,
+        order_by_cost: bool = True,
+        resource_plan: Union[ResourcePlan, None] = None,
+    ):
         super().__init__()
 
+        if n_threads is None and resource_plan is not None:
+            n_threads = resource_plan.n_workers
         if n_threads is None:
             n_threads = os.cpu_count()
             logger.info(
                 f"Engine will use up to {n_threads} threads (= CPU count)."
             )
         self.n_threads: int = n_threads
+        self.order_by_cost: bool = order_by_cost
+        self.resource_plan: Union[ResourcePlan, None] = resource_plan
 
     def execute(
         self, tasks: list[Task], progress_bar: bool = None
@@ -58,20 +79,46 @@ class MultiThreadEngine(Engine):
         -------
         A list of results.
         """
+        results = [None] * len(tasks)
+        for i_task, result in self.execute_iter(
+            tasks, progress_bar=progress_bar
+        ):
+            results[i_task] = result
+        return results
+
+    def execute_iter(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Deepcopy tasks and yield results in order of completion.
+
+        See :meth:`pypesto.engine.Engine.execute_iter`.
+        """
         n_tasks = len(tasks)
 
         copied_tasks = [copy.deepcopy(task) for task in tasks]
+        if self.resource_plan is not None:
+            for task in copied_tasks:
+                self.resource_plan.apply_to_task(task)
 
         n_threads = min(self.n_threads, n_tasks)
         logger.debug(f"Parallelizing on {n_threads} threads.")
 
-        with ThreadPoolExecutor(max_workers=n_threads) as pool:
-            results = list(
-                tqdm(
-                    pool.map(work, copied_tasks),
-                    total=len(copied_tasks),
-                    enable=progress_bar,
-                ),
-            )
-
-        return results
+        pool = ThreadPoolExecutor(max_workers=n_threads)
+        try:
+            if self.order_by_cost:
+                order = order_by_cost(copied_tasks)
+            else:
+                order = range(n_tasks)
+            futures = {
+                pool.submit(work, copied_tasks[i_task]): i_task
+                for i_task in order
+            }
+            for future in tqdm(
+                as_completed(futures),
+                total=n_tasks,
+                enable=progress_bar,
+            ):
+                yield futures[future], future.result()
+        finally:
+            # cancel pending tasks if the iterator was closed early
+            pool.shutdown(wait=True, cancel_futures=True)
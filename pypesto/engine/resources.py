@@ -0,0 +1,171 @@
+"""Resource budgets for nested parallelization."""
+
+import logging
+import os
+from typing import Any, Union
+
+from .task import Task
+
+logger = logging.getLogger(__name__)
+
+# environment variables controlling the size of implicit thread pools
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# the resource plan applied in the current worker process, if any
+_worker_resource_plan: Union["ResourcePlan", None] = None
+
+
+def get_available_cores() -> int:
+    """Get the number of CPU cores available to the current process."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+
+class ResourcePlan:
+    """Split a budget of CPU cores between levels of parallelization.
+
+    Parallelization over tasks (processes or threads of an engine),
+    within objectives (e.g. :attr:`pypesto.objective.AmiciObjective.n_threads`
+    for parallelization over conditions), and implicit OpenMP/BLAS thread
+    pools e.g. in numpy, all multiply. Without coordination, this easily
+    oversubscribes the available cores, which degrades performance.
+
+    A resource plan assigns `n_workers` engine workers with
+    `n_threads_per_worker` objective threads each, and limits
+    OpenMP/BLAS thread pools in each worker to `n_blas_threads`.
+    Pass it to :class:`pypesto.engine.MultiProcessEngine` or
+    :class:`pypesto.engine.MultiThreadEngine`, which then apply it to the
+    workers and the objectives of the executed tasks. For other parallel
+    components, e.g. :class:`pypesto.optimize.ESSOptimizer`, pass
+    ``n_threads=plan.n_workers``.
+
+    Parameters
+    ----------
+    n_cores:
+        Total number of cores to use. Defaults to the number of cores
+        available to the current process.
+    n_workers:
+        Number of engine workers. Defaults to
+        ``n_cores // n_threads_per_worker``.
+    n_threads_per_worker:
+        Number of threads per worker for objective-level parallelization.
+        Defaults to ``n_cores // n_workers`` if `n_workers` is given,
+        otherwise to 1.
+    n_blas_threads:
+        Number of OpenMP/BLAS threads per worker thread. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        n_cores: Union[int, None] = None,
+        n_workers: Union[int, None] = None,
+        n_threads_per_worker: Union[int, None] = None,
+        n_blas_threads: int = 1,
+    ):
+        if n_cores is None:
+            n_cores = get_available_cores()
+        if n_threads_per_worker is None:
+            if n_workers is None:
+                n_threads_per_worker = 1
+            else:
+                n_threads_per_worker = max(1, n_cores // n_workers)
+        if n_workers is None:
+            n_workers = max(1, n_cores // n_threads_per_worker)
+
+        if n_workers < 1 or n_threads_per_worker < 1 or n_blas_threads < 1:
+            raise ValueError(
+                "Numbers of workers and threads must be positive."
+            )
+
+        n_required = n_workers * n_threads_per_worker * n_blas_threads
+        if n_required > n_cores:
+            logger.warning(
+                f"Resource plan requires {n_required} cores, but only "
+                f"{n_cores} are assigned. This oversubscribes the CPUs."
+            )
+
+        self.n_cores: int = n_cores
+        self.n_workers: int = n_workers
+        self.n_threads_per_worker: int = n_threads_per_worker
+        self.n_blas_threads: int = n_blas_threads
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(n_cores={self.n_cores}, "
+            f"n_workers={self.n_workers}, "
+            f"n_threads_per_worker={self.n_threads_per_worker}, "
+            f"n_blas_threads={self.n_blas_threads})"
+        )
+
+    def get_environment(self) -> dict[str, str]:
+        """Get environment variables limiting implicit thread pools."""
+        return {var: str(self.n_blas_threads) for var in THREAD_ENV_VARS}
+
+    def initialize_worker(self) -> None:
+        """Apply the plan in a worker process.
+
+        Sets the environment variables from :meth:`get_environment`, which
+        takes effect for libraries loaded afterwards, e.g. in spawned
+        processes. Thread pools of already loaded libraries are limited
+        via `threadpoolctl <https://github.com/joblib/threadpoolctl>`_,
+        if installed.
+        """
+        global _worker_resource_plan
+        _worker_resource_plan = self
+
+        os.environ.update(self.get_environment())
+        try:
+            from threadpoolctl import threadpool_limits
+        except ImportError:
+            logger.debug(
+                "threadpoolctl is not installed, thread pools of already "
+                "loaded libraries are not limited."
+            )
+        else:
+            threadpool_limits(limits=self.n_blas_threads)
+
+    def apply_to_objective(self, objective: Any) -> None:
+        """Set the number of threads of an objective.
+
+        Applies to objectives with an `n_threads` attribute, like
+        :class:`pypesto.objective.AmiciObjective`, and to the components of
+        :class:`pypesto.objective.AggregatedObjective`.
+        """
+        from ..objective import AggregatedObjective, ObjectiveBase
+
+        if isinstance(objective, AggregatedObjective):
+            for sub_objective in objective._objectives:
+                self.apply_to_objective(sub_objective)
+        elif isinstance(objective, ObjectiveBase) and hasattr(
+            objective, "n_threads"
+        ):
+            objective.n_threads = self.n_threads_per_worker
+
+    def apply_to_task(self, task: Task) -> None:
+        """Set the number of threads of the objectives used by a task.
+
+        Considers the :attr:`pypesto.engine.Task.shared_attributes`, which
+        may be e.g. problems, objectives, or predictors.
+        """
+        for attribute in task.shared_attributes:
+            obj = getattr(task, attribute, None)
+            # problem or predictor
+            for objective_attribute in ("objective", "amici_objective"):
+                if hasattr(obj, objective_attribute):
+                    obj = getattr(obj, objective_attribute)
+                    break
+            self.apply_to_objective(obj)
+
+
+def apply_worker_resource_plan(task: Task) -> None:
+    """Apply the resource plan of the current worker process to a task."""
+    if _worker_resource_plan is not None:
+        _worker_resource_plan.apply_to_task(task)
@@ -0,0 +1,182 @@
+"""Transfer of objects shared between tasks.
+
+Tasks of one batch commonly reference the same large objects, e.g. the
+:class:`pypesto.problem.Problem` and its objective. Instead of serializing
+these objects once per task, they are serialized once, stored under a
+content key, and tasks only contain a reference to that key. Workers keep
+deserialized shared objects in a process-wide cache, such that each distinct
+object is deserialized at most once per worker.
+"""
+
+import hashlib
+import io
+import logging
+import os
+from collections import OrderedDict
+from pickle import Unpickler
+from typing import Any, Callable, Union
+
+import cloudpickle as pickle
+
+from .arrays import ArrayDirectory, ArrayPickler
+from .task import Task
+
+logger = logging.getLogger(__name__)
+
+# maximum number of shared objects kept per worker process
+MAX_CACHED_SHARED_OBJECTS = 8
+
+# process-wide cache of deserialized shared objects, key -> object
+_shared_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def get_shared_objects(tasks: list[Task]) -> list[Any]:
+    """Collect the distinct shared objects of a list of tasks.
+
+    Objects are distinguished by identity.
+    """
+    objects = {}
+    for task in tasks:
+        for attribute in task.shared_attributes:
+            obj = getattr(task, attribute, None)
+            if obj is not None:
+                objects[id(obj)] = obj
+    return list(objects.values())
+
+
+def dump_shared_object(obj: Any) -> tuple[str, bytes]:
+    """Serialize an object and compute its content key.
+
+    Returns
+    -------
+    The content key and the serialized object.
+    """
+    blob = pickle.dumps(obj)
+    key = hashlib.sha256(blob).hexdigest()
+    return key, blob
+
+
+class SharedObjectPickler(ArrayPickler):
+    """Pickler replacing shared objects by their content keys.
+
+    Parameters
+    ----------
+    file:
+        The file to write to.
+    keys:
+        Mapping of object identities to content keys.
+    arrays:
+        Directory to store large arrays in, see
+        :class:`pypesto.engine.arrays.ArrayPickler`.
+    """
+
+    def __init__(
+        self,
+        file,
+        keys: dict[int, str],
+        arrays: Union[ArrayDirectory, None] = None,
+    ):
+        super().__init__(file, arrays=arrays)
+        self.keys = keys
+
+    def persistent_id(self, obj: Any):
+        """Return the content key for shared objects, None otherwise."""
+        return self.keys.get(id(obj))
+
+
+class SharedObjectUnpickler(Unpickler):
+    """Unpickler resolving content keys of shared objects.
+
+    Parameters
+    ----------
+    file:
+        The file to read from.
+    load_blob:
+        Function returning the serialized shared object for a content key.
+        Only called if the object is not in the process-wide cache yet.
+    """
+
+    def __init__(self, file, load_blob: Callable[[str], bytes]):
+        super().__init__(file)
+        self.load_blob = load_blob
+
+    def persistent_load(self, key: str) -> Any:
+        """Return the shared object for a content key."""
+        return get_cached_shared_object(key, self.load_blob)
+
+
+def get_cached_shared_object(
+    key: str, load_blob: Callable[[str], bytes]
+) -> Any:
+    """Get a shared object from the process-wide cache.
+
+    If the object is not cached yet, it is deserialized from the blob
+    returned by `load_blob` and added to the cache, possibly evicting the
+    least recently used entry.
+    """
+    if key in _shared_cache:
+        _shared_cache.move_to_end(key)
+        return _shared_cache[key]
+    obj = pickle.loads(load_blob(key))
+    _shared_cache[key] = obj
+    if len(_shared_cache) > MAX_CACHED_SHARED_OBJECTS:
+        _shared_cache.popitem(last=False)
+    logger.debug(f"Cached shared object {key[:8]} in process {os.getpid()}.")
+    return obj
+
+
+def dumps_task(
+    task: Task,
+    keys: dict[int, str],
+    arrays: Union[ArrayDirectory, None] = None,
+) -> bytes:
+    """Serialize a task, replacing shared objects by their content keys."""
+    with io.BytesIO() as file:
+        SharedObjectPickler(file, keys, arrays=arrays).dump(task)
+        return file.getvalue()
+
+
+def loads_task(pickled_task: bytes, load_blob: Callable[[str], bytes]):
+    """Deserialize a task serialized via :func:`dumps_task`."""
+    with io.BytesIO(pickled_task) as file:
+        return SharedObjectUnpickler(file, load_blob).load()
+
+
+class SharedObjectDirectory:
+    """Directory-backed store of serialized shared objects.
+
+    Parameters
+    ----------
+    directory:
+        The directory to store the serialized objects in. Each object is
+        stored in a file named by its content key.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def add(self, tasks: list[Task]) -> dict[int, str]:
+        """Store the shared objects of a list of tasks.
+
+        Returns
+        -------
+        Mapping of object identities to content keys, to be passed to
+        :func:`dumps_task`.
+        """
+        keys = {}
+        for obj in get_shared_objects(tasks):
+            key, blob = dump_shared_object(obj)
+            path = os.path.join(self.directory, key)
+            if not os.path.exists(path):
+                # write atomically, workers may read concurrently
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(blob)
+                os.replace(tmp_path, path)
+            keys[id(obj)] = key
+        return keys
+
+    def __call__(self, key: str) -> bytes:
+        """Load the serialized shared object for a content key."""
+        with open(os.path.join(self.directory, key), "rb") as f:
+            return f.read()
@@ -1,5 +1,6 @@
 """Engines without parallelization."""
 
+from collections.abc import Iterator
 from typing import Any
 
 from ..util import tqdm
@@ -41,3 +42,18 @@ class SingleCoreEngine(Engine):
             results.append(task.execute())
 
         return results
+
+    def execute_iter(
+        self, tasks: list[Task], progress_bar: bool = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Execute tasks sequentially, yielding each result when finished.
+
+        See :meth:`pypesto.engine.Engine.execute_iter`.
+        """
+        for i_task, task in enumerate(
+            tqdm(
+                tasks,
+                enable=progress_bar,
+            )
+        ):
+            yield i_task, task.execute()
@@ -0,0 +1,275 @@
+"""Fault-tolerant supervision of worker processes."""
+
+import logging
+import time
+import traceback
+from collections import deque
+from collections.abc import Iterator
+from multiprocessing.connection import wait
+from typing import Any, Callable, Union
+
+logger = logging.getLogger(__name__)
+
+
+class TaskFailedError(RuntimeError):
+    """Exception raised if a task could not be executed successfully.
+
+    This comprises exceptions raised by the task, crashes of the worker
+    process executing it (e.g. due to a segmentation fault in a compiled
+    model), and exceeding the time limit.
+    """
+
+    def __init__(self, message: str, n_attempts: int):
+        super().__init__(message)
+        self.n_attempts: int = n_attempts
+
+
+def worker_loop(conn, initializer: Callable = None, initargs: tuple = ()):
+    """Receive and execute work items until receiving `None`.
+
+    Each work item is a tuple ``(i_task, work_fun, work_item)``. The worker
+    sends back tuples ``(i_task, success, result_or_traceback)``.
+    """
+    if initializer is not None:
+        initializer(*initargs)
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        i_task, work_fun, work_item = message
+        try:
+            result = work_fun(work_item)
+        except Exception:
+            conn.send((i_task, False, traceback.format_exc()))
+        else:
+            conn.send((i_task, True, result))
+    conn.close()
+
+
+class _Worker:
+    """A worker process with its connection and current assignment."""
+
+    def __init__(self, ctx, initializer: Callable, initargs: tuple):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=worker_loop,
+            args=(child_conn, initializer, initargs),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.n_tasks: int = 0
+        self.message: Union[tuple, None] = None
+        self.start_time: Union[float, None] = None
+
+    def assign(self, message: tuple) -> None:
+        self.conn.send(message)
+        self.message = message
+        self.start_time = time.monotonic()
+
+    def release(self) -> None:
+        self.message = None
+        self.start_time = None
+        self.n_tasks += 1
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerSupervisor:
+    """Execute work items on supervised worker processes.
+
+    In contrast to :class:`multiprocessing.pool.Pool`, a crashing or hanging
+    worker does not stall the whole batch: The affected work item is
+    retried on a fresh worker process, or, once the number of retries is
+    exhausted, reported as a :class:`TaskFailedError`.
+
+    Parameters
+    ----------
+    ctx:
+        The multiprocessing context used to start the worker processes.
+    n_procs:
+        The maximum number of worker processes.
+    task_timeout:
+        Maximum wall time in seconds per execution attempt of a work item,
+        or None for no limit. Workers exceeding it are terminated.
+    n_retries:
+        Number of times a failed work item is retried.
+    max_tasks_per_worker:
+        Number of work items after which a worker process is replaced by
+        a fresh one, e.g. to contain memory leaks in native extensions.
+        None for no limit.
+    initializer, initargs:
+        Called as ``initializer(*initargs)`` in each new worker process.
+    """
+
+    def __init__(
+        self,
+        ctx,
+        n_procs: int,
+        task_timeout: Union[float, None] = None,
+        n_retries: int = 0,
+        max_tasks_per_worker: Union[int, None] = None,
+        initializer: Callable = None,
+        initargs: tuple = (),
+    ):
+        self.ctx = ctx
+        self.n_procs: int = n_procs
+        self.task_timeout: Union[float, None] = task_timeout
+        self.n_retries: int = n_retries
+        self.max_tasks_per_worker: Union[int, None] = max_tasks_per_worker
+        self.initializer: Callable = initializer
+        self.initargs: tuple = initargs
+
+        self._workers: list[_Worker] = []
+
+    def _get_idle_worker(self) -> Union[_Worker, None]:
+        """Get an idle worker, starting or recycling processes as needed."""
+        for i_worker, worker in enumerate(self._workers):
+            if worker.message is not None:
+                continue
+            if (
+                self.max_tasks_per_worker is not None
+                and worker.n_tasks >= self.max_tasks_per_worker
+            ) or not worker.process.is_alive():
+                worker.stop()
+                worker = _Worker(self.ctx, self.initializer, self.initargs)
+                self._workers[i_worker] = worker
+            return worker
+        if len(self._workers) < self.n_procs:
+            worker = _Worker(self.ctx, self.initializer, self.initargs)
+            self._workers.append(worker)
+            return worker
+        return None
+
+    def _replace(self, worker: _Worker) -> None:
+        """Kill a worker and replace it by a fresh process."""
+        worker.kill()
+        self._workers[self._workers.index(worker)] = _Worker(
+            self.ctx, self.initializer, self.initargs
+        )
+
+    def imap_unordered(self, messages: list[tuple]) -> Iterator[Any]:
+        """Execute work items, yielding results in order of completion.
+
+        Parameters
+        ----------
+        messages:
+            Work items ``(i_task, work_fun, work_item)``.
+
+        Yields
+        ------
+        Tuples ``(i_task, work_fun(work_item))``, or
+        ``(i_task, TaskFailedError)`` for failed work items.
+        """
+        pending = deque(messages)
+        n_attempts = dict.fromkeys((message[0] for message in messages), 0)
+        n_remaining = len(messages)
+
+        while n_remaining:
+            # assign pending work items to idle workers
+            while pending:
+                worker = self._get_idle_worker()
+                if worker is None:
+                    break
+                worker.assign(pending.popleft())
+
+            busy = [w for w in self._workers if w.message is not None]
+
+            # wait for results, worker exits, or the next timeout
+            timeout = None
+            if self.task_timeout is not None:
+                now = time.monotonic()
+                timeout = max(
+                    0.0,
+                    min(w.start_time + self.task_timeout - now for w in busy),
+                )
+            wait(
+                [w.conn for w in busy] + [w.process.sentinel for w in busy],
+                timeout=timeout,
+            )
+
+            for worker in busy:
+                message = worker.message
+                i_task = message[0]
+                error = None
+                if worker.conn.poll():
+                    try:
+                        _, success, result = worker.conn.recv()
+                    except (EOFError, OSError):
+                        success = False
+                        result = "Worker process died unexpectedly."
+                        self._replace(worker)
+                    else:
+                        worker.release()
+                    if success:
+                        n_remaining -= 1
+                        yield i_task, result
+                        continue
+                    error = result
+                elif not worker.process.is_alive():
+                    error = (
+                        "Worker process died unexpectedly "
+                        f"(exit code {worker.process.exitcode})."
+                    )
+                    self._replace(worker)
+                elif (
+                    self.task_timeout is not None
+                    and time.monotonic() - worker.start_time
+                    > self.task_timeout
+                ):
+                    error = (
+                        f"Task exceeded the time limit of "
+                        f"{self.task_timeout} s."
+                    )
+                    self._replace(worker)
+                else:
+                    continue
+
+                # handle failure
+                n_attempts[i_task] += 1
+                logger.warning(
+                    f"Task {i_task} failed (attempt {n_attempts[i_task]}): "
+                    f"{error}"
+                )
+                if n_attempts[i_task] <= self.n_retries:
+                    pending.append(message)
+                else:
+                    n_remaining -= 1
+                    yield (
+                        i_task,
+                        TaskFailedError(
+                            f"Task {i_task} failed after "
+                            f"{n_attempts[i_task]} attempt(s): {error}",
+                            n_attempts=n_attempts[i_task],
+                        ),
+                    )
+
+    def close(self) -> None:
+        """Stop all worker processes once they are idle."""
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
+    def terminate(self) -> None:
+        """Stop all worker processes immediately."""
+        for worker in self._workers:
+            worker.kill()
+        self._workers = []
+
+    def join(self) -> None:
+        """Wait for worker processes to exit (no-op after close)."""
@@ -1,7 +1,9 @@
 """Abstract Task class."""
 
 import abc
-from typing import Any
+from typing import Any, Optional
+
+import numpy as np
 
 
 class Task(abc.ABC):
@@ -11,11 +13,77 @@ class Task(abc.ABC):
     A task is one of a list of independent execution tasks that are
     submitted to the execution engine to be executed using the :func:`execute`
     method, commonly in parallel.
+
+    Attributes
+    ----------
+    shared_attributes:
+        Names of attributes that hold (potentially large) objects which are
+        typically shared by all tasks of one batch, e.g. the problem.
+        Engines that support it transfer such objects only once per worker,
+        instead of once per task, see e.g.
+        :class:`pypesto.engine.MultiProcessEngine`.
+    cost:
+        Optional hint on the expected relative cost (e.g. run time) of the
+        task. Engines may use it to schedule expensive tasks first, which
+        reduces the time spent waiting for a few long-running tasks at the
+        end of a batch, see :func:`order_by_cost`.
     """
 
+    shared_attributes: tuple[str, ...] = ()
+    cost: Optional[float] = None
+
     def __init__(self):
         pass
 
     @abc.abstractmethod
     def execute(self) -> Any:
         """Execute the task and return its results."""
+
+    def on_failure(self, error: Exception) -> Any:
+        """Handle a failed execution of the task.
+
+        Called by fault-tolerant engines in the main process if the task
+        could not be executed, e.g. because the executing worker crashed or
+        exceeded its time limit. The returned value is used as the result
+        of the task. By default, the error is raised.
+
+        Parameters
+        ----------
+        error:
+            The error describing the failure.
+        """
+        raise error
+
+    def fingerprint(self) -> Optional[str]:
+        """Get a fingerprint of the task configuration.
+
+        Used to detect results of differently configured tasks with the
+        same id, e.g. by :class:`pypesto.engine.ResumableEngine`. By
+        default, None, i.e. tasks are identified by their id only.
+        """
+        return None
+
+
+def order_by_cost(tasks: list[Task]) -> list[int]:
+    """Order tasks by decreasing expected cost.
+
+    Tasks without (finite) cost hint are placed after all tasks with cost
+    hint. Ties keep their original order.
+
+    Parameters
+    ----------
+    tasks:
+        The tasks to order.
+
+    Returns
+    -------
+    The task indices, in order of execution.
+    """
+    costs = [
+        task.cost
+        if task.cost is not None and np.isfinite(task.cost)
+        else -np.inf
+        for task in tasks
+    ]
+    # stable sort by decreasing cost
+    return sorted(range(len(tasks)), key=lambda i_task: -costs[i_task])
@@ -21,6 +21,8 @@ class EnsembleTask(Task):
         The task ID.
     """
 
+    shared_attributes = ("method",)
+
     def __init__(
         self,
         method: Callable,
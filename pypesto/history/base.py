@@ -7,6 +7,7 @@ from collections.abc import Sequence
 from typing import Union
 
 import numpy as np
+import scipy.sparse
 
 from ..C import (
     FVAL,
@@ -69,6 +70,20 @@ class HistoryBase(ABC):
             `sensi_orders` and mode `mode`.
         """
 
+    def update_hessp(self, x: np.ndarray) -> None:
+        """
+        Update history after a Hessian vector product evaluation.
+
+        Hessian vector products are requested many times per iteration e.g.
+        by Newton-CG methods, thus they are only counted, not traced.
+        Default: Do nothing.
+
+        Parameters
+        ----------
+        x:
+            The parameter vector.
+        """
+
     def finalize(
         self,
         message: Union[str, None] = None,
@@ -104,6 +119,11 @@ class HistoryBase(ABC):
     def n_hess(self) -> int:
         """Return number of Hessian evaluations."""
 
+    @property
+    def n_hessp(self) -> int:
+        """Return number of Hessian vector product evaluations."""
+        return 0
+
     @property
     @abstractmethod
     def n_res(self) -> int:
@@ -303,6 +323,10 @@ class NoHistory(HistoryBase):
     def n_hess(self) -> int:  # noqa: D102
         raise NotImplementedError()
 
+    @property
+    def n_hessp(self) -> int:  # noqa: D102
+        raise NotImplementedError()
+
     @property
     def n_res(self) -> int:  # noqa: D102
         raise NotImplementedError()
@@ -370,6 +394,7 @@ class CountHistoryBase(HistoryBase):
         self._n_fval: int = 0
         self._n_grad: int = 0
         self._n_hess: int = 0
+        self._n_hessp: int = 0
         self._n_res: int = 0
         self._n_sres: int = 0
         self._start_time: float = time.time()
@@ -385,6 +410,9 @@ class CountHistoryBase(HistoryBase):
     ) -> None:
         self._update_counts(sensi_orders, mode)
 
+    def update_hessp(self, x: np.ndarray) -> None:  # noqa: D102
+        self._n_hessp += 1
+
     def _update_counts(
         self,
         sensi_orders: tuple[int, ...],
@@ -416,6 +444,10 @@ class CountHistoryBase(HistoryBase):
     def n_hess(self) -> int:  # noqa: D102
         return self._n_hess
 
+    @property
+    def n_hessp(self) -> int:  # noqa: D102
+        return self._n_hessp
+
     @property
     def n_res(self) -> int:  # noqa: D102
         return self._n_res
@@ -539,5 +571,8 @@ def reduce_result_via_options(
             f"trace_record_{key}", True
         ):
             result[key] = np.nan
+        elif scipy.sparse.issparse(result[key]):
+            # traces are stored as dense arrays
+            result[key] = result[key].toarray()
 
     return result
@@ -23,6 +23,7 @@ from ..C import (
     N_FVAL,
     N_GRAD,
     N_HESS,
+    N_HESSP,
     N_ITERATIONS,
     N_RES,
     N_SRES,
@@ -117,6 +118,8 @@ class Hdf5History(HistoryBase):
 
         # filled during file access
         self._f: Union[h5py.File, None] = None
+        # Hessian-vector products not yet counted in the file
+        self._n_hessp_pending: int = 0
 
         # to check whether the trace can be edited
         self.editable: bool = self._editable()
@@ -136,11 +139,32 @@ class Hdf5History(HistoryBase):
         self._update_counts(sensi_orders, mode)
         self._update_trace(x, sensi_orders, mode, result)
 
+    @check_editable
+    def update_hessp(self, x: np.ndarray) -> None:
+        """See :meth:`HistoryBase.update_hessp`.
+
+        Products are counted in memory, and written to the file on the next
+        call of :meth:`update` or :meth:`finalize`, as optimizers may
+        request many products per iteration.
+        """
+        self._n_hessp_pending += 1
+
+    def _flush_hessp(self) -> None:
+        """Write the pending Hessian-vector product count to the open file."""
+        if not self._n_hessp_pending:
+            return
+        group = self._require_group()
+        group.attrs[N_HESSP] = (
+            group.attrs.get(N_HESSP, 0) + self._n_hessp_pending
+        )
+        self._n_hessp_pending = 0
+
     @with_h5_file("a")
     @check_editable
     def finalize(self, message: str = None, exitflag: str = None) -> None:
         """See :class:`HistoryBase.finalize`."""
         super().finalize()
+        self._flush_hessp()
 
         # add message and exitflag to trace
         grp = self._f.require_group(f"{HISTORY}/{self.id}/{MESSAGES}/")
@@ -197,6 +221,7 @@ class Hdf5History(HistoryBase):
     @with_h5_file("a")
     def _update_counts(self, sensi_orders: tuple[int, ...], mode: ModeType):
         """Update the counters in the hdf5 file."""
+        self._flush_hessp()
         group = self._require_group()
 
         if mode == MODE_FUN:
@@ -247,6 +272,15 @@ class Hdf5History(HistoryBase):
         except KeyError:
             return 0
 
+    @property
+    @with_h5_file("r")
+    def n_hessp(self) -> int:
+        """See :meth:`HistoryBase.n_hessp`."""
+        try:
+            return self._get_group().attrs[N_HESSP] + self._n_hessp_pending
+        except KeyError:
+            return self._n_hessp_pending
+
     @property
     @with_h5_file("r")
     def n_res(self) -> int:
@@ -361,6 +395,7 @@ class Hdf5History(HistoryBase):
         grp.attrs[N_FVAL] = 0
         grp.attrs[N_GRAD] = 0
         grp.attrs[N_HESS] = 0
+        grp.attrs[N_HESSP] = 0
         grp.attrs[N_RES] = 0
         grp.attrs[N_SRES] = 0
         grp.attrs[START_TIME] = time.time()
@@ -517,6 +552,7 @@ class Hdf5History(HistoryBase):
             trace_group.attrs[N_FVAL] = other.n_fval
             trace_group.attrs[N_GRAD] = other.n_grad
             trace_group.attrs[N_HESS] = other.n_hess
+            trace_group.attrs[N_HESSP] = other.n_hessp
             trace_group.attrs[N_RES] = other.n_res
             trace_group.attrs[N_SRES] = other.n_sres
             trace_group.attrs[START_TIME] = other.start_time
@@ -105,6 +105,16 @@ class OptimizerHistory:
         self._update_vals(x, result)
         self.history.update(x, sensi_orders, mode, result)
 
+    def update_hessp(self, x: np.ndarray) -> None:
+        """Update history after a Hessian vector product evaluation.
+
+        Parameters
+        ----------
+        x:
+            Current parameter vector.
+        """
+        self.history.update_hessp(x)
+
     def finalize(
         self,
         message: Union[str, None] = None,
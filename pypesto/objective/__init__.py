@@ -6,6 +6,8 @@ Objective
 from .aggregated import AggregatedObjective
 from .amici import AmiciObjective
 from .base import ObjectiveBase
+from .caching import CachedObjective
+from .call_plan import CallPlan
 from .finite_difference import FD, FDDelta
 from .function import Objective
 from .priors import (
@@ -13,3 +15,5 @@ from .priors import (
     NegLogPriors,
     get_parameter_prior_dict,
 )
+from .surrogate import GaussianProcessSurrogate, SurrogateObjective
+from .task import ObjectiveCallTask
@@ -1,20 +1,38 @@
 from collections.abc import Sequence
 from copy import deepcopy
-from typing import Any
+from typing import Any, Union
 
 import numpy as np
+import scipy.sparse
 
 from ..C import FVAL, GRAD, HESS, HESSP, RDATAS, RES, SRES, ModeType
 from .base import ObjectiveBase, ResultDict
+from .pool import ObjectivePool, call_objective
+from .pre_post_process import FixedParametersProcessor
 
 
 class AggregatedObjective(ObjectiveBase):
-    """Aggregates multiple objectives into one objective."""
+    """Aggregates multiple objectives into one objective.
+
+    The objectives can be evaluated concurrently, in a thread or process
+    pool, see the `executor` parameter. Objectives whose requested values are
+    independent of the free parameters, see
+    :meth:`pypesto.objective.ObjectiveBase.is_constant`, are evaluated only
+    once.
+
+    Attributes
+    ----------
+    component_times:
+        The total wall time in seconds spent in the evaluation of each
+        objective.
+    """
 
     def __init__(
         self,
         objectives: Sequence[ObjectiveBase],
         x_names: Sequence[str] = None,
+        executor: Union[str, None] = None,
+        n_workers: Union[int, None] = None,
     ):
         """
         Initialize objective.
@@ -27,6 +45,19 @@ class AggregatedObjective(ObjectiveBase):
             Sequence of names of the (optimized) parameters.
             (Details see documentation of x_names in
             :class:`pypesto.ObjectiveBase`)
+        executor:
+            How to evaluate the objectives. If None (default), sequentially.
+            If "thread", concurrently in a thread pool, which is beneficial
+            if the objectives release the GIL, as e.g. AMICI simulations do.
+            If "process", concurrently in a process pool. Then, each worker
+            process holds copies of all objectives, taken when the pool is
+            started on the first evaluation, such that objective state is not
+            shared with the main process. The rdatas of objectives evaluated
+            in worker processes are not returned, as e.g. AMICI simulation
+            results cannot be pickled.
+        n_workers:
+            Maximum number of threads or processes. Defaults to the number
+            of objectives.
         """
         # input typechecks
         if not isinstance(objectives, Sequence):
@@ -46,20 +77,41 @@ class AggregatedObjective(ObjectiveBase):
             raise ValueError("Length of objectives must be at least one")
 
         self._objectives = objectives
+        self.executor: Union[str, None] = executor
+        self.n_workers: Union[int, None] = n_workers
+        self.component_times: np.ndarray = np.zeros(len(objectives))
+
+        self._pool: Union[ObjectivePool, None] = None
+        if executor is not None:
+            self._pool = ObjectivePool(
+                executor=executor,
+                n_workers=n_workers or len(objectives),
+            )
+        # (sensi_orders, mode) -> whether each objective is constant
+        self._constant: dict[tuple, list[bool]] = {}
+        # (i_objective, sensi_orders, mode) -> result of constant objectives
+        self._constant_results: dict[tuple, ResultDict] = {}
 
         super().__init__(x_names=x_names)
 
     def __deepcopy__(self, memodict=None):
         """Create copy of objective."""
-        other = AggregatedObjective(
+        other = type(self)(
             objectives=[deepcopy(objective) for objective in self._objectives],
             x_names=deepcopy(self.x_names),
+            executor=self.executor,
+            n_workers=self.n_workers,
         )
         for key in set(self.__dict__.keys()) - {"_objectives", "x_names"}:
             other.__dict__[key] = deepcopy(self.__dict__[key])
 
         return other
 
+    def shutdown(self) -> None:
+        """Shut down the thread or process pool, if started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+
     def check_mode(self, mode: ModeType) -> bool:
         """See `ObjectiveBase` documentation."""
         return all(
@@ -77,6 +129,25 @@ class AggregatedObjective(ObjectiveBase):
             for objective in self._objectives
         )
 
+    @property
+    def has_hessp(self) -> bool:
+        """Check whether Hessian-vector product is defined."""
+        return all(objective.has_hessp for objective in self._objectives)
+
+    def call_unprocessed_hessp(
+        self,
+        x: np.ndarray,
+        v: np.ndarray,
+        **kwargs,
+    ) -> ResultDict:
+        """See `ObjectiveBase` documentation."""
+        return {
+            HESSP: sum(
+                objective.call_unprocessed_hessp(x, v, **kwargs)[HESSP]
+                for objective in self._objectives
+            )
+        }
+
     def call_unprocessed(
         self,
         x: np.ndarray,
@@ -97,6 +168,72 @@ class AggregatedObjective(ObjectiveBase):
             Objective-specific keyword arguments, where the dictionaries are
             ordered by the objectives.
         """
+        return aggregate_results(
+            self._call_objectives(
+                "call_unprocessed",
+                {"x": x},
+                sensi_orders=sensi_orders,
+                mode=mode,
+                kwargs_list=kwargs_list,
+                **kwargs,
+            )
+        )
+
+    def call_unprocessed_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        kwargs_list: Sequence[dict[str, Any]] = None,
+        **kwargs,
+    ) -> list[ResultDict]:
+        """
+        See `ObjectiveBase` for more documentation.
+
+        Evaluates each objective for all parameter vectors at once, such that
+        batched evaluation of the individual objectives is exploited.
+
+        Parameters
+        ----------
+        kwargs_list:
+            Objective-specific keyword arguments, where the dictionaries are
+            ordered by the objectives.
+        """
+        objective_results = self._call_objectives(
+            "call_unprocessed_batch",
+            {"X": X},
+            sensi_orders=sensi_orders,
+            mode=mode,
+            kwargs_list=kwargs_list,
+            **kwargs,
+        )
+        objective_results = [
+            [result] * len(X) if isinstance(result, dict) else result
+            for result in objective_results
+        ]
+        return [aggregate_results(rvals) for rvals in zip(*objective_results)]
+
+    def _call_objectives(
+        self,
+        method: str,
+        x_kwargs: dict[str, np.ndarray],
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        kwargs_list: Sequence[dict[str, Any]] = None,
+        **kwargs,
+    ) -> list:
+        """Call a method of all objectives, possibly concurrently.
+
+        Constant objectives are evaluated once via `call_unprocessed`, and
+        their result is returned instead.
+
+        Parameters
+        ----------
+        method:
+            The name of the method to call.
+        x_kwargs:
+            The parameter vector(s) argument of the method.
+        """
         if kwargs_list is None:
             kwargs_list = [{}] * len(self._objectives)
         elif len(kwargs_list) != len(self._objectives):
@@ -104,19 +241,86 @@ class AggregatedObjective(ObjectiveBase):
                 "The length of `kwargs_list` must match the number of "
                 "objectives you are aggregating."
             )
-        return aggregate_results(
-            [
-                objective.call_unprocessed(
-                    x,
-                    sensi_orders,
-                    mode,
-                    **kwargs,
-                    **cur_kwargs,
-                )
-                for objective, cur_kwargs in zip(self._objectives, kwargs_list)
+
+        constant = self._get_constant(sensi_orders, mode)
+        results = [None] * len(self._objectives)
+        calls = []
+        for i_obj, cur_kwargs in enumerate(kwargs_list):
+            call_kwargs = {
+                **x_kwargs,
+                "sensi_orders": sensi_orders,
+                "mode": mode,
+                **kwargs,
+                **cur_kwargs,
+            }
+            if not constant[i_obj] or kwargs or cur_kwargs:
+                calls.append((i_obj, method, call_kwargs))
+                continue
+            cache_key = (i_obj, sensi_orders, mode)
+            if cache_key not in self._constant_results:
+                # evaluate once, at any parameter vector
+                if "x" in x_kwargs:
+                    x = x_kwargs["x"]
+                else:
+                    x = x_kwargs["X"][0]
+                self._constant_results[cache_key] = self._objectives[
+                    i_obj
+                ].call_unprocessed(x=x, sensi_orders=sensi_orders, mode=mode)
+            # copy arrays, such that the stored result cannot be modified
+            results[i_obj] = {
+                key: value.copy() if isinstance(value, np.ndarray) else value
+                for key, value in self._constant_results[cache_key].items()
+            }
+
+        if self._pool is None or len(calls) < 2:
+            evaluated = [
+                call_objective(self._objectives[i_obj], method, call_kwargs)
+                for i_obj, method, call_kwargs in calls
+            ]
+        else:
+            evaluated = self._pool.map(self._objectives, calls)
+
+        for (i_obj, _, _), (result, elapsed) in zip(calls, evaluated):
+            results[i_obj] = result
+            self.component_times[i_obj] += elapsed
+        return results
+
+    def _get_constant(
+        self, sensi_orders: tuple[int, ...], mode: ModeType
+    ) -> list[bool]:
+        """Get for each objective whether it is constant."""
+        key = (sensi_orders, mode)
+        if key not in self._constant:
+            x_free_indices = None
+            if isinstance(self.pre_post_processor, FixedParametersProcessor):
+                x_free_indices = self.pre_post_processor.x_free_indices
+            self._constant[key] = [
+                objective.is_constant(sensi_orders, mode, x_free_indices)
+                for objective in self._objectives
             ]
+        return self._constant[key]
+
+    def is_constant(
+        self,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        x_free_indices: Sequence[int] = None,
+    ) -> bool:
+        """See `ObjectiveBase` documentation."""
+        return all(
+            objective.is_constant(sensi_orders, mode, x_free_indices)
+            for objective in self._objectives
         )
 
+    def update_from_problem(self, *args, **kwargs):
+        """See `ObjectiveBase` documentation.
+
+        Also resets results of constant objectives.
+        """
+        super().update_from_problem(*args, **kwargs)
+        self._constant = {}
+        self._constant_results = {}
+
     def initialize(self):
         """See `ObjectiveBase` documentation."""
         for objective in self._objectives:
@@ -145,6 +349,9 @@ def aggregate_results(rvals: Sequence[ResultDict]) -> ResultDict:
         for key in [FVAL, GRAD, HESS, HESSP]
         if all(key in rval for rval in rvals)
     }
+    # sparse and dense Hessians sum up to a np.matrix
+    if isinstance(result.get(HESS), np.matrix):
+        result[HESS] = np.asarray(result[HESS])
 
     # extract rdatas and flatten
     result[RDATAS] = []
@@ -152,23 +359,18 @@ def aggregate_results(rvals: Sequence[ResultDict]) -> ResultDict:
         if RDATAS in rval:
             result[RDATAS].extend(rval[RDATAS])
 
-    # initialize res and sres
+    # stack residuals and residual sensitivities at once
+    res = None
     if RES in rvals[0]:
-        res = np.asarray(rvals[0][RES])
-    else:
-        res = None
+        res = np.hstack([np.asarray(rval[RES]) for rval in rvals])
 
+    sres = None
     if SRES in rvals[0]:
-        sres = np.asarray(rvals[0][SRES])
-    else:
-        sres = None
-
-    # skip iobj=0 after initialization, stack matrices
-    for rval in rvals[1:]:
-        if res is not None:
-            res = np.hstack([res, np.asarray(rval[RES])])
-        if sres is not None:
-            sres = np.vstack([sres, np.asarray(rval[SRES])])
+        sres_list = [rval[SRES] for rval in rvals]
+        if any(scipy.sparse.issparse(value) for value in sres_list):
+            sres = scipy.sparse.vstack(sres_list, format="csr")
+        else:
+            sres = np.vstack([np.asarray(value) for value in sres_list])
 
     # fill res, sres into result
     if res is not None:
@@ -5,3 +5,5 @@ AMICI objective
 
 from .amici import AmiciObjectBuilder, AmiciObjective
 from .amici_calculator import AmiciCalculator
+from .condition_cache import ConditionCache
+from .steadystate_store import SteadyStateStore
@@ -11,9 +11,11 @@ import numpy as np
 
 from ...C import (
     FVAL,
+    HESSP,
     MODE_FUN,
     MODE_RES,
     RDATAS,
+    SRES,
     SUFFIXES_CSV,
     SUFFIXES_HDF5,
     ModeType,
@@ -28,10 +30,9 @@ from ...history import (
 )
 from ..base import ObjectiveBase, ResultDict
 from .amici_calculator import AmiciCalculator
-from .amici_util import (
-    create_identity_parameter_mapping,
-    map_par_opt_to_par_sim,
-)
+from .amici_util import create_identity_parameter_mapping
+from .condition_cache import ConditionCache
+from .steadystate_store import SteadyStateStore
 
 if TYPE_CHECKING:
     try:
@@ -83,6 +84,8 @@ class AmiciObjective(ObjectiveBase):
         amici_object_builder: Optional[AmiciObjectBuilder] = None,
         calculator: Optional[AmiciCalculator] = None,
         amici_reporting: Optional["amici.RDataReporting"] = None,
+        condition_cache: Union[bool, ConditionCache] = False,
+        steadystate_store: Union[bool, SteadyStateStore] = False,
     ):
         """
         Initialize objective.
@@ -135,6 +138,18 @@ class AmiciObjective(ObjectiveBase):
             Determines which quantities will be computed by AMICI,
             see ``amici.Solver.setReturnDataReportingMode``. Set to ``None``
             to compute only the minimum required information.
+        condition_cache:
+            Whether to cache the simulation results per condition, such
+            that only conditions whose simulation parameters changed are
+            simulated again. Pass a :class:`ConditionCache` to configure the
+            cache size. Only supported with the default calculator.
+        steadystate_store:
+            Whether to start preequilibrations from the stored steady state
+            nearest in simulation parameters, instead of the single guess of
+            `guess_steadystate`, which is then disabled. Pass a
+            :class:`SteadyStateStore` to configure it, or to share it
+            between objectives. As AMICI reports steady states only with
+            full reporting, this is used unless `amici_reporting` is set.
         """
         import amici
 
@@ -203,6 +218,29 @@ class AmiciObjective(ObjectiveBase):
         if self.guess_steadystate is not False:
             self.guess_steadystate = True
 
+        if steadystate_store is True:
+            steadystate_store = SteadyStateStore()
+        elif steadystate_store is False:
+            steadystate_store = None
+        if steadystate_store is not None:
+            if self.amici_model.nx_solver_reinit > 0:
+                raise ValueError(
+                    "Steadystate prediction is not supported "
+                    "for models with conservation laws!"
+                )
+            if (
+                self.amici_model.getSteadyStateSensitivityMode()
+                == amici.SteadyStateSensitivityMode.integrationOnly
+            ):
+                raise ValueError(
+                    "Steadystate guesses cannot be enabled "
+                    "when `integrationOnly` as "
+                    "SteadyStateSensitivityMode!"
+                )
+            # the store supersedes the single guesses
+            self.guess_steadystate = False
+        self.steadystate_store: Optional[SteadyStateStore] = steadystate_store
+
         if self.guess_steadystate:
             # preallocate guesses, construct a dict for every edata for which
             #  we need to do preequilibration
@@ -227,12 +265,30 @@ class AmiciObjective(ObjectiveBase):
         if calculator is None:
             calculator = AmiciCalculator()
         self.calculator = calculator
+
+        if condition_cache is True:
+            condition_cache = ConditionCache()
+        elif condition_cache is False:
+            condition_cache = None
+        if (
+            condition_cache is not None
+            and type(self.calculator) is not AmiciCalculator
+        ):
+            raise ValueError(
+                "Condition caching is only supported with the default "
+                "AmiciCalculator."
+            )
+        self.condition_cache: Optional[ConditionCache] = condition_cache
         super().__init__(x_names=x_names)
 
         # Custom (condition-specific) timepoints. See the
         # `set_custom_timepoints` method for more information.
         self.custom_timepoints = None
 
+        # residual sensitivities at the last point of a Hessian-vector
+        #  product, as (key, sres), see `_get_hessp_key`
+        self._hessp_sres: Optional[tuple[tuple, np.ndarray]] = None
+
     def get_config(self) -> dict:
         """Return basic information of the objective configuration."""
         info = super().get_config()
@@ -274,6 +330,7 @@ class AmiciObjective(ObjectiveBase):
         """See `ObjectiveBase` documentation."""
         super().initialize()
         self.reset_steadystate_guesses()
+        self._hessp_sres = None
         self.calculator.initialize()
 
     def __deepcopy__(self, memodict: dict = None) -> "AmiciObjective":
@@ -285,8 +342,10 @@ class AmiciObjective(ObjectiveBase):
             "amici_model",
             "amici_solver",
             "edatas",
+            "_hessp_sres",
         }:
             other.__dict__[key] = copy.deepcopy(self.__dict__[key])
+        other._hessp_sres = None
 
         # copy objects that do not have __deepcopy__
         other.amici_model = self.amici_model.clone()
@@ -309,8 +368,10 @@ class AmiciObjective(ObjectiveBase):
             "amici_model",
             "amici_solver",
             "edatas",
+            "_hessp_sres",
         }:
             state[key] = self.__dict__[key]
+        state["_hessp_sres"] = None
 
         _fd, _file = tempfile.mkstemp()
         try:
@@ -415,6 +476,95 @@ class AmiciObjective(ObjectiveBase):
         """See `ObjectiveBase` documentation."""
         return mode in [MODE_FUN, MODE_RES]
 
+    @property
+    def has_hessp(self) -> bool:
+        """Check whether Hessian-vector product is defined.
+
+        Available as FIM-vector product if the FIM is used as Hessian.
+        """
+        return self.fim_for_hess and self.check_sensi_orders((1,), MODE_RES)
+
+    def call_unprocessed_hessp(
+        self,
+        x: np.ndarray,
+        v: np.ndarray,
+        **kwargs,
+    ) -> ResultDict:
+        """
+        See `ObjectiveBase` documentation.
+
+        Computes the product of the FIM with `v` as `sres.T @ (sres @ v)`
+        from the residual sensitivities, without forming the FIM. The
+        residual sensitivities are reused for further products at the same
+        `x` and simulation setup, as requested e.g. by Newton-CG in each
+        iteration.
+        """
+        if kwargs:
+            sres = self.call_unprocessed(
+                x, sensi_orders=(1,), mode=MODE_RES, **kwargs
+            )[SRES]
+            return {HESSP: sres.T @ (sres @ v)}
+
+        key = self._get_hessp_key(x)
+        if self._hessp_sres is None or self._hessp_sres[0] != key:
+            # release the previous sensitivities before simulating
+            self._hessp_sres = None
+            sres = self.call_unprocessed(x, sensi_orders=(1,), mode=MODE_RES)[
+                SRES
+            ]
+            self._hessp_sres = (key, sres)
+        sres = self._hessp_sres[1]
+        return {HESSP: sres.T @ (sres @ v)}
+
+    def _get_hessp_key(self, x: np.ndarray) -> tuple:
+        """Get the key of the residual sensitivities reused for products.
+
+        Consists of the parameters, and of everything else the residual
+        sensitivities depend on: the experimental data, the parameter
+        mapping, the model and solver, and the solver settings.
+        """
+        solver = self.amici_solver
+        return (
+            np.ascontiguousarray(x, dtype=float).tobytes(),
+            self.fim_for_hess,
+            id(self.parameter_mapping),
+            id(self.amici_model),
+            id(solver),
+            (
+                int(solver.getSensitivityMethod()),
+                int(solver.getLinearMultistepMethod()),
+                solver.getRelativeTolerance(),
+                solver.getAbsoluteTolerance(),
+                solver.getRelativeToleranceFSA(),
+                solver.getAbsoluteToleranceFSA(),
+                solver.getMaxSteps(),
+            ),
+            tuple(
+                (
+                    id(edata),
+                    np.concatenate(
+                        [
+                            np.asarray(edata.getTimepoints(), dtype=float),
+                            np.asarray(edata.getObservedData(), dtype=float),
+                            np.asarray(
+                                edata.getObservedDataStdDev(), dtype=float
+                            ),
+                            np.asarray(edata.fixedParameters, dtype=float),
+                            np.asarray(
+                                edata.fixedParametersPreequilibration,
+                                dtype=float,
+                            ),
+                            np.asarray(
+                                edata.fixedParametersPresimulation,
+                                dtype=float,
+                            ),
+                        ]
+                    ).tobytes(),
+                )
+                for edata in self.edatas
+            ),
+        )
+
     def __call__(
         self,
         x: np.ndarray,
@@ -454,34 +604,22 @@ class AmiciObjective(ObjectiveBase):
         result:
             A dict containing the results.
         """
-        import amici
-
         x_dct = self.par_arr_to_dct(x)
 
-        # only ask amici to compute required quantities
-        amici_reporting = (
-            self.amici_reporting
-            if amici_reporting is None
-            else amici_reporting
-        )
-        if amici_reporting is None:
-            amici_reporting = (
-                amici.RDataReporting.likelihood
-                if mode == MODE_FUN
-                else amici.RDataReporting.residuals
-            )
-        self.amici_solver.setReturnDataReportingMode(amici_reporting)
+        self._set_reporting_mode(mode=mode, amici_reporting=amici_reporting)
 
         # update steady state
-        if (
-            self.guess_steadystate
-            and self.steadystate_guesses["fval"] < np.inf
-        ):
-            for data_ix in range(len(self.edatas)):
-                self.apply_steadystate_guess(data_ix, x_dct)
+        warm_started = self._apply_steadystate_guesses(x_dct)
 
+        kwargs = {}
+        condition_cache = None
         if edatas is None:
             edatas = self.edatas
+            # results are only cached for the objective's own data
+            condition_cache = self.condition_cache
+        if condition_cache is not None:
+            condition_cache.clear_served()
+            kwargs["condition_cache"] = condition_cache
         if parameter_mapping is None:
             parameter_mapping = self.parameter_mapping
         ret = self.calculator(
@@ -495,11 +633,166 @@ class AmiciObjective(ObjectiveBase):
             x_ids=self.x_ids,
             parameter_mapping=parameter_mapping,
             fim_for_hess=self.fim_for_hess,
+            **kwargs,
+        )
+
+        self._update_steadystate_guesses(
+            x_dct, ret, warm_started, condition_cache
+        )
+
+        return ret
+
+    def call_unprocessed_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        edatas: Sequence["amici.ExpData"] = None,
+        parameter_mapping: "ParameterMapping" = None,
+        amici_reporting: Optional["amici.RDataReporting"] = None,
+    ) -> list[ResultDict]:
+        """
+        Call objective function for multiple parameter vectors.
+
+        The simulations for all parameter vectors and conditions are
+        performed in a single call to :func:`amici.runAmiciSimulations`,
+        which parallelizes them over up to `n_threads` threads.
+        Custom calculators, e.g. for hierarchical optimization, evaluate
+        the parameter vectors one by one.
+
+        Returns
+        -------
+        results:
+            For each parameter vector, a dict containing the results.
+        """
+        import amici
+
+        if type(self.calculator) is not AmiciCalculator:
+            return super().call_unprocessed_batch(
+                X=X,
+                sensi_orders=sensi_orders,
+                mode=mode,
+                edatas=edatas,
+                parameter_mapping=parameter_mapping,
+                amici_reporting=amici_reporting,
+            )
+
+        x_dcts = [self.par_arr_to_dct(x) for x in X]
+
+        self._set_reporting_mode(mode=mode, amici_reporting=amici_reporting)
+
+        if parameter_mapping is None:
+            parameter_mapping = self.parameter_mapping
+
+        # one copy of the experimental data per parameter vector
+        edatas_batch = []
+        warm_started_batch = []
+        for x_dct in x_dcts:
+            warm_started_batch.append(self._apply_steadystate_guesses(x_dct))
+            edatas_batch.append(
+                [
+                    amici.ExpData(edata)
+                    for edata in (self.edatas if edatas is None else edatas)
+                ]
+            )
+
+        # results are only cached for the objective's own data
+        condition_cache = self.condition_cache if edatas is None else None
+        if condition_cache is not None:
+            condition_cache.clear_served()
+        rets = self.calculator.call_batch(
+            x_dcts=x_dcts,
+            sensi_orders=sensi_orders,
+            mode=mode,
+            amici_model=self.amici_model,
+            amici_solver=self.amici_solver,
+            edatas_batch=edatas_batch,
+            n_threads=self.n_threads,
+            x_ids=self.x_ids,
+            parameter_mapping=parameter_mapping,
+            fim_for_hess=self.fim_for_hess,
+            condition_cache=condition_cache,
+        )
+
+        for x_dct, ret, warm_started in zip(x_dcts, rets, warm_started_batch):
+            self._update_steadystate_guesses(
+                x_dct, ret, warm_started, condition_cache
+            )
+
+        return rets
+
+    def _set_reporting_mode(
+        self,
+        mode: ModeType,
+        amici_reporting: Optional["amici.RDataReporting"],
+    ) -> None:
+        """Only ask amici to compute required quantities."""
+        import amici
+
+        amici_reporting = (
+            self.amici_reporting
+            if amici_reporting is None
+            else amici_reporting
         )
+        if amici_reporting is None:
+            if self.steadystate_store is not None:
+                # required for the steady states
+                amici_reporting = amici.RDataReporting.full
+            elif mode == MODE_FUN:
+                amici_reporting = amici.RDataReporting.likelihood
+            else:
+                amici_reporting = amici.RDataReporting.residuals
+        self.amici_solver.setReturnDataReportingMode(amici_reporting)
 
+    def _apply_steadystate_guesses(self, x_dct: dict) -> dict[int, bool]:
+        """Apply steady state guesses to all `edatas`, if enabled.
+
+        Returns, for the conditions with preequilibration if the steady state
+        store is used, whether a stored steady state was applied.
+        """
+        if self.steadystate_store is not None:
+            return {
+                data_ix: self.apply_steadystate_store(data_ix, x_dct)
+                for data_ix in self._preeq_condition_ixs()
+            }
+        if (
+            self.guess_steadystate
+            and self.steadystate_guesses["fval"] < np.inf
+        ):
+            for data_ix in range(len(self.edatas)):
+                self.apply_steadystate_guess(data_ix, x_dct)
+        return {}
+
+    def _update_steadystate_guesses(
+        self,
+        x_dct: dict,
+        ret: dict,
+        warm_started: dict[int, bool],
+        condition_cache: Optional[ConditionCache] = None,
+    ) -> None:
+        """Store steady states as guesses, if the result is the best yet.
+
+        With the steady state store, the steady states of all simulated
+        conditions are recorded, i.e. not of those served from
+        `condition_cache`.
+        """
         nllh = ret[FVAL]
         rdatas = ret[RDATAS]
 
+        if self.steadystate_store is not None:
+            for data_ix, warm in warm_started.items():
+                if condition_cache is not None and condition_cache.is_served(
+                    rdatas[data_ix]
+                ):
+                    continue
+                self.steadystate_store.record(
+                    data_ix,
+                    self._par_sim(data_ix, x_dct),
+                    rdatas[data_ix],
+                    warm,
+                )
+            return
+
         # check whether we should update data for preequilibration guesses
         if (
             self.guess_steadystate
@@ -510,8 +803,6 @@ class AmiciObjective(ObjectiveBase):
             for data_ix, rdata in enumerate(rdatas):
                 self.store_steadystate_guess(data_ix, x_dct, rdata)
 
-        return ret
-
     def par_arr_to_dct(self, x: Sequence[float]) -> dict[str, float]:
         """Create dict from parameter vector."""
         return OrderedDict(zip(self.x_ids, x))
@@ -526,29 +817,71 @@ class AmiciObjective(ObjectiveBase):
         approximation:
         x_ss(x') = x_ss(x) [+ dx_ss/dx(x)*(x'-x)]
         """
-        mapping = self.parameter_mapping[condition_ix].map_sim_var
-        x_sim = map_par_opt_to_par_sim(mapping, x_dct, self.amici_model)
+        x_sim = self._par_sim(condition_ix, x_dct)
         x_ss_guess = []  # resets initial state by default
         if condition_ix in self.steadystate_guesses["data"]:
             guess_data = self.steadystate_guesses["data"][condition_ix]
             if guess_data["x_ss"] is not None:
-                x_ss_guess = guess_data["x_ss"]
-            if guess_data["sx_ss"] is not None:
-                linear_update = (
-                    guess_data["sx_ss"]
-                    .transpose()
-                    .dot(
-                        (x_sim - guess_data["x"])[
-                            np.asarray(self.edatas[condition_ix].plist)
-                        ]
-                    )
+                x_ss_guess = self._taylor_steadystate_guess(
+                    condition_ix,
+                    x_sim,
+                    guess_data["x"],
+                    guess_data["x_ss"],
+                    guess_data["sx_ss"],
                 )
-                # limit linear updates to max 20 % elementwise change
-                if (linear_update / (x_ss_guess + np.spacing(1))).max() < 0.2:
-                    x_ss_guess += linear_update
 
         self.edatas[condition_ix].x0 = tuple(x_ss_guess)
 
+    def apply_steadystate_store(self, condition_ix: int, x_dct: dict) -> bool:
+        """
+        Apply the nearest stored steady state to `edatas[condition_ix].x0`.
+
+        The steady state stored for the simulation parameters nearest to the
+        current ones is updated via a first order taylor approximation, as
+        in :meth:`apply_steadystate_guess`. Without a stored steady state,
+        the initial state is reset.
+
+        Returns
+        -------
+        Whether a stored steady state was applied.
+        """
+        x_sim = self._par_sim(condition_ix, x_dct)
+        nearest = self.steadystate_store.get_nearest(condition_ix, x_sim)
+        if nearest is None:
+            self.edatas[condition_ix].x0 = ()
+            return False
+        self.edatas[condition_ix].x0 = tuple(
+            self._taylor_steadystate_guess(condition_ix, x_sim, *nearest)
+        )
+        return True
+
+    def _taylor_steadystate_guess(
+        self,
+        condition_ix: int,
+        x_sim: np.ndarray,
+        x: np.ndarray,
+        x_ss: np.ndarray,
+        sx_ss: Optional[np.ndarray],
+    ) -> np.ndarray:
+        """Approximate the steady state at `x_sim` from the one at `x`."""
+        x_ss_guess = np.array(x_ss, dtype=float)
+        if sx_ss is not None:
+            linear_update = sx_ss.transpose().dot(
+                (x_sim - x)[np.asarray(self.edatas[condition_ix].plist)]
+            )
+            # limit linear updates to max 20 % elementwise change
+            if (linear_update / (x_ss_guess + np.spacing(1))).max() < 0.2:
+                x_ss_guess += linear_update
+        return x_ss_guess
+
+    def _preeq_condition_ixs(self) -> list[int]:
+        """Get the indices of the conditions with preequilibration."""
+        return [
+            data_ix
+            for data_ix, edata in enumerate(self.edatas)
+            if len(edata.fixedParametersPreequilibration)
+        ]
+
     def store_steadystate_guess(
         self,
         condition_ix: int,
@@ -566,18 +899,20 @@ class AmiciObjective(ObjectiveBase):
         preeq_guesses = self.steadystate_guesses["data"][condition_ix]
 
         # update parameter
-        condition_map_sim_var = self.parameter_mapping[
-            condition_ix
-        ].map_sim_var
-        x_sim = map_par_opt_to_par_sim(
-            condition_map_sim_var, x_dct, self.amici_model
-        )
-        preeq_guesses["x"] = x_sim
+        preeq_guesses["x"] = self._par_sim(condition_ix, x_dct)
 
         # update steadystates
         preeq_guesses["x_ss"] = rdata["x_ss"]
         preeq_guesses["sx_ss"] = rdata["sx_ss"]
 
+    def _par_sim(self, condition_ix: int, x_dct: dict) -> np.ndarray:
+        """Map optimization to simulation parameters of a condition."""
+        mapping_plan = self.calculator.get_mapping_plan(
+            self.x_ids, self.parameter_mapping, self.amici_model
+        )
+        x = np.array([x_dct[x_id] for x_id in self.x_ids], dtype=float)
+        return mapping_plan.par_sim(condition_ix, x)
+
     def reset_steadystate_guesses(self) -> None:
         """Reset all steadystate guess data."""
         if not self.guess_steadystate:
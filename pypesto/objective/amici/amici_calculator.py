@@ -4,6 +4,7 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, Union
 
 import numpy as np
+import scipy.sparse
 
 from ...C import (
     FVAL,
@@ -17,14 +18,13 @@ from ...C import (
     ModeType,
 )
 from .amici_util import (
-    add_sim_grad_to_opt_grad,
-    add_sim_hess_to_opt_hess,
+    ParameterMappingPlan,
     filter_return_dict,
     get_error_output,
     init_return_values,
     log_simulation,
-    sim_sres_to_opt_sres,
 )
+from .condition_cache import ConditionCache
 
 if TYPE_CHECKING:
     try:
@@ -38,14 +38,59 @@ AmiciSolver = Union["amici.Solver", "amici.SolverPtr"]
 
 
 class AmiciCalculator:
-    """Class to perform the AMICI call and obtain objective function values."""
-
-    def __init__(self):
+    """
+    Class to perform the AMICI call and obtain objective function values.
+
+    Parameters
+    ----------
+    sparse_sres:
+        Whether to return residual sensitivities as
+        :class:`scipy.sparse.csr_matrix`. For many conditions with
+        condition-specific parameters, this avoids the mostly zero dense
+        matrix of dimension number of residuals times number of parameters.
+    sparse_fim:
+        Whether to return the FIM, used as Hessian, as
+        :class:`scipy.sparse.csr_matrix`. Condition-specific parameters
+        only interact within their condition, such that the FIM is block
+        sparse.
+    """
+
+    def __init__(self, sparse_sres: bool = False, sparse_fim: bool = False):
         self._known_least_squares_safe = False
+        self.sparse_sres: bool = sparse_sres
+        self.sparse_fim: bool = sparse_fim
+        self._mapping_plan: tuple | None = None
 
     def initialize(self):
         """Initialize the calculator. Default: Do nothing."""
 
+    def get_mapping_plan(
+        self,
+        x_ids: Sequence[str],
+        parameter_mapping: ParameterMapping,
+        amici_model: AmiciModel,
+    ) -> ParameterMappingPlan:
+        """Get the precompiled parameter mapping.
+
+        The plan is cached for the most recently used parameter mapping
+        object and optimization parameter ids. It is rebuilt if either
+        changes, but not if the mapping object is modified in-place.
+        """
+        x_ids = tuple(x_ids)
+        cached = self._mapping_plan
+        if (
+            cached is None
+            or cached[0] is not parameter_mapping
+            or cached[1] != x_ids
+        ):
+            plan = ParameterMappingPlan(
+                par_opt_ids=x_ids,
+                par_sim_ids=amici_model.getParameterIds(),
+                parameter_mapping=parameter_mapping,
+            )
+            cached = self._mapping_plan = (parameter_mapping, x_ids, plan)
+        return cached[2]
+
     def __call__(
         self,
         x_dct: dict,
@@ -58,6 +103,7 @@ class AmiciCalculator:
         x_ids: Sequence[str],
         parameter_mapping: ParameterMapping,
         fim_for_hess: bool,
+        condition_cache: ConditionCache | None = None,
     ):
         """Perform the actual AMICI call.
 
@@ -86,19 +132,13 @@ class AmiciCalculator:
         fim_for_hess:
             Whether to use the FIM (if available) instead of the Hessian (if
             requested).
+        condition_cache:
+            Cache of simulation results per condition. Only conditions
+            whose parameters are not cached are simulated.
         """
         import amici.petab.conditions
 
-        # set order in solver
-        sensi_order = 0
-        if sensi_orders:
-            sensi_order = max(sensi_orders)
-
-        if sensi_order == 2 and fim_for_hess:
-            # we use the FIM
-            amici_solver.setSensitivityOrder(sensi_order - 1)
-        else:
-            amici_solver.setSensitivityOrder(sensi_order)
+        set_sensitivity_order(amici_solver, sensi_orders, fim_for_hess)
 
         # fill in parameters
         amici.petab.conditions.fill_in_parameters(
@@ -110,12 +150,137 @@ class AmiciCalculator:
         )
 
         # run amici simulation
-        rdatas = amici.runAmiciSimulations(
+        rdatas = run_simulations(
             amici_model,
             amici_solver,
             edatas,
-            num_threads=min(n_threads, len(edatas)),
+            n_threads=n_threads,
+            condition_cache=condition_cache,
+        )
+        self._check_least_squares_safe(
+            rdatas=rdatas,
+            sensi_orders=sensi_orders,
+            mode=mode,
+            amici_model=amici_model,
+        )
+
+        return calculate_function_values(
+            rdatas=rdatas,
+            sensi_orders=sensi_orders,
+            mode=mode,
+            amici_model=amici_model,
+            amici_solver=amici_solver,
+            edatas=edatas,
+            x_ids=x_ids,
+            parameter_mapping=parameter_mapping,
+            fim_for_hess=fim_for_hess,
+            mapping_plan=self.get_mapping_plan(
+                x_ids, parameter_mapping, amici_model
+            ),
+            sparse_sres=self.sparse_sres,
+            sparse_fim=self.sparse_fim,
+        )
+
+    def call_batch(
+        self,
+        x_dcts: Sequence[dict],
+        sensi_orders: tuple[int],
+        mode: ModeType,
+        amici_model: AmiciModel,
+        amici_solver: AmiciSolver,
+        edatas_batch: Sequence[list[amici.ExpData]],
+        n_threads: int,
+        x_ids: Sequence[str],
+        parameter_mapping: ParameterMapping,
+        fim_for_hess: bool,
+        condition_cache: ConditionCache | None = None,
+    ) -> list[dict]:
+        """Perform the AMICI calls for multiple parameter vectors.
+
+        The simulations of all parameter vectors and conditions are run in a
+        single call to :func:`amici.runAmiciSimulations`.
+
+        Called within the :func:`AmiciObjective.call_unprocessed_batch`
+        method. Parameters as for :meth:`__call__`, except:
+
+        Parameters
+        ----------
+        x_dcts:
+            For each parameter vector, the parameters for which to compute
+            function values and derivatives.
+        edatas_batch:
+            For each parameter vector, a separate copy of the experimental
+            data.
+        """
+        import amici.petab.conditions
+
+        set_sensitivity_order(amici_solver, sensi_orders, fim_for_hess)
+
+        # fill in parameters
+        for x_dct, edatas in zip(x_dcts, edatas_batch):
+            amici.petab.conditions.fill_in_parameters(
+                edatas=edatas,
+                problem_parameters=x_dct,
+                scaled_parameters=True,
+                parameter_mapping=parameter_mapping,
+                amici_model=amici_model,
+            )
+
+        # run all amici simulations at once
+        all_edatas = [edata for edatas in edatas_batch for edata in edatas]
+        all_rdatas = run_simulations(
+            amici_model,
+            amici_solver,
+            all_edatas,
+            n_threads=n_threads,
+            condition_cache=condition_cache,
+            condition_ixs=[
+                condition_ix
+                for edatas in edatas_batch
+                for condition_ix in range(len(edatas))
+            ],
+        )
+        self._check_least_squares_safe(
+            rdatas=all_rdatas,
+            sensi_orders=sensi_orders,
+            mode=mode,
+            amici_model=amici_model,
+        )
+
+        mapping_plan = self.get_mapping_plan(
+            x_ids, parameter_mapping, amici_model
         )
+        rets = []
+        start = 0
+        for edatas in edatas_batch:
+            rdatas = all_rdatas[start : start + len(edatas)]
+            start += len(edatas)
+            rets.append(
+                calculate_function_values(
+                    rdatas=rdatas,
+                    sensi_orders=sensi_orders,
+                    mode=mode,
+                    amici_model=amici_model,
+                    amici_solver=amici_solver,
+                    edatas=edatas,
+                    x_ids=x_ids,
+                    parameter_mapping=parameter_mapping,
+                    fim_for_hess=fim_for_hess,
+                    mapping_plan=mapping_plan,
+                    sparse_sres=self.sparse_sres,
+                    sparse_fim=self.sparse_fim,
+                )
+            )
+        return rets
+
+    def _check_least_squares_safe(
+        self,
+        rdatas: list[amici.ReturnData],
+        sensi_orders: tuple[int],
+        mode: ModeType,
+        amici_model: AmiciModel,
+    ) -> None:
+        """Check that residual sensitivities do not miss sigma terms."""
         if (
             not self._known_least_squares_safe
             and mode == MODE_RES
@@ -136,17 +301,76 @@ class AmiciCalculator:
                 )
             self._known_least_squares_safe = True  # don't check this again
 
-        return calculate_function_values(
-            rdatas=rdatas,
-            sensi_orders=sensi_orders,
-            mode=mode,
-            amici_model=amici_model,
-            amici_solver=amici_solver,
-            edatas=edatas,
-            x_ids=x_ids,
-            parameter_mapping=parameter_mapping,
-            fim_for_hess=fim_for_hess,
+
+def run_simulations(
+    amici_model: AmiciModel,
+    amici_solver: AmiciSolver,
+    edatas: Sequence[amici.ExpData],
+    n_threads: int,
+    condition_cache: ConditionCache | None = None,
+    condition_ixs: Sequence[int] | None = None,
+) -> list[amici.ReturnData]:
+    """Simulate the conditions, reusing cached results where possible.
+
+    Parameters
+    ----------
+    amici_model, amici_solver, edatas:
+        As for :func:`amici.runAmiciSimulations`, with the parameters
+        already filled into `edatas`.
+    n_threads:
+        Maximum number of threads for the simulations.
+    condition_cache:
+        Cache of simulation results per condition.
+    condition_ixs:
+        Condition indices of `edatas`. Defaults to the positions in
+        `edatas`.
+    """
+    import amici
+
+    if condition_cache is None:
+        return amici.runAmiciSimulations(
+            amici_model,
+            amici_solver,
+            edatas,
+            num_threads=max(1, min(n_threads, len(edatas))),
+        )
+
+    if condition_ixs is None:
+        condition_ixs = range(len(edatas))
+    sensi_order = int(amici_solver.getSensitivityOrder())
+    keys = condition_cache.get_keys(edatas, condition_ixs, amici_solver)
+    rdatas = [condition_cache.lookup(key, sensi_order) for key in keys]
+
+    # simulate the remaining conditions at once
+    i_misses = [ix for ix, rdata in enumerate(rdatas) if rdata is None]
+    if i_misses:
+        miss_rdatas = amici.runAmiciSimulations(
+            amici_model,
+            amici_solver,
+            [edatas[ix] for ix in i_misses],
+            num_threads=max(1, min(n_threads, len(i_misses))),
         )
+        for ix, rdata in zip(i_misses, miss_rdatas):
+            condition_cache.store(keys[ix], rdata, sensi_order)
+            rdatas[ix] = rdata
+    return rdatas
+
+
+def set_sensitivity_order(
+    amici_solver: AmiciSolver,
+    sensi_orders: tuple[int],
+    fim_for_hess: bool,
+) -> None:
+    """Set the sensitivity order required for `sensi_orders` in the solver."""
+    sensi_order = 0
+    if sensi_orders:
+        sensi_order = max(sensi_orders)
+
+    if sensi_order == 2 and fim_for_hess:
+        # we use the FIM
+        amici_solver.setSensitivityOrder(sensi_order - 1)
+    else:
+        amici_solver.setSensitivityOrder(sensi_order)
 
 
 def calculate_function_values(
@@ -159,8 +383,16 @@ def calculate_function_values(
     x_ids: Sequence[str],
     parameter_mapping: ParameterMapping,
     fim_for_hess: bool,
+    mapping_plan: ParameterMappingPlan | None = None,
+    sparse_sres: bool = False,
+    sparse_fim: bool = False,
 ):
-    """Calculate the function values from rdatas and return as dict."""
+    """Calculate the function values from rdatas and return as dict.
+
+    `mapping_plan` is the precompiled `parameter_mapping`, built if not
+    provided. If `sparse_sres` or `sparse_fim`, residual sensitivities or
+    the FIM, respectively, are returned as :class:`scipy.sparse.csr_matrix`.
+    """
     import amici
 
     # full optimization problem dimension (including fixed parameters)
@@ -173,18 +405,46 @@ def calculate_function_values(
         )
 
     nllh, snllh, s2nllh, chi2, res, sres = init_return_values(
-        sensi_orders, mode, dim
+        sensi_orders, mode, dim, sparse_hess=sparse_fim
     )
+    if mode == MODE_FUN and 2 in sensi_orders and sparse_fim:
+        # rows, columns and values of the non-zero entries
+        fim_entries = tuple(
+            [np.zeros(0, dtype=dtype)] for dtype in (int, int, float)
+        )
 
-    par_sim_ids = list(amici_model.getParameterIds())
+    if mapping_plan is None:
+        mapping_plan = ParameterMappingPlan(
+            par_opt_ids=x_ids,
+            par_sim_ids=amici_model.getParameterIds(),
+            parameter_mapping=parameter_mapping,
+        )
     sensi_method = amici_solver.getSensitivityMethod()
 
+    if mode == MODE_RES:
+        # residuals are filled in place into outputs sized once
+        offsets = np.cumsum(
+            [0]
+            + [
+                len(rdata["sres"] if rdata["res"] is None else rdata["res"])
+                for rdata in rdatas
+            ]
+        )
+        if 0 in sensi_orders:
+            res = np.empty(offsets[-1])
+        if 1 in sensi_orders:
+            if sparse_sres:
+                # rows, columns and values of the non-zero entries
+                sres_entries = tuple(
+                    [np.zeros(0, dtype=dtype)] for dtype in (int, int, float)
+                )
+            else:
+                sres = np.zeros((offsets[-1], dim))
+
     # iterate over return data
     for data_ix, rdata in enumerate(rdatas):
         log_simulation(data_ix, rdata)
 
-        condition_map_sim_var = parameter_mapping[data_ix].map_sim_var
-
         # add objective value
         nllh -= rdata["llh"]
 
@@ -196,13 +456,8 @@ def calculate_function_values(
 
             if 1 in sensi_orders:
                 # add gradient
-                add_sim_grad_to_opt_grad(
-                    x_ids,
-                    par_sim_ids,
-                    condition_map_sim_var,
-                    rdata["sllh"],
-                    snllh,
-                    coefficient=-1.0,
+                mapping_plan.add_grad(
+                    data_ix, rdata["sllh"], snllh, coefficient=-1.0
                 )
 
                 if not np.isfinite(snllh).all():
@@ -218,36 +473,62 @@ def calculate_function_values(
                 ):
                     raise ValueError("AMICI cannot compute Hessians yet.")
                     # add FIM for Hessian
-                add_sim_hess_to_opt_hess(
-                    x_ids,
-                    par_sim_ids,
-                    condition_map_sim_var,
-                    rdata["FIM"],
-                    s2nllh,
-                    coefficient=+1.0,
-                )
-                if not np.isfinite(s2nllh).all():
+                if sparse_fim:
+                    new_entries = mapping_plan.hess_entries(
+                        data_ix, rdata["FIM"], coefficient=+1.0
+                    )
+                    for entries, new in zip(fim_entries, new_entries):
+                        entries.append(new)
+                    finite = np.isfinite(new_entries[2]).all()
+                else:
+                    mapping_plan.add_hess(
+                        data_ix, rdata["FIM"], s2nllh, coefficient=+1.0
+                    )
+                    finite = np.isfinite(s2nllh).all()
+                if not finite:
                     return get_error_output(
                         amici_model, edatas, rdatas, sensi_orders, mode, dim
                     )
 
         elif mode == MODE_RES:
+            start, end = offsets[data_ix], offsets[data_ix + 1]
             if 0 in sensi_orders:
                 chi2 += rdata["chi2"]
-                res = (
-                    np.hstack([res, rdata["res"]])
-                    if res.size
-                    else rdata["res"]
-                )
+                res[start:end] = rdata["res"]
             if 1 in sensi_orders:
-                opt_sres = sim_sres_to_opt_sres(
-                    x_ids,
-                    par_sim_ids,
-                    condition_map_sim_var,
-                    rdata["sres"],
-                    coefficient=1.0,
-                )
-                sres = np.vstack([sres, opt_sres]) if sres.size else opt_sres
+                if sparse_sres:
+                    rows, cols, values = mapping_plan.sres_entries(
+                        data_ix, rdata["sres"], coefficient=1.0
+                    )
+                    for entries, new_entries in zip(
+                        sres_entries, (rows + start, cols, values)
+                    ):
+                        entries.append(new_entries)
+                else:
+                    mapping_plan.sres(
+                        data_ix,
+                        rdata["sres"],
+                        coefficient=1.0,
+                        out=sres[start:end],
+                    )
+
+    if mode == MODE_FUN and 2 in sensi_orders and sparse_fim:
+        rows, cols, values = (
+            np.concatenate(entries) for entries in fim_entries
+        )
+        # duplicate entries are summed up
+        s2nllh = scipy.sparse.csr_matrix(
+            (values, (rows, cols)), shape=(dim, dim)
+        )
+
+    if mode == MODE_RES and 1 in sensi_orders and sparse_sres:
+        rows, cols, values = (
+            np.concatenate(entries) for entries in sres_entries
+        )
+        # duplicate entries are summed up
+        sres = scipy.sparse.csr_matrix(
+            (values, (rows, cols)), shape=(offsets[-1], dim)
+        )
 
     ret = {
         FVAL: nllh,
@@ -7,6 +7,7 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, Union
 
 import numpy as np
+import scipy.sparse
 
 from ...C import (
     FVAL,
@@ -191,21 +192,286 @@ def par_index_slices(
     #  index for AMICI-computed sensitivities for the respective parameter.
     cumsum_par_sim_maps_to_str = np.cumsum(par_sim_maps_to_str)
 
-    zip_iterator = zip(
-        *(
-            (
-                # sensitivity parameter index in AMICI simulation results
-                cumsum_par_sim_maps_to_str[par_sim_id_to_idx[par_sim_id]] - 1,
-                # corresponding optimization parameter index
-                par_opt_id_to_idx[par_opt_id],
+    par_sim_slice = []
+    par_opt_slice = []
+    for par_sim_id, par_opt_id in condition_map_sim_var.items():
+        if isinstance(par_opt_id, str) and par_opt_id in par_opt_id_to_idx:
+            # sensitivity parameter index in AMICI simulation results
+            par_sim_slice.append(
+                cumsum_par_sim_maps_to_str[par_sim_id_to_idx[par_sim_id]] - 1
             )
-            for par_sim_id, par_opt_id in condition_map_sim_var.items()
-            if isinstance(par_opt_id, str) and par_opt_id in par_opt_id_to_idx
-        )
+            # corresponding optimization parameter index
+            par_opt_slice.append(par_opt_id_to_idx[par_opt_id])
+    return (
+        np.array(par_sim_slice, dtype=int),
+        np.array(par_opt_slice, dtype=int),
     )
-    par_sim_slice = np.fromiter(next(zip_iterator), dtype=int)
-    par_opt_slice = np.fromiter(next(zip_iterator), dtype=int)
-    return par_sim_slice, par_opt_slice
+
+
+class ParameterMappingPlan:
+    """
+    Parameter mapping precompiled to integer index arrays.
+
+    Evaluating the string-keyed mapping of simulation to optimization
+    parameters for every condition on every objective call is costly for
+    many conditions. This plan resolves it once, such that per condition,
+    mapping parameters and summing up gradients, FIMs and residual
+    sensitivities reduce to a few vectorized indexing operations.
+
+    Parameters
+    ----------
+    par_opt_ids:
+        The optimization parameter ids. Needed for order.
+    par_sim_ids:
+        The simulation parameter ids. Needed for order.
+    parameter_mapping:
+        The simulation to optimization parameter mapping of all conditions.
+    """
+
+    def __init__(
+        self,
+        par_opt_ids: Sequence[str],
+        par_sim_ids: Sequence[str],
+        parameter_mapping: ParameterMapping,
+    ):
+        self.par_opt_ids: list[str] = list(par_opt_ids)
+        self.par_sim_ids: list[str] = list(par_sim_ids)
+        par_opt_id_to_idx = {
+            id_: idx for idx, id_ in enumerate(self.par_opt_ids)
+        }
+
+        # per condition, sensitivity and optimization parameter indices
+        self._sim_slices: list[np.ndarray] = []
+        self._opt_slices: list[np.ndarray] = []
+        # whether the optimization parameter indices are unique, then
+        #  results can be added without buffering
+        self._unique: list[bool] = []
+        # per condition, simulation parameter values, with nan for those
+        #  given by optimization parameters, and the indices of the latter
+        self._par_sim_vals: list[np.ndarray] = []
+        self._par_sim_idxs: list[np.ndarray] = []
+        self._par_opt_idxs: list[np.ndarray] = []
+
+        for mapping_for_condition in parameter_mapping:
+            condition_map_sim_var = mapping_for_condition.map_sim_var
+            par_sim_slice, par_opt_slice = par_index_slices(
+                self.par_opt_ids, self.par_sim_ids, condition_map_sim_var
+            )
+            self._sim_slices.append(par_sim_slice)
+            self._opt_slices.append(par_opt_slice)
+            self._unique.append(
+                np.unique(par_opt_slice).size == par_opt_slice.size
+            )
+
+            par_sim_vals = np.full(len(self.par_sim_ids), np.nan)
+            par_sim_idxs = []
+            par_opt_idxs = []
+            for ix, par_id in enumerate(self.par_sim_ids):
+                val = condition_map_sim_var[par_id]
+                if isinstance(val, numbers.Number):
+                    par_sim_vals[ix] = val
+                elif val in par_opt_id_to_idx:
+                    par_sim_idxs.append(ix)
+                    par_opt_idxs.append(par_opt_id_to_idx[val])
+            self._par_sim_vals.append(par_sim_vals)
+            self._par_sim_idxs.append(np.array(par_sim_idxs, dtype=int))
+            self._par_opt_idxs.append(np.array(par_opt_idxs, dtype=int))
+
+    def __len__(self) -> int:
+        """Get the number of conditions."""
+        return len(self._sim_slices)
+
+    def par_sim(self, condition_ix: int, x: np.ndarray) -> np.ndarray:
+        """
+        Create simulation vector from optimization vector.
+
+        Equivalent to :func:`map_par_opt_to_par_sim`.
+
+        Parameters
+        ----------
+        condition_ix:
+            The condition index.
+        x:
+            The optimization parameters, ordered as `par_opt_ids`.
+        """
+        par_sim_vals = self._par_sim_vals[condition_ix].copy()
+        par_sim_vals[self._par_sim_idxs[condition_ix]] = np.asarray(x)[
+            self._par_opt_idxs[condition_ix]
+        ]
+        return par_sim_vals
+
+    def add_grad(
+        self,
+        condition_ix: int,
+        sim_grad: np.ndarray,
+        opt_grad: np.ndarray,
+        coefficient: float = 1.0,
+    ) -> None:
+        """Sum a simulation gradient to the objective gradient, in-place.
+
+        See :func:`add_sim_grad_to_opt_grad`.
+        """
+        _add_sim_grad(
+            self._sim_slices[condition_ix],
+            self._opt_slices[condition_ix],
+            self._unique[condition_ix],
+            sim_grad,
+            opt_grad,
+            coefficient,
+        )
+
+    def add_hess(
+        self,
+        condition_ix: int,
+        sim_hess: np.ndarray,
+        opt_hess: np.ndarray,
+        coefficient: float = 1.0,
+    ) -> None:
+        """Sum a simulation Hessian to the objective Hessian, in-place.
+
+        See :func:`add_sim_hess_to_opt_hess`.
+        """
+        _add_sim_hess(
+            self._sim_slices[condition_ix],
+            self._opt_slices[condition_ix],
+            self._unique[condition_ix],
+            sim_hess,
+            opt_hess,
+            coefficient,
+        )
+
+    def sres(
+        self,
+        condition_ix: int,
+        sim_sres: np.ndarray,
+        coefficient: float = 1.0,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Map simulation to objective residual sensitivities.
+
+        See :func:`sim_sres_to_opt_sres`. `out` is an optional preallocated
+        zero output.
+        """
+        return _sim_sres_to_opt_sres(
+            self._sim_slices[condition_ix],
+            self._opt_slices[condition_ix],
+            self._unique[condition_ix],
+            len(self.par_opt_ids),
+            sim_sres,
+            coefficient,
+            out,
+        )
+
+    def hess_entries(
+        self,
+        condition_ix: int,
+        sim_hess: np.ndarray,
+        coefficient: float = 1.0,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the entries of the objective Hessian of a condition.
+
+        Only the block of optimization parameters mapped to in this
+        condition is included, as for a sparse matrix in coordinate format.
+        Entries of repeatedly mapped optimization parameters are to be
+        summed up.
+
+        Returns
+        -------
+        rows, cols:
+            Row and column, i.e. optimization parameter, indices.
+        values:
+            The values.
+        """
+        par_sim_slice = self._sim_slices[condition_ix]
+        par_opt_slice = self._opt_slices[condition_ix]
+        rows = np.repeat(par_opt_slice, par_opt_slice.size)
+        cols = np.tile(par_opt_slice, par_opt_slice.size)
+        values = (
+            coefficient * sim_hess[np.ix_(par_sim_slice, par_sim_slice)]
+        ).ravel()
+        return rows, cols, values
+
+    def sres_entries(
+        self,
+        condition_ix: int,
+        sim_sres: np.ndarray,
+        coefficient: float = 1.0,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the entries of the objective residual sensitivities.
+
+        Only the columns of optimization parameters mapped to in this
+        condition are included, as for a sparse matrix in coordinate format.
+        Entries of repeatedly mapped optimization parameters are to be
+        summed up.
+
+        Returns
+        -------
+        rows:
+            Row indices, within the condition.
+        cols:
+            Column, i.e. optimization parameter, indices.
+        values:
+            The values.
+        """
+        par_sim_slice = self._sim_slices[condition_ix]
+        par_opt_slice = self._opt_slices[condition_ix]
+        n_res = sim_sres.shape[0]
+        rows = np.repeat(np.arange(n_res), par_opt_slice.size)
+        cols = np.tile(par_opt_slice, n_res)
+        values = coefficient * sim_sres[:, par_sim_slice].ravel()
+        return rows, cols, values
+
+
+def _add_sim_grad(
+    par_sim_slice: np.ndarray,
+    par_opt_slice: np.ndarray,
+    unique: bool,
+    sim_grad: np.ndarray,
+    opt_grad: np.ndarray,
+    coefficient: float,
+) -> None:
+    """Sum simulation gradients to objective gradient via index arrays."""
+    values = coefficient * sim_grad[par_sim_slice]
+    if unique:
+        opt_grad[par_opt_slice] += values
+    else:
+        np.add.at(opt_grad, par_opt_slice, values)
+
+
+def _add_sim_hess(
+    par_sim_slice: np.ndarray,
+    par_opt_slice: np.ndarray,
+    unique: bool,
+    sim_hess: np.ndarray,
+    opt_hess: np.ndarray,
+    coefficient: float,
+) -> None:
+    """Sum simulation Hessians to objective Hessian via index arrays."""
+    values = coefficient * sim_hess[np.ix_(par_sim_slice, par_sim_slice)]
+    opt_index = np.ix_(par_opt_slice, par_opt_slice)
+    if unique:
+        opt_hess[opt_index] += values
+    else:
+        np.add.at(opt_hess, opt_index, values)
+
+
+def _sim_sres_to_opt_sres(
+    par_sim_slice: np.ndarray,
+    par_opt_slice: np.ndarray,
+    unique: bool,
+    dim: int,
+    sim_sres: np.ndarray,
+    coefficient: float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Map residual sensitivities to objective via index arrays."""
+    opt_sres = out if out is not None else np.zeros((sim_sres.shape[0], dim))
+    values = coefficient * sim_sres[:, par_sim_slice]
+    if unique:
+        opt_sres[:, par_opt_slice] = values
+    else:
+        np.add.at(opt_sres, (slice(None), par_opt_slice), values)
+    return opt_sres
 
 
 def add_sim_grad_to_opt_grad(
@@ -220,6 +486,7 @@ def add_sim_grad_to_opt_grad(
     Sum simulation gradients to objective gradient.
 
     Uses the provided mapping `mapping_par_opt_to_par_sim` for summing up.
+    For repeated calls, use :meth:`ParameterMappingPlan.add_grad`.
 
     Parameters
     ----------
@@ -240,21 +507,15 @@ def add_sim_grad_to_opt_grad(
     par_sim_slice, par_opt_slice = par_index_slices(
         par_opt_ids, par_sim_ids, condition_map_sim_var
     )
-
-    par_opt_slice_unique, unique_index = np.unique(
-        par_opt_slice, return_index=True
-    )
-    opt_grad[par_opt_slice_unique] += (
-        coefficient * sim_grad[par_sim_slice[unique_index]]
+    _add_sim_grad(
+        par_sim_slice,
+        par_opt_slice,
+        np.unique(par_opt_slice).size == par_opt_slice.size,
+        sim_grad,
+        opt_grad,
+        coefficient,
     )
 
-    if par_opt_slice_unique.size < par_opt_slice.size:
-        for idx in range(len(par_opt_slice)):
-            if idx not in unique_index:
-                opt_grad[par_opt_slice[idx]] += (
-                    coefficient * sim_grad[par_sim_slice[idx]]
-                )
-
 
 def add_sim_hess_to_opt_hess(
     par_opt_ids: Sequence[str],
@@ -274,38 +535,15 @@ def add_sim_hess_to_opt_hess(
     par_sim_slice, par_opt_slice = par_index_slices(
         par_opt_ids, par_sim_ids, condition_map_sim_var
     )
-
-    par_opt_slice_unique, unique_index = np.unique(
-        par_opt_slice, return_index=True
+    _add_sim_hess(
+        par_sim_slice,
+        par_opt_slice,
+        np.unique(par_opt_slice).size == par_opt_slice.size,
+        sim_hess,
+        opt_hess,
+        coefficient,
     )
 
-    non_unique_indices = [
-        idx for idx in range(len(par_opt_slice)) if idx not in unique_index
-    ]
-
-    opt_hess[np.ix_(par_opt_slice_unique, par_opt_slice_unique)] += (
-        coefficient
-        * sim_hess[
-            np.ix_(par_sim_slice[unique_index], par_sim_slice[unique_index])
-        ]
-    )
-
-    if par_opt_slice_unique.size < par_opt_slice.size:
-        for idx in non_unique_indices:
-            opt_hess[par_opt_slice[idx], par_opt_slice_unique] += (
-                coefficient
-                * sim_hess[par_sim_slice[idx], par_sim_slice[unique_index]]
-            )
-            opt_hess[par_opt_slice_unique, par_opt_slice[idx]] += (
-                coefficient
-                * sim_hess[par_sim_slice[unique_index], par_sim_slice[idx]]
-            )
-            for jdx in non_unique_indices:
-                opt_hess[par_opt_slice[idx], par_opt_slice[jdx]] += (
-                    coefficient
-                    * sim_hess[par_sim_slice[idx], par_sim_slice[jdx]]
-                )
-
 
 def sim_sres_to_opt_sres(
     par_opt_ids: Sequence[str],
@@ -323,28 +561,18 @@ def sim_sres_to_opt_sres(
     Mostly the same as for add_sim_grad_to_opt_grad, replacing the gradients by
     residual sensitivities.
     """
-    opt_sres = np.zeros((sim_sres.shape[0], len(par_opt_ids)))
-
     par_sim_slice, par_opt_slice = par_index_slices(
         par_opt_ids, par_sim_ids, condition_map_sim_var
     )
-
-    par_opt_slice_unique, unique_index = np.unique(
-        par_opt_slice, return_index=True
-    )
-    opt_sres[:, par_opt_slice_unique] += (
-        coefficient * sim_sres[:, par_sim_slice[unique_index]]
+    return _sim_sres_to_opt_sres(
+        par_sim_slice,
+        par_opt_slice,
+        np.unique(par_opt_slice).size == par_opt_slice.size,
+        len(par_opt_ids),
+        sim_sres,
+        coefficient,
     )
 
-    if par_opt_slice_unique.size < par_opt_slice.size:
-        for idx in range(len(par_opt_slice)):
-            if idx not in unique_index:
-                opt_sres[:, par_opt_slice[idx]] += (
-                    coefficient * sim_sres[:, par_sim_slice[idx]]
-                )
-
-    return opt_sres
-
 
 def log_simulation(data_ix, rdata) -> None:
     """Log the simulation results."""
@@ -407,8 +635,12 @@ def init_return_values(
     mode: ModeType,
     dim: int,
     error: bool = False,
+    sparse_hess: bool = False,
 ):
-    """Initialize return values."""
+    """Initialize return values.
+
+    If `sparse_hess`, the Hessian is an empty sparse matrix.
+    """
     if error:
         fval = np.inf
         sval = np.nan
@@ -422,7 +654,10 @@ def init_return_values(
         if 1 in sensi_orders:
             snllh = sval * np.ones(dim)
         if 2 in sensi_orders:
-            s2nllh = sval * np.ones([dim, dim])
+            if sparse_hess:
+                s2nllh = scipy.sparse.csr_matrix((dim, dim))
+            else:
+                s2nllh = sval * np.ones([dim, dim])
 
     chi2 = None
     res = None
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    try:
+        import amici
+    except ImportError:
+        pass
+
+AmiciSolver = Union["amici.Solver", "amici.SolverPtr"]
+
+# (condition index, simulation settings, parameter bytes)
+ConditionKey = tuple[int, tuple, bytes]
+
+
+class ConditionCache:
+    """
+    Cache of AMICI simulation results per experimental condition.
+
+    Often, only a few optimization parameters change between objective
+    calls, e.g. in profiling or coordinate-wise moves, and many conditions
+    do not depend on them. This cache stores the
+    :class:`amici.ReturnData` of each condition, identified by the
+    effective simulation parameters, i.e. the dynamic and fixed parameters
+    filled into the :class:`amici.ExpData`, and the simulation settings.
+    Only conditions whose effective parameters changed are then simulated
+    again.
+
+    Results with a higher sensitivity order also serve requests for lower
+    orders. Changes of the model, solver or experimental data other than
+    the parameters, e.g. tolerances or timepoints, are not detected, and
+    require calling :meth:`clear`.
+
+    Parameters
+    ----------
+    max_size:
+        The maximum number of cached simulation results per condition. The
+        least recently used entries of a condition are evicted first, such
+        that conditions do not evict each other's results.
+
+    Attributes
+    ----------
+    n_hits:
+        Number of condition simulations served from the cache.
+    n_misses:
+        Number of condition simulations performed.
+    time_saved:
+        Total CPU time in seconds that the simulations served from the
+        cache originally took.
+    """
+
+    def __init__(self, max_size: int = 4):
+        if max_size < 1:
+            raise ValueError("max_size must be positive.")
+        self.max_size: int = max_size
+
+        # condition index -> key -> (rdata, sensitivity order)
+        self._cache: dict[
+            int, OrderedDict[ConditionKey, tuple[amici.ReturnData, int]]
+        ] = {}
+        self.n_hits: int = 0
+        self.n_misses: int = 0
+        self.time_saved: float = 0.0
+        # ids of the results served since the last `clear_served`
+        self._served: set[int] = set()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._cache.values())
+
+    def __deepcopy__(self, memodict=None) -> ConditionCache:
+        """Create a copy with an empty cache."""
+        return ConditionCache(max_size=self.max_size)
+
+    def __getstate__(self) -> dict:
+        # simulation results are not picklable, and not needed elsewhere
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        state["_served"] = set()
+        return state
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of condition simulations served from the cache."""
+        n_total = self.n_hits + self.n_misses
+        if not n_total:
+            return 0.0
+        return self.n_hits / n_total
+
+    def clear(self) -> None:
+        """Empty the cache and reset the counters."""
+        self._cache.clear()
+        self._served.clear()
+        self.n_hits = 0
+        self.n_misses = 0
+        self.time_saved = 0.0
+
+    def get_keys(
+        self,
+        edatas: Sequence[amici.ExpData],
+        condition_ixs: Sequence[int],
+        amici_solver: AmiciSolver,
+    ) -> list[ConditionKey]:
+        """Get the cache keys for experimental data with filled parameters.
+
+        Parameters
+        ----------
+        edatas:
+            The experimental data, with the parameters filled in.
+        condition_ixs:
+            The condition indices of `edatas`.
+        amici_solver:
+            The solver used for the simulations.
+        """
+        settings = (
+            int(amici_solver.getSensitivityMethod()),
+            int(amici_solver.getReturnDataReportingMode()),
+        )
+        return [
+            (
+                condition_ix,
+                settings,
+                np.concatenate(
+                    [
+                        np.asarray(edata.parameters, dtype=float),
+                        np.asarray(edata.fixedParameters, dtype=float),
+                        np.asarray(
+                            edata.fixedParametersPreequilibration, dtype=float
+                        ),
+                        np.asarray(
+                            edata.fixedParametersPresimulation, dtype=float
+                        ),
+                    ]
+                ).tobytes(),
+            )
+            for condition_ix, edata in zip(condition_ixs, edatas)
+        ]
+
+    def lookup(
+        self, key: ConditionKey, sensi_order: int
+    ) -> amici.ReturnData | None:
+        """Get the cached simulation result, if available.
+
+        Counts a miss if no result of at least `sensi_order` is available.
+        """
+        entries = self._cache.get(key[0], {})
+        entry = entries.get(key)
+        if entry is not None and entry[1] >= sensi_order:
+            rdata = entry[0]
+            entries.move_to_end(key)
+            self._served.add(id(rdata))
+            self.n_hits += 1
+            self.time_saved += rdata["cpu_time_total"] / 1000
+            return rdata
+        self.n_misses += 1
+        return None
+
+    def is_served(self, rdata: amici.ReturnData) -> bool:
+        """Whether `rdata` was served from the cache.
+
+        Considers the results served since the last call of
+        :meth:`clear_served`, e.g. to distinguish them from the results of
+        the simulations of an objective call.
+        """
+        return id(rdata) in self._served
+
+    def clear_served(self) -> None:
+        """Forget which results were served, see :meth:`is_served`."""
+        self._served.clear()
+
+    def store(
+        self, key: ConditionKey, rdata: amici.ReturnData, sensi_order: int
+    ) -> None:
+        """Add a simulation result, unless a higher order one is cached.
+
+        Failed simulations are not cached.
+        """
+        import amici
+
+        if rdata["status"] != amici.AMICI_SUCCESS:
+            return
+        entries = self._cache.setdefault(key[0], OrderedDict())
+        entry = entries.get(key)
+        if entry is None or entry[1] <= sensi_order:
+            entries[key] = (rdata, sensi_order)
+        entries.move_to_end(key)
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
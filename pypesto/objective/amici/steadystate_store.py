@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import threading
+import uuid
+import weakref
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+if TYPE_CHECKING:
+    try:
+        import amici
+    except ImportError:
+        pass
+
+# the stores alive in this process, to share them between unpickled copies
+_SHARED_STORES: weakref.WeakValueDictionary[
+    str, SteadyStateStore
+] = weakref.WeakValueDictionary()
+
+
+class SteadyStateStore:
+    """
+    Store of preequilibration steady states for warm starts.
+
+    For each condition with preequilibration, up to `max_size` steady
+    states are stored together with the simulation parameters they were
+    obtained for. The state of the nearest stored parameters, found via a
+    k-d tree, then serves as initial guess for the preequilibration at new
+    parameters.
+
+    A store is shared by the objectives it is passed to, as well as by
+    their copies, e.g. for different optimizer starts. After pickling, e.g.
+    by multi-process engines, all copies unpickled in the same process
+    share one store, starting empty.
+
+    Parameters
+    ----------
+    max_size:
+        The maximum number of stored steady states per condition. The
+        oldest states are replaced first.
+
+    Attributes
+    ----------
+    n_hits:
+        Number of preequilibrations started from a stored steady state.
+    n_misses:
+        Number of preequilibrations without a stored steady state.
+    """
+
+    def __init__(self, max_size: int = 20):
+        if max_size < 1:
+            raise ValueError("max_size must be positive.")
+        self.max_size: int = max_size
+        self.n_hits: int = 0
+        self.n_misses: int = 0
+
+        # condition index -> parameters, steady states, sensitivities
+        self._x: dict[int, list[np.ndarray]] = {}
+        self._x_ss: dict[int, list[np.ndarray]] = {}
+        self._sx_ss: dict[int, list[np.ndarray | None]] = {}
+        # position of the next state to replace, per condition
+        self._next: dict[int, int] = {}
+        self._trees: dict[int, cKDTree] = {}
+        # total preequilibration time and number, of warm and cold starts
+        self._preeq_time: dict[bool, float] = {True: 0.0, False: 0.0}
+        self._n_preeq: dict[bool, int] = {True: 0, False: 0}
+
+        self._lock = threading.Lock()
+        self._id: str = uuid.uuid4().hex
+        _SHARED_STORES[self._id] = self
+
+    def __len__(self) -> int:
+        return sum(len(x_ss) for x_ss in self._x_ss.values())
+
+    def __deepcopy__(self, memodict=None) -> SteadyStateStore:
+        """Share the store between copies."""
+        return self
+
+    def __reduce__(self):
+        """Unpickle to the store shared in the target process."""
+        return _get_shared_store, (self._id, self.max_size)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of preequilibrations started from a stored state."""
+        n_total = self.n_hits + self.n_misses
+        if not n_total:
+            return 0.0
+        return self.n_hits / n_total
+
+    @property
+    def preeq_time_saved(self) -> float:
+        """Estimated preequilibration CPU time in seconds saved.
+
+        Estimated from the difference of the mean recorded CPU times of
+        preequilibrations without and with warm start.
+        """
+        if not self._n_preeq[True] or not self._n_preeq[False]:
+            return 0.0
+        mean_cold = self._preeq_time[False] / self._n_preeq[False]
+        mean_warm = self._preeq_time[True] / self._n_preeq[True]
+        return self._n_preeq[True] * (mean_cold - mean_warm)
+
+    def clear(self) -> None:
+        """Remove all stored states and reset the counters."""
+        with self._lock:
+            for data in (self._x, self._x_ss, self._sx_ss, self._next):
+                data.clear()
+            self._trees.clear()
+            self.n_hits = 0
+            self.n_misses = 0
+            self._preeq_time = {True: 0.0, False: 0.0}
+            self._n_preeq = {True: 0, False: 0}
+
+    def get_nearest(
+        self, condition_ix: int, x_sim: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray | None] | None:
+        """Get the stored steady state with parameters nearest to `x_sim`.
+
+        Returns
+        -------
+        The stored simulation parameters, steady state, and steady state
+        sensitivities (possibly None), or None if nothing is stored.
+        """
+        with self._lock:
+            if not self._x.get(condition_ix):
+                return None
+            tree = self._trees.get(condition_ix)
+            if tree is None:
+                tree = self._trees[condition_ix] = cKDTree(
+                    np.vstack(self._x[condition_ix])
+                )
+            _, ix = tree.query(x_sim)
+            return (
+                self._x[condition_ix][ix],
+                self._x_ss[condition_ix][ix],
+                self._sx_ss[condition_ix][ix],
+            )
+
+    def record(
+        self,
+        condition_ix: int,
+        x_sim: np.ndarray,
+        rdata: amici.ReturnData,
+        warm_started: bool,
+    ) -> None:
+        """Record the preequilibration of a simulation.
+
+        Counts a hit if the preequilibration was warm started, otherwise a
+        miss. The steady state is stored if the simulation succeeded,
+        replacing the oldest state if the maximum number is reached, or a
+        state at the same parameters.
+
+        Parameters
+        ----------
+        condition_ix:
+            Index of the condition.
+        x_sim:
+            Simulation parameters of the condition.
+        rdata:
+            The simulation result.
+        warm_started:
+            Whether the preequilibration was started from a stored state.
+        """
+        import amici
+
+        preeq_time = (
+            rdata["preeq_cpu_time"] + rdata["preeq_cpu_timeB"]
+        ) / 1000
+        x_ss = rdata["x_ss"]
+        with self._lock:
+            if warm_started:
+                self.n_hits += 1
+            else:
+                self.n_misses += 1
+            self._preeq_time[warm_started] += preeq_time
+            self._n_preeq[warm_started] += 1
+
+            if (
+                rdata["status"] != amici.AMICI_SUCCESS
+                or x_ss is None
+                or not np.isfinite(x_ss).all()
+            ):
+                return
+            sx_ss = rdata["sx_ss"]
+            entry = (
+                np.array(x_sim, dtype=float),
+                np.array(x_ss),
+                None if sx_ss is None else np.array(sx_ss),
+            )
+
+            data = (self._x, self._x_ss, self._sx_ss)
+            for values in data:
+                values.setdefault(condition_ix, [])
+            xs = self._x[condition_ix]
+            ix = next(
+                (ix for ix, x in enumerate(xs) if np.array_equal(x, entry[0])),
+                None,
+            )
+            if ix is None and len(xs) < self.max_size:
+                for values, value in zip(data, entry):
+                    values[condition_ix].append(value)
+            else:
+                if ix is None:
+                    ix = self._next.get(condition_ix, 0)
+                    self._next[condition_ix] = (ix + 1) % self.max_size
+                for values, value in zip(data, entry):
+                    values[condition_ix][ix] = value
+            self._trees.pop(condition_ix, None)
+
+
+def _get_shared_store(store_id: str, max_size: int) -> SteadyStateStore:
+    """Get the store with the given id in this process, or create it."""
+    store = _SHARED_STORES.get(store_id)
+    if store is None:
+        store = SteadyStateStore(max_size=max_size)
+        # register under the original id, such that further copies of the
+        #  same store are unpickled to this one
+        del _SHARED_STORES[store._id]
+        store._id = store_id
+        _SHARED_STORES[store_id] = store
+    return store
@@ -7,9 +7,23 @@ from typing import Optional, Union
 import numpy as np
 import pandas as pd
 
-from ..C import FVAL, GRAD, HESS, MODE_FUN, MODE_RES, RES, SRES, ModeType
+from ..C import (
+    FVAL,
+    GRAD,
+    HESS,
+    HESSP,
+    MODE_FUN,
+    MODE_RES,
+    RES,
+    SRES,
+    ModeType,
+)
 from ..history import NoHistory, create_history
-from .pre_post_process import FixedParametersProcessor, PrePostProcessor
+from .pre_post_process import (
+    FixedParametersProcessor,
+    ParameterIndexMap,
+    PrePostProcessor,
+)
 
 ResultDict = dict[str, Union[float, np.ndarray, dict]]
 
@@ -75,8 +89,12 @@ class ObjectiveBase(ABC):
 
     @property
     def has_hessp(self) -> bool:
-        """Check whether Hessian-vector product is defined."""
-        # Not supported yet
+        """Check whether Hessian-vector product is defined.
+
+        Objectives supporting Hessian-vector products, see
+        :meth:`get_hessp`, override this and
+        :meth:`call_unprocessed_hessp`. Default: False.
+        """
         return False
 
     @property
@@ -159,11 +177,142 @@ class ObjectiveBase(ABC):
             is flattened). If `return_dict`, then instead a dict is returned
             with function values and derivatives indicated by ids.
         """
+        x, x_full = self._preprocess_call(
+            x=x, sensi_orders=sensi_orders, mode=mode
+        )
+
+        # compute result
+        result = self.call_unprocessed(
+            x=x_full, sensi_orders=sensi_orders, mode=mode, **kwargs
+        )
+
+        return self._postprocess_call(
+            x=x,
+            sensi_orders=sensi_orders,
+            mode=mode,
+            result=result,
+            return_dict=return_dict,
+        )
+
+    async def call_async(
+        self,
+        x: np.ndarray,
+        sensi_orders: tuple[int, ...] = (0,),
+        mode: ModeType = MODE_FUN,
+        return_dict: bool = False,
+        **kwargs,
+    ) -> Union[float, np.ndarray, tuple, ResultDict]:
+        """
+        Obtain arbitrary sensitivities asynchronously.
+
+        Asynchronous counterpart of :meth:`__call__`, with identical
+        parameters and return values. The actual computation is delegated
+        to :meth:`call_unprocessed_async`. This allows objectives that
+        spend most of their time waiting, e.g. for remote or subprocess-based
+        simulations, to be evaluated concurrently in an event loop, see
+        :class:`pypesto.engine.AsyncioEngine`.
+        """
+        x, x_full = self._preprocess_call(
+            x=x, sensi_orders=sensi_orders, mode=mode
+        )
+
+        # compute result
+        result = await self.call_unprocessed_async(
+            x=x_full, sensi_orders=sensi_orders, mode=mode, **kwargs
+        )
+
+        return self._postprocess_call(
+            x=x,
+            sensi_orders=sensi_orders,
+            mode=mode,
+            result=result,
+            return_dict=return_dict,
+        )
+
+    def call_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...] = (0,),
+        mode: ModeType = MODE_FUN,
+        return_dict: bool = False,
+        **kwargs,
+    ) -> list[Union[float, np.ndarray, tuple, ResultDict]]:
+        """
+        Obtain arbitrary sensitivities for multiple parameter vectors.
+
+        Batched counterpart of :meth:`__call__`, e.g. for population-based
+        optimizers. The actual computation is delegated to
+        :meth:`call_unprocessed_batch`, which objectives can override to
+        evaluate all parameter vectors at once, e.g. vectorized or via a
+        single simulation call.
+
+        Parameters
+        ----------
+        X:
+            The parameter vectors, with shape `(n_vectors, n_parameters)`.
+        sensi_orders:
+            Specifies which sensitivities to compute, e.g. (0,1) -> fval, grad.
+        mode:
+            Whether to compute function values or residuals.
+        return_dict:
+            See :meth:`__call__`.
+
+        Returns
+        -------
+        results:
+            For each parameter vector, the result as returned by
+            :meth:`__call__`.
+        """
+        # copy parameter vectors to prevent side effects
+        X = np.array(X, dtype=float, ndmin=2)
+
+        self._check_call(sensi_orders=sensi_orders, mode=mode)
+
+        # pre-process
+        X_full = np.array([self.pre_post_processor.preprocess(x=x) for x in X])
+
+        # compute results
+        results = self.call_unprocessed_batch(
+            X=X_full, sensi_orders=sensi_orders, mode=mode, **kwargs
+        )
+
+        return [
+            self._postprocess_call(
+                x=x,
+                sensi_orders=sensi_orders,
+                mode=mode,
+                result=result,
+                return_dict=return_dict,
+            )
+            for x, result in zip(X, results)
+        ]
+
+    def _preprocess_call(
+        self,
+        x: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Check the call arguments and preprocess the parameter vector.
+
+        Returns
+        -------
+        A copy of the (reduced) parameter vector, and the full parameter
+        vector to be passed to :meth:`call_unprocessed`.
+        """
         # copy parameter vector to prevent side effects
         # np.array creates a copy of x already
         x = np.array(x)
 
-        # check input
+        self._check_call(sensi_orders=sensi_orders, mode=mode)
+
+        # pre-process
+        x_full = self.pre_post_processor.preprocess(x=x)
+
+        return x, x_full
+
+    def _check_call(self, sensi_orders: tuple[int, ...], mode: ModeType):
+        """Check that the objective supports the requested call."""
         if not self.check_mode(mode):
             raise ValueError(
                 f"This Objective cannot be called with mode" f"={mode}."
@@ -174,14 +323,15 @@ class ObjectiveBase(ABC):
                 f"sensi_orders= {sensi_orders} and mode={mode}."
             )
 
-        # pre-process
-        x_full = self.pre_post_processor.preprocess(x=x)
-
-        # compute result
-        result = self.call_unprocessed(
-            x=x_full, sensi_orders=sensi_orders, mode=mode, **kwargs
-        )
-
+    def _postprocess_call(
+        self,
+        x: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        result: ResultDict,
+        return_dict: bool,
+    ) -> Union[float, np.ndarray, tuple, ResultDict]:
+        """Postprocess the result, update the history, and format output."""
         # post-process
         result = self.pre_post_processor.postprocess(result=result)
 
@@ -224,6 +374,88 @@ class ObjectiveBase(ABC):
             A dict containing the results.
         """
 
+    def call_unprocessed_hessp(
+        self,
+        x: np.ndarray,
+        v: np.ndarray,
+        **kwargs,
+    ) -> ResultDict:
+        """
+        Compute a Hessian-vector product without pre- or post-processing.
+
+        Counterpart of :meth:`call_unprocessed` for :meth:`get_hessp`, to be
+        implemented by objectives supporting Hessian-vector products.
+
+        Parameters
+        ----------
+        x:
+            The parameters for which to evaluate the Hessian.
+        v:
+            The vector to multiply the Hessian with.
+
+        Returns
+        -------
+        result:
+            A dict containing the Hessian-vector product.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support Hessian-vector products."
+        )
+
+    async def call_unprocessed_async(
+        self,
+        x: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        **kwargs,
+    ) -> ResultDict:
+        """
+        Call objective function asynchronously, without pre-/post-processing.
+
+        Asynchronous counterpart of :meth:`call_unprocessed`. By default,
+        this calls :meth:`call_unprocessed`, blocking the event loop.
+        Objectives offering a truly asynchronous evaluation, e.g. awaiting a
+        simulation service, should override this method.
+        """
+        return self.call_unprocessed(
+            x=x, sensi_orders=sensi_orders, mode=mode, **kwargs
+        )
+
+    def call_unprocessed_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        **kwargs,
+    ) -> list[ResultDict]:
+        """
+        Call objective function for multiple parameter vectors.
+
+        Batched counterpart of :meth:`call_unprocessed`, without pre- or
+        post-processing and formatting. By default, this calls
+        :meth:`call_unprocessed` for each parameter vector.
+
+        Parameters
+        ----------
+        X:
+            The parameter vectors, with shape `(n_vectors, n_parameters)`.
+        sensi_orders:
+            Specifies which sensitivities to compute, e.g. (0,1) -> fval, grad.
+        mode:
+            Whether to compute function values or residuals.
+
+        Returns
+        -------
+        results:
+            For each parameter vector, a dict containing the results.
+        """
+        return [
+            self.call_unprocessed(
+                x=x, sensi_orders=sensi_orders, mode=mode, **kwargs
+            )
+            for x in X
+        ]
+
     def check_mode(self, mode: ModeType) -> bool:
         """
         Check if the objective is able to compute in the requested mode.
@@ -309,6 +541,30 @@ class ObjectiveBase(ABC):
 
         return True
 
+    def is_constant(
+        self,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        x_free_indices: Optional[Sequence[int]] = None,
+    ) -> bool:
+        """
+        Check if the requested values are independent of the parameters.
+
+        Used e.g. by :class:`pypesto.objective.AggregatedObjective` to
+        evaluate such objectives only once. Default: False.
+
+        Parameters
+        ----------
+        sensi_orders:
+            Specifies which sensitivities to compute, e.g. (0,1) -> fval, grad.
+        mode:
+            Whether to compute function values or residuals.
+        x_free_indices:
+            Indices of the parameters that vary between calls, all others are
+            fixed. If None, all parameters vary.
+        """
+        return False
+
     @staticmethod
     def output_to_tuple(
         sensi_orders: tuple[int, ...],
@@ -355,6 +611,40 @@ class ObjectiveBase(ABC):
         hess = self(x, (2,), MODE_FUN)
         return hess
 
+    def get_hessp(self, x: np.ndarray, v: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Get the product of the Hessian at x with a vector v.
+
+        Allows e.g. Newton-CG methods to avoid forming the Hessian. The
+        computation is delegated to :meth:`call_unprocessed_hessp`. The
+        history only counts these evaluations.
+
+        Parameters
+        ----------
+        x:
+            The parameters for which to evaluate the Hessian.
+        v:
+            The vector to multiply the Hessian with, of the same dimension
+            as `x`.
+        kwargs:
+            Passed to :meth:`call_unprocessed_hessp`.
+        """
+        if not self.has_hessp:
+            raise ValueError(
+                "This Objective cannot compute Hessian-vector products."
+            )
+        x, x_full = self._preprocess_call(x=x, sensi_orders=(), mode=MODE_FUN)
+        v_full = self.pre_post_processor.preprocess_direction(
+            np.asarray(v, dtype=float)
+        )
+
+        result = self.call_unprocessed_hessp(x=x_full, v=v_full, **kwargs)
+        result = self.pre_post_processor.postprocess(result=result)
+
+        self.history.update_hessp(x)
+
+        return result[HESSP]
+
     def get_res(self, x: np.ndarray) -> np.ndarray:
         """Get the residuals at x."""
         res = self(x, (0,), MODE_RES)
@@ -371,6 +661,7 @@ class ObjectiveBase(ABC):
         x_free_indices: Sequence[int],
         x_fixed_indices: Sequence[int],
         x_fixed_vals: Sequence[float],
+        index_map: Optional[ParameterIndexMap] = None,
     ):
         """
         Handle fixed parameters.
@@ -400,12 +691,27 @@ class ObjectiveBase(ABC):
         x_fixed_vals:
             Vector of the same length as x_fixed_indices, containing the values
             of the fixed parameters.
+        index_map:
+            Map of the free and fixed indices, e.g. of the problem. If the
+            current processor already uses this map, e.g. after it was
+            updated in place by fixing or freeing parameters, only the fixed
+            values are updated.
         """
+        processor = self.pre_post_processor
+        if (
+            index_map is not None
+            and isinstance(processor, FixedParametersProcessor)
+            and processor.index_map is index_map
+            and processor.dim_full == dim_full
+        ):
+            processor.set_fixed_values(x_fixed_indices, x_fixed_vals)
+            return
         self.pre_post_processor = FixedParametersProcessor(
             dim_full=dim_full,
             x_free_indices=x_free_indices,
             x_fixed_indices=x_fixed_indices,
             x_fixed_vals=x_fixed_vals,
+            index_map=index_map,
         )
 
     def check_grad_multi_eps(
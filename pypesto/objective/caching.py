@@ -0,0 +1,269 @@
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Union
+
+import numpy as np
+
+from ..C import FVAL, GRAD, HESS, MODE_FUN, MODE_RES, RES, SRES, ModeType
+from .base import ObjectiveBase, ResultDict
+
+# result keys holding the values of the different sensitivity orders
+_ORDER_KEYS = {
+    MODE_FUN: {0: FVAL, 1: GRAD, 2: HESS},
+    MODE_RES: {0: RES, 1: SRES},
+}
+
+
+class CachedObjective(ObjectiveBase):
+    """
+    Wrapper memoizing the evaluations of an objective.
+
+    Optimizers frequently evaluate the objective repeatedly at the same
+    parameters, e.g. when function values and gradients are requested
+    separately, or when the accepted point is re-evaluated. This wrapper
+    stores the results for the most recently evaluated parameter vectors,
+    and serves repeated requests from this cache. Requests for lower
+    sensitivity orders are also served from entries with higher orders,
+    e.g. a function value request from a cached (function value, gradient)
+    entry.
+
+    Results are identified by the exact parameter values and the mode. Calls
+    with additional keyword arguments, e.g. custom `edatas` for an
+    :class:`pypesto.objective.AmiciObjective`, are not cached.
+
+    Parameters
+    ----------
+    objective:
+        The objective to wrap.
+    max_size:
+        The maximum number of cached parameter vectors. The least recently
+        used entries are evicted first.
+    x_names:
+        Parameter names. Defaults to the names of `objective`.
+
+    Attributes
+    ----------
+    n_hits:
+        Number of evaluations served from the cache.
+    n_misses:
+        Number of evaluations delegated to the wrapped objective.
+    time_saved:
+        Total wall time in seconds that the evaluations served from the
+        cache originally took.
+    """
+
+    def __init__(
+        self,
+        objective: ObjectiveBase,
+        max_size: int = 128,
+        x_names: Sequence[str] = None,
+    ):
+        if not isinstance(objective, ObjectiveBase):
+            raise TypeError("objective must be an ObjectiveBase instance")
+        if max_size < 1:
+            raise ValueError("max_size must be positive.")
+        if x_names is None:
+            x_names = objective._x_names
+        super().__init__(x_names)
+        self.base_objective = objective
+        self.max_size = max_size
+
+        # (parameter bytes, mode) -> (results, evaluation time)
+        self._cache: OrderedDict[tuple[bytes, str], tuple[ResultDict, float]]
+        self._cache = OrderedDict()
+        self.n_hits: int = 0
+        self.n_misses: int = 0
+        self.time_saved: float = 0.0
+
+    def __deepcopy__(self, memodict=None):
+        """Create deepcopy of object, with an empty cache."""
+        other = CachedObjective(
+            copy.deepcopy(self.base_objective, memodict),
+            max_size=self.max_size,
+            x_names=copy.deepcopy(self._x_names, memodict),
+        )
+        for key in set(self.__dict__.keys()) - {
+            "base_objective",
+            "_cache",
+            "_x_names",
+        }:
+            other.__dict__[key] = copy.deepcopy(self.__dict__[key], memodict)
+        return other
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of evaluations served from the cache."""
+        n_total = self.n_hits + self.n_misses
+        if not n_total:
+            return 0.0
+        return self.n_hits / n_total
+
+    def clear(self) -> None:
+        """Empty the cache and reset the counters."""
+        self._cache.clear()
+        self.n_hits = 0
+        self.n_misses = 0
+        self.time_saved = 0.0
+
+    def initialize(self):
+        """See `ObjectiveBase` documentation."""
+        self.base_objective.initialize()
+
+    @property
+    def has_hessp(self) -> bool:
+        """Check whether Hessian-vector product is defined."""
+        return self.base_objective.has_hessp
+
+    def call_unprocessed_hessp(
+        self,
+        x: np.ndarray,
+        v: np.ndarray,
+        **kwargs,
+    ) -> ResultDict:
+        """See `ObjectiveBase` documentation. Not cached."""
+        return self.base_objective.call_unprocessed_hessp(x, v, **kwargs)
+
+    def check_mode(self, mode: ModeType) -> bool:
+        """See `ObjectiveBase` documentation."""
+        return self.base_objective.check_mode(mode)
+
+    def check_sensi_orders(
+        self,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+    ) -> bool:
+        """See `ObjectiveBase` documentation."""
+        return self.base_objective.check_sensi_orders(sensi_orders, mode)
+
+    def get_config(self) -> dict:
+        """Return basic information of the objective configuration."""
+        info = super().get_config()
+        info["max_size"] = self.max_size
+        info["base_objective"] = self.base_objective.get_config()
+        return info
+
+    def call_unprocessed(
+        self,
+        x: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        **kwargs,
+    ) -> ResultDict:
+        """
+        See `ObjectiveBase` for more documentation.
+
+        Serves the request from the cache, if possible, and evaluates the
+        wrapped objective otherwise.
+        """
+        if kwargs:
+            return self.base_objective.call_unprocessed(
+                x, sensi_orders, mode, **kwargs
+            )
+
+        key = _get_key(x, mode)
+        result = self._lookup(key, sensi_orders, mode)
+        if result is not None:
+            return result
+
+        start = time.perf_counter()
+        result = self.base_objective.call_unprocessed(x, sensi_orders, mode)
+        self._store(key, result, time.perf_counter() - start)
+        return _select(result, sensi_orders, mode)
+
+    def call_unprocessed_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        **kwargs,
+    ) -> list[ResultDict]:
+        """
+        See `ObjectiveBase` for more documentation.
+
+        Serves the requests from the cache, if possible, and evaluates the
+        remaining parameter vectors as one batch.
+        """
+        if kwargs:
+            return self.base_objective.call_unprocessed_batch(
+                X, sensi_orders, mode, **kwargs
+            )
+
+        keys = [_get_key(x, mode) for x in X]
+        results = [self._lookup(key, sensi_orders, mode) for key in keys]
+        i_misses = [
+            i_x for i_x, result in enumerate(results) if result is None
+        ]
+        if not i_misses:
+            return results
+
+        start = time.perf_counter()
+        miss_results = self.base_objective.call_unprocessed_batch(
+            X[i_misses], sensi_orders, mode
+        )
+        elapsed = (time.perf_counter() - start) / len(i_misses)
+        for i_x, result in zip(i_misses, miss_results):
+            self._store(keys[i_x], result, elapsed)
+            results[i_x] = _select(result, sensi_orders, mode)
+        return results
+
+    def _lookup(
+        self,
+        key: tuple[bytes, str],
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+    ) -> Union[ResultDict, None]:
+        """Get the requested results from the cache, if available.
+
+        Counts a miss if the results are not available.
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            result, elapsed = entry
+            order_keys = _ORDER_KEYS[mode]
+            if all(order_keys[order] in result for order in sensi_orders):
+                self._cache.move_to_end(key)
+                self.n_hits += 1
+                self.time_saved += elapsed
+                return _select(result, sensi_orders, mode)
+        self.n_misses += 1
+        return None
+
+    def _store(
+        self, key: tuple[bytes, str], result: ResultDict, elapsed: float
+    ) -> None:
+        """Add results to the cache, merging with results at the same key."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            cached_result, cached_elapsed = entry
+            result = {**cached_result, **result}
+            elapsed = max(elapsed, cached_elapsed)
+        self._cache[key] = (result, elapsed)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+
+def _get_key(x: np.ndarray, mode: ModeType) -> tuple[bytes, str]:
+    """Get the cache key for a parameter vector and mode."""
+    return np.ascontiguousarray(x, dtype=float).tobytes(), mode
+
+
+def _select(
+    result: ResultDict, sensi_orders: tuple[int, ...], mode: ModeType
+) -> ResultDict:
+    """Select the requested sensitivity orders from cached results.
+
+    Arrays are copied, such that the cache is not affected by modifications
+    of the returned results.
+    """
+    order_keys = _ORDER_KEYS[mode]
+    excluded = {
+        key for order, key in order_keys.items() if order not in sensi_orders
+    }
+    return {
+        key: value.copy() if isinstance(value, np.ndarray) else value
+        for key, value in result.items()
+        if key not in excluded
+    }
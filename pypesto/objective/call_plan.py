@@ -0,0 +1,185 @@
+import numpy as np
+import scipy.sparse
+
+from ..C import FVAL, GRAD, HESS, MODE_FUN, RES, SRES, ModeType
+from ..history import NoHistory
+from .base import ObjectiveBase, ResultDict
+from .pre_post_process import FixedParametersProcessor, PrePostProcessor
+
+
+class CallPlan:
+    """
+    Low-overhead evaluation of an objective for fixed call arguments.
+
+    Each call of :meth:`pypesto.objective.ObjectiveBase.__call__` checks
+    the requested mode and sensitivity orders, copies the parameter vector,
+    maps it to the full parameter vector, updates the history and formats
+    the output. For cheap objectives, e.g. priors, analytic functions or
+    surrogate models evaluated many times in sampling, this overhead
+    dominates the computation time.
+
+    A call plan performs these steps once for given `sensi_orders` and
+    `mode`, and for the current fixed parameters of the objective:
+
+    * The call is validated on construction only.
+    * Fixed parameter values are written to a preallocated full parameter
+      vector once, which is reused for all evaluations.
+    * The history is skipped if it is a
+      :class:`pypesto.history.NoHistory`.
+
+    The plan checks on each call whether the fixed parameters of the
+    objective changed, e.g. via :meth:`pypesto.Problem.fix_parameters`, and
+    is rebuilt if necessary.
+
+    Note that, as the full parameter vector is reused,
+    :meth:`pypesto.objective.ObjectiveBase.call_unprocessed` must not keep
+    references to it. If no parameters are fixed, the passed parameter
+    vector is forwarded without copying.
+
+    Objectives overriding :meth:`pypesto.objective.ObjectiveBase.__call__`,
+    or using a pre/post processor other than
+    :class:`pypesto.objective.pre_post_process.PrePostProcessor` or
+    :class:`pypesto.objective.pre_post_process.FixedParametersProcessor`,
+    are evaluated via their `__call__` instead.
+
+    Parameters
+    ----------
+    objective:
+        The objective to evaluate.
+    sensi_orders:
+        The sensitivity orders to compute.
+    mode:
+        Whether to compute function values or residuals.
+    return_dict:
+        See :meth:`pypesto.objective.ObjectiveBase.__call__`.
+    """
+
+    def __init__(
+        self,
+        objective: ObjectiveBase,
+        sensi_orders: tuple[int, ...] = (0,),
+        mode: ModeType = MODE_FUN,
+        return_dict: bool = False,
+    ):
+        self.objective: ObjectiveBase = objective
+        self.sensi_orders: tuple[int, ...] = tuple(sensi_orders)
+        self.mode: ModeType = mode
+        self.return_dict: bool = return_dict
+
+        if mode == MODE_FUN:
+            keys = (FVAL, GRAD, HESS)
+        else:
+            keys = (RES, SRES)
+        self._output_keys: tuple[str, ...] = tuple(
+            keys[order] for order in self.sensi_orders
+        )
+        self._build()
+
+    def _build(self) -> None:
+        """Validate the call and set up the parameter mapping."""
+        objective = self.objective
+        self._processor = processor = objective.pre_post_processor
+        self._revision = getattr(processor, "revision", None)
+        # whether the objective can be called bypassing `__call__`
+        self._direct: bool = type(processor) in (
+            PrePostProcessor,
+            FixedParametersProcessor,
+        ) and (type(objective).__call__ is ObjectiveBase.__call__)
+        # whether results need to be reduced to the free parameters
+        self._fixed: bool = False
+        if not self._direct:
+            return
+
+        objective._check_call(sensi_orders=self.sensi_orders, mode=self.mode)
+        if type(processor) is FixedParametersProcessor:
+            self._fixed = True
+            self._index_map = processor.index_map
+            self._x_full = np.empty(processor.dim_full)
+            self._x_full[processor.x_fixed_indices] = processor.x_fixed_vals
+            self._x_free_indices = processor.x_free_indices
+            self._hess_indices = np.ix_(
+                processor.x_free_indices, processor.x_free_indices
+            )
+
+    def __call__(self, x: np.ndarray, **kwargs):
+        """
+        Evaluate the objective.
+
+        Parameters
+        ----------
+        x:
+            The parameters for which to evaluate the objective function.
+        kwargs:
+            Passed to
+            :meth:`pypesto.objective.ObjectiveBase.call_unprocessed`.
+
+        Returns
+        -------
+        result:
+            As returned by :meth:`pypesto.objective.ObjectiveBase.__call__`.
+        """
+        objective = self.objective
+        if (
+            objective.pre_post_processor is not self._processor
+            or getattr(self._processor, "revision", None) != self._revision
+        ):
+            self._build()
+
+        if not self._direct:
+            return objective(
+                x,
+                sensi_orders=self.sensi_orders,
+                mode=self.mode,
+                return_dict=self.return_dict,
+                **kwargs,
+            )
+
+        if self._fixed:
+            x_full = self._index_map.to_full(
+                x, fill_value=None, out=self._x_full
+            )
+        else:
+            x_full = x
+
+        result = objective.call_unprocessed(
+            x=x_full, sensi_orders=self.sensi_orders, mode=self.mode, **kwargs
+        )
+        result = self._postprocess(result)
+
+        history = objective.history
+        if type(history) is not NoHistory:
+            history.update(
+                x=np.array(x),
+                sensi_orders=self.sensi_orders,
+                mode=self.mode,
+                result=result,
+            )
+
+        if self.return_dict:
+            return result
+        if len(self._output_keys) == 1:
+            return result[self._output_keys[0]]
+        return tuple(result[key] for key in self._output_keys)
+
+    def _postprocess(self, result: ResultDict) -> ResultDict:
+        """Convert derivatives to arrays and reduce to free parameters.
+
+        Equivalent to
+        :meth:`pypesto.objective.pre_post_process.PrePostProcessor.postprocess`,
+        but avoids copying arrays that are not reduced.
+        """
+        for key in (GRAD, HESS, RES, SRES):
+            value = result.get(key)
+            if value is None:
+                continue
+            if not scipy.sparse.issparse(value):
+                value = np.asarray(value)
+            if self._fixed:
+                if key == GRAD and value.size == self._x_full.size:
+                    value = value[self._x_free_indices]
+                elif key == HESS and value.shape[0] == self._x_full.size:
+                    value = value[self._hess_indices]
+                elif key == SRES and value.shape[-1] == self._x_full.size:
+                    value = value[:, self._x_free_indices]
+            result[key] = value
+        return result
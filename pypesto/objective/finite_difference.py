@@ -2,12 +2,24 @@
 
 import copy
 import logging
+import os
 from typing import Callable, Union
 
 import numpy as np
 
-from ..C import FVAL, GRAD, HESS, MODE_FUN, MODE_RES, RES, SRES, ModeType
+from ..C import (
+    FVAL,
+    GRAD,
+    HESS,
+    HESSP,
+    MODE_FUN,
+    MODE_RES,
+    RES,
+    SRES,
+    ModeType,
+)
 from .base import ObjectiveBase, ResultDict
+from .pool import ObjectivePool
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +103,7 @@ class FDDelta:
         fval: Union[float, np.ndarray, None],
         fun: Callable,
         fd_method: str,
+        fun_batch: Union[Callable, None] = None,
     ) -> None:
         """Update delta if update conditions are met.
 
@@ -106,6 +119,10 @@ class FDDelta:
         fd_method:
             FD method employed by
             :class:`pypesto.objective.finite_difference.FD`, see there.
+        fun_batch:
+            Batched version of `fun`, returning the values for an array of
+            parameter vectors of shape (n_points, n_par). If not None, the
+            stencils of all test step sizes are evaluated in one batch.
         """
         # scalar to vector
         if isinstance(self.delta, float):
@@ -140,7 +157,9 @@ class FDDelta:
         # update reference point
         self.x0 = x
         # actually update
-        self._update(x=x, fval=fval, fun=fun, fd_method=fd_method)
+        self._update(
+            x=x, fval=fval, fun=fun, fd_method=fd_method, fun_batch=fun_batch
+        )
 
         if self.delta.shape != x.shape:
             # this should not happen
@@ -152,6 +171,7 @@ class FDDelta:
         fval: Union[float, np.ndarray],
         fun: Callable,
         fd_method: str,
+        fun_batch: Union[Callable, None] = None,
     ) -> None:
         """
         Actually update. Wants to be called in `update` explicitly.
@@ -162,21 +182,16 @@ class FDDelta:
         The parameters are the same as for
         :func:`pypesto.objective.finite_difference.FDDelta.update`.
         """
-        # calculate gradients for all deltas for all parameters
-        nablas = []
-        # iterate over deltas
-        for delta in self.test_deltas:
-            # calculate Jacobian with step size delta
-            delta_vec = delta * np.ones_like(x)
-            nabla = fd_nabla_1(
-                x=x,
-                fval=fval,
-                f_fval=fun,
-                delta_vec=delta_vec,
-                fd_method=fd_method,
-            )
-
-            nablas.append(nabla)
+        # calculate Jacobians for all deltas for all parameters, with all
+        #  stencils evaluated together
+        nablas = _fd_nabla_1_multi(
+            x=x,
+            fval=fval,
+            f_fval=fun,
+            delta_vecs=[delta * np.ones_like(x) for delta in self.test_deltas],
+            fd_method=fd_method,
+            f_batch=fun_batch,
+        )
 
         # shape (n_delta, n_par, ...)
         nablas = np.array(nablas)
@@ -281,9 +296,53 @@ class FD(ObjectiveBase):
         forward or backward differences. The latter two require only roughly
         half as many function evaluations, are however less accurate than
         central (O(x) vs O(x**2)).
+        Complex step derivatives, `Im(f(x + i * delta)) / delta`, are not
+        subject to cancellation errors, thus accurate also for very small
+        step sizes, and require as many evaluations as forward differences.
+        They require the objective to support complex parameters. 2nd order
+        derivatives are then calculated via a mixed complex-real stencil.
     x_names:
         Parameter names that can be optionally used in, e.g., history or
         gradient checks.
+    executor:
+        How to evaluate the perturbed parameter vectors of an FD stencil.
+        If None (default), as one batch via
+        :meth:`pypesto.objective.ObjectiveBase.call_unprocessed_batch`,
+        which objectives may implement efficiently. If "thread" or
+        "process", the stencil is split into `n_workers` chunks that are
+        evaluated concurrently, see
+        :class:`pypesto.objective.pool.ObjectivePool`.
+    n_workers:
+        Maximum number of threads or processes for `executor`. Defaults to
+        the number of CPUs.
+    res_sparsity:
+        Sparsity pattern of the residual sensitivities, a boolean array of
+        shape (n_res, n_par) that is True where a residual may depend on a
+        parameter, with respect to all parameters including fixed ones.
+        Parameters not affecting the same residuals are then perturbed
+        together (Curtis-Powell-Reid), see
+        :func:`pypesto.objective.finite_difference.perturbation_groups`.
+        If "detect", the pattern is taken from the non-zero entries of dense
+        FD approximations at the first evaluated point and at
+        `FD.DETECT_N_POINTS - 1` randomly perturbed points, such that
+        entries vanishing incidentally at one point are kept. The detected
+        pattern is logged, and stored in this attribute. Set the attribute
+        to "detect" again to repeat the detection, e.g. in a different
+        region of the parameter space. If None (default), dense FDs are
+        used.
+    hess_sparsity:
+        Sparsity pattern of the Hessian, of shape (n_par, n_par), used if
+        the Hessian is calculated via FDs of gradients. Similar to
+        `res_sparsity`.
+    hessp:
+        Derivative method for Hessian-vector products (see above). These
+        are calculated via FDs of the gradients along the vector, with step
+        sizes `delta_grad`, thus require the objective to provide gradients.
+
+    Within one call, each parameter vector is evaluated at most once, also
+    if shared by several stencils, e.g. by the diagonal and off-diagonal
+    entries of forward or backward 2nd order FDs, or by the gradient and
+    the Hessian stencils.
 
     Examples
     --------
@@ -302,7 +361,14 @@ class FD(ObjectiveBase):
     CENTRAL = "central"
     FORWARD = "forward"
     BACKWARD = "backward"
-    METHODS = [CENTRAL, FORWARD, BACKWARD]
+    COMPLEX = "complex"
+    METHODS = [CENTRAL, FORWARD, BACKWARD, COMPLEX]
+
+    # sparsity pattern detection
+    DETECT = "detect"
+    # number of points, and relative perturbation of the additional points
+    DETECT_N_POINTS = 3
+    DETECT_PERTURBATION = 1e-2
 
     def __init__(
         self,
@@ -316,12 +382,18 @@ class FD(ObjectiveBase):
         delta_res: Union[FDDelta, float, np.ndarray, str] = 1e-6,
         method: str = CENTRAL,
         x_names: list[str] = None,
+        executor: Union[str, None] = None,
+        n_workers: Union[int, None] = None,
+        res_sparsity: Union[np.ndarray, str, None] = None,
+        hess_sparsity: Union[np.ndarray, str, None] = None,
+        hessp: Union[bool, None] = None,
     ):
         super().__init__(x_names=x_names)
         self.obj: ObjectiveBase = obj
         self.grad: Union[bool, None] = grad
         self.hess: Union[bool, None] = hess
         self.sres: Union[bool, None] = sres
+        self.hessp: Union[bool, None] = hessp
         self.hess_via_fval: bool = hess_via_fval
         self.delta_fun: FDDelta = to_delta(delta_fun)
         self.delta_grad: FDDelta = to_delta(delta_grad)
@@ -333,6 +405,24 @@ class FD(ObjectiveBase):
                 f"Method must be one of {FD.METHODS}.",
             )
 
+        self.executor: Union[str, None] = executor
+        self.n_workers: Union[int, None] = n_workers
+        self._pool: Union[ObjectivePool, None] = None
+        if executor is not None:
+            self._pool = ObjectivePool(executor=executor, n_workers=n_workers)
+
+        for sparsity in (res_sparsity, hess_sparsity):
+            if isinstance(sparsity, str) and sparsity != FD.DETECT:
+                raise ValueError(
+                    f"Sparsity must be an array, None or {FD.DETECT}."
+                )
+        self.res_sparsity: Union[np.ndarray, str, None] = res_sparsity
+        self.hess_sparsity: Union[np.ndarray, str, None] = hess_sparsity
+        # sparsity attribute -> (sparsity pattern, perturbation groups)
+        self._perturbation_groups: dict[
+            str, tuple[np.ndarray, list[np.ndarray]]
+        ] = {}
+
     def __deepcopy__(
         self,
         memodict: dict = None,
@@ -358,6 +448,13 @@ class FD(ObjectiveBase):
         """Check whether Hessian is defined."""
         return self.hess is not False and self.obj.has_fun
 
+    @property
+    def has_hessp(self) -> bool:
+        """Check whether Hessian-vector product is defined."""
+        if self.hessp is False:
+            return False
+        return self.obj.has_grad or (self.hessp is None and self.obj.has_hessp)
+
     @property
     def has_res(self) -> bool:
         """Check whether residuals are defined."""
@@ -394,6 +491,59 @@ class FD(ObjectiveBase):
 
         return result
 
+    def call_unprocessed_hessp(
+        self,
+        x: np.ndarray,
+        v: np.ndarray,
+        **kwargs,
+    ) -> ResultDict:
+        """
+        See `ObjectiveBase` documentation.
+
+        Uses the Hessian-vector product of the objective if available and
+        `hessp` is None, and FDs of the gradient along `v` otherwise.
+        """
+        if self.hessp is None and self.obj.has_hessp:
+            return self.obj.call_unprocessed_hessp(x, v, **kwargs)
+
+        def f_grad(x):
+            """Short-hand to get a gradient value."""
+            return self.obj.call_unprocessed(
+                x=x, sensi_orders=(1,), mode=MODE_FUN, **kwargs
+            )[GRAD]
+
+        f_batch = self._get_f_batch(GRAD, (1,), MODE_FUN, {}, kwargs)
+
+        self.delta_grad.update(
+            x=x,
+            fval=None,
+            fun=f_grad,
+            fd_method=self.method,
+            fun_batch=f_batch,
+        )
+
+        if not np.any(v):
+            return {HESSP: np.zeros_like(x, dtype=float)}
+
+        # scale the step along v such that no parameter is perturbed by more
+        #  than its step size
+        delta_vec = self.delta_grad.get()
+        nonzero = v != 0
+        delta = np.min(delta_vec[nonzero] / np.abs(v[nonzero]))
+        step = delta * v
+
+        if self.method == FD.CENTRAL:
+            gp, gm = f_batch(np.array([x + step / 2, x - step / 2]))
+        elif self.method == FD.FORWARD:
+            gp, gm = f_batch(np.array([x + step, x]))
+        elif self.method == FD.BACKWARD:
+            gp, gm = f_batch(np.array([x, x - step]))
+        else:
+            (gp,) = f_batch(np.array([x + 1j * step]))
+            return {HESSP: np.imag(gp) / delta}
+
+        return {HESSP: (gp - gm) / delta}
+
     def _call_mode_fun(
         self,
         x: np.ndarray,
@@ -438,18 +588,40 @@ class FD(ObjectiveBase):
                 x=x, sensi_orders=(1,), mode=MODE_FUN, **kwargs
             )[GRAD]
 
+        # evaluations at the stencil points of this call
+        memo = {}
+
         # update delta vectors
         if grad_via_fd or hess_via_fd_fval:
             # note: we use the same delta for 1st and 2nd order approximations
             # this may be not ideal
             self.delta_fun.update(
-                x=x, fval=result.get(FVAL), fun=f_fval, fd_method=self.method
+                x=x,
+                fval=result.get(FVAL),
+                fun=f_fval,
+                fd_method=self.method,
+                fun_batch=self._get_f_batch(FVAL, (0,), MODE_FUN, {}, kwargs),
             )
         if hess_via_fd_grad:
             self.delta_grad.update(
-                x=x, fval=result.get(GRAD), fun=f_grad, fd_method=self.method
+                x=x,
+                fval=result.get(GRAD),
+                fun=f_grad,
+                fd_method=self.method,
+                fun_batch=self._get_f_batch(GRAD, (1,), MODE_FUN, {}, kwargs),
             )
 
+        # if the gradient and the Hessian stencils coincide, evaluate
+        #  function values and gradients together
+        sensi_orders_fval, sensi_orders_grad = (0,), (1,)
+        if (
+            grad_via_fd
+            and hess_via_fd_grad
+            and self.hess_sparsity is None
+            and np.array_equal(self.delta_fun.get(), self.delta_grad.get())
+        ):
+            sensi_orders_fval = sensi_orders_grad = (0, 1)
+
         # calculate gradient
         if grad_via_fd:
             result[GRAD] = fd_nabla_1(
@@ -458,6 +630,9 @@ class FD(ObjectiveBase):
                 f_fval=f_fval,
                 delta_vec=self.delta_fun.get(),
                 fd_method=self.method,
+                f_batch=self._get_f_batch(
+                    FVAL, sensi_orders_fval, MODE_FUN, memo, kwargs
+                ),
             )
 
         # calculate Hessian
@@ -469,14 +644,20 @@ class FD(ObjectiveBase):
                     f_fval=f_fval,
                     delta_vec=self.delta_fun.get(),
                     fd_method=self.method,
+                    f_batch=self._get_f_batch(
+                        FVAL, sensi_orders_fval, MODE_FUN, memo, kwargs
+                    ),
                 )
             else:
-                hess = fd_nabla_1(
+                hess = self._fd_jacobian(
+                    sparsity_attr="hess_sparsity",
                     x=x,
                     fval=result.get(GRAD),
                     f_fval=f_grad,
-                    delta_vec=self.delta_fun.get(),
-                    fd_method=self.method,
+                    delta_vec=self.delta_grad.get(),
+                    f_batch=self._get_f_batch(
+                        GRAD, sensi_orders_grad, MODE_FUN, memo, kwargs
+                    ),
                 )
                 # make it symmetric
                 result[HESS] = 0.5 * (hess + hess.T)
@@ -510,24 +691,204 @@ class FD(ObjectiveBase):
                 x=x, sensi_orders=(0,), mode=MODE_RES, **kwargs
             )[RES]
 
+        f_batch = self._get_f_batch(RES, (0,), MODE_RES, {}, kwargs)
+
         # update delta vector
         self.delta_res.update(
-            x=x, fval=result.get(RES), fun=f_res, fd_method=self.method
+            x=x,
+            fval=result.get(RES),
+            fun=f_res,
+            fd_method=self.method,
+            fun_batch=f_batch,
         )
 
         # sres
-        sres = fd_nabla_1(
+        sres = self._fd_jacobian(
+            sparsity_attr="res_sparsity",
             x=x,
             fval=result.get(RES),
             f_fval=f_res,
             delta_vec=self.delta_res.get(),
-            fd_method=self.method,
+            f_batch=f_batch,
         )
         # sres should have shape (n_res, n_par)
         result[SRES] = sres.T
 
         return result
 
+    def _fd_jacobian(
+        self,
+        sparsity_attr: str,
+        x: np.ndarray,
+        fval: Union[np.ndarray, None],
+        f_fval: Callable,
+        delta_vec: np.ndarray,
+        f_batch: Callable,
+    ) -> np.ndarray:
+        """Calculate a FD Jacobian, exploiting its sparsity pattern.
+
+        The pattern is taken from the attribute `sparsity_attr`, and
+        detected and stored there if requested.
+
+        Returns
+        -------
+        The Jacobian, transposed, see :func:`fd_nabla_1`.
+        """
+        sparsity = getattr(self, sparsity_attr)
+        if sparsity is None or isinstance(sparsity, str):
+            nabla = fd_nabla_1(
+                x=x,
+                fval=fval,
+                f_fval=f_fval,
+                delta_vec=delta_vec,
+                fd_method=self.method,
+                f_batch=f_batch,
+            )
+            if sparsity == FD.DETECT:
+                setattr(
+                    self,
+                    sparsity_attr,
+                    self._detect_sparsity(
+                        sparsity_attr=sparsity_attr,
+                        nabla=nabla,
+                        x=x,
+                        f_fval=f_fval,
+                        delta_vec=delta_vec,
+                        f_batch=f_batch,
+                    ),
+                )
+            return nabla
+
+        cached = self._perturbation_groups.get(sparsity_attr)
+        if cached is None or cached[0] is not sparsity:
+            cached = (sparsity, perturbation_groups(sparsity))
+            self._perturbation_groups[sparsity_attr] = cached
+        return fd_nabla_1(
+            x=x,
+            fval=fval,
+            f_fval=f_fval,
+            delta_vec=delta_vec,
+            fd_method=self.method,
+            f_batch=f_batch,
+            sparsity=sparsity,
+            groups=cached[1],
+        )
+
+    def _detect_sparsity(
+        self,
+        sparsity_attr: str,
+        nabla: np.ndarray,
+        x: np.ndarray,
+        f_fval: Callable,
+        delta_vec: np.ndarray,
+        f_batch: Callable,
+    ) -> np.ndarray:
+        """Detect a Jacobian sparsity pattern.
+
+        Takes the union of the non-zero entries of the dense FD Jacobian
+        `nabla` at `x` and at randomly perturbed points.
+
+        Returns
+        -------
+        The sparsity pattern, of shape (n_out, n_par).
+        """
+        pattern = nabla != 0
+        rng = np.random.default_rng(0)
+        for _ in range(FD.DETECT_N_POINTS - 1):
+            x_perturbed = x + FD.DETECT_PERTURBATION * (
+                1 + np.abs(x)
+            ) * rng.uniform(-1, 1, size=x.shape)
+            pattern |= (
+                fd_nabla_1(
+                    x=x_perturbed,
+                    fval=None,
+                    f_fval=f_fval,
+                    delta_vec=delta_vec,
+                    fd_method=self.method,
+                    f_batch=f_batch,
+                )
+                != 0
+            )
+        pattern = pattern.T
+        logger.info(
+            f"Detected {sparsity_attr} with {pattern.sum()} of "
+            f"{pattern.size} entries non-zero. Set it to "
+            f'"{FD.DETECT}" to detect it again.'
+        )
+        logger.debug(
+            f"Non-zero entries of {sparsity_attr}: "
+            f"{np.argwhere(pattern).tolist()}"
+        )
+        return pattern
+
+    def _get_f_batch(
+        self,
+        key: str,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        memo: dict[bytes, ResultDict],
+        kwargs: dict,
+    ) -> Callable:
+        """Get a function returning `key` for a batch of parameter vectors.
+
+        Evaluations are stored in `memo`, by parameter vector, and served
+        from there if the requested value is available. Thus, stencils
+        sharing `memo` evaluate shared parameter vectors only once. `None`
+        values count as unavailable, and do not replace stored values.
+        """
+
+        def f_batch(X: np.ndarray) -> list:
+            point_keys = [x.tobytes() for x in X]
+            i_misses = [
+                i_x
+                for i_x, point_key in enumerate(point_keys)
+                if memo.get(point_key, {}).get(key) is None
+            ]
+            if i_misses:
+                results = self._evaluate_batch(
+                    X[i_misses], sensi_orders, mode, kwargs
+                )
+                for i_x, result in zip(i_misses, results):
+                    memo[point_keys[i_x]] = {
+                        **memo.get(point_keys[i_x], {}),
+                        **{k: v for k, v in result.items() if v is not None},
+                    }
+            return [memo[point_key][key] for point_key in point_keys]
+
+        return f_batch
+
+    def _evaluate_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        kwargs: dict,
+    ) -> list[ResultDict]:
+        """Evaluate the objective for a batch of parameter vectors.
+
+        Splits the batch into chunks evaluated in the pool, if any.
+        """
+        if self._pool is None or len(X) < 2:
+            return self.obj.call_unprocessed_batch(
+                X, sensi_orders=sensi_orders, mode=mode, **kwargs
+            )
+
+        n_chunks = min(len(X), self.n_workers or os.cpu_count() or 1)
+        calls = [
+            (
+                0,
+                "call_unprocessed_batch",
+                {"X": X_chunk, "sensi_orders": sensi_orders, "mode": mode}
+                | kwargs,
+            )
+            for X_chunk in np.array_split(X, n_chunks)
+        ]
+        return [
+            result
+            for results, _ in self._pool.map([self.obj], calls)
+            for result in results
+        ]
+
     def _call_from_obj_fun(
         self,
         x: np.ndarray,
@@ -609,6 +970,9 @@ def fd_nabla_1(
     f_fval: Callable,
     delta_vec: np.ndarray,
     fd_method: str,
+    f_batch: Union[Callable, None] = None,
+    sparsity: Union[np.ndarray, None] = None,
+    groups: Union[list[np.ndarray], None] = None,
 ) -> np.ndarray:
     """Calculate FD approximation to 1st order derivative (Jacobian/Gradient).
 
@@ -619,8 +983,17 @@ def fd_nabla_1(
     f_fval: Function returning function values. Scalar- or vector-valued.
     delta_vec: Step size vector, shape (n_par,).
     fd_method: FD method.
-
-    Keyword arguments are passed on to the objective.
+    f_batch:
+        Batched version of `f_fval`, returning the function values for an
+        array of parameter vectors of shape (n_points, n_par). If not None,
+        used instead of `f_fval` to evaluate the stencil in one batch.
+    sparsity:
+        Sparsity pattern of the Jacobian of the vector-valued `f_fval`,
+        shape (n_out, n_par). If not None, parameters are perturbed together
+        in `groups`, and entries outside the pattern are zero.
+    groups:
+        Groups of parameters not affecting the same outputs, computed via
+        :func:`perturbation_groups` from `sparsity` if None.
 
     Returns
     -------
@@ -628,33 +1001,108 @@ def fd_nabla_1(
         The FD approximation to the 1st order derivatives.
         Shape (n_par, ...) with ndim > 1 if `f_fval` is not scalar-valued.
     """
-    # parameter dimension
-    n_par = len(x)
+    return _fd_nabla_1_multi(
+        x=x,
+        fval=fval,
+        f_fval=f_fval,
+        delta_vecs=[delta_vec],
+        fd_method=fd_method,
+        f_batch=f_batch,
+        sparsity=sparsity,
+        groups=groups,
+    )[0]
+
+
+def _fd_nabla_1_multi(
+    x: np.ndarray,
+    fval: float,
+    f_fval: Callable,
+    delta_vecs: list[np.ndarray],
+    fd_method: str,
+    f_batch: Union[Callable, None] = None,
+    sparsity: Union[np.ndarray, None] = None,
+    groups: Union[list[np.ndarray], None] = None,
+) -> np.ndarray:
+    """Calculate FD approximations to 1st order derivatives for step sizes.
 
-    # calculate value at x only once if needed
-    if fval is None and fd_method in [FD.FORWARD, FD.BACKWARD]:
-        fval = f_fval(x)
+    The stencils of all step size vectors are evaluated together. See
+    :func:`fd_nabla_1` for the parameters.
+
+    Returns
+    -------
+    nablas:
+        The FD approximations, shape (n_delta, n_par, ...).
+    """
+    if fd_method not in FD.METHODS:
+        raise ValueError("Method not recognized.")
 
-    nabla_1 = []
-    for ix in range(n_par):
-        delta_val = delta_vec[ix]
-        delta = delta_val * unit_vec(dim=n_par, ix=ix)
+    # parameter dimension
+    n_par = len(x)
 
+    # parameters perturbed together
+    if sparsity is None:
+        groups = [np.array([ix]) for ix in range(n_par)]
+    else:
+        if sparsity.shape[1] != n_par:
+            raise ValueError(
+                f"Sparsity pattern of shape {sparsity.shape} does not match "
+                f"the number of parameters {n_par}."
+            )
+        if groups is None:
+            groups = perturbation_groups(sparsity)
+    n_groups = len(groups)
+
+    # stencil points, with the reference point first
+    points = [x]
+    for delta_vec in delta_vecs:
+        steps = np.zeros((n_groups, n_par))
+        for i_group, group in enumerate(groups):
+            steps[i_group, group] = delta_vec[group]
         if fd_method == FD.CENTRAL:
-            fp = f_fval(x + delta / 2)
-            fm = f_fval(x - delta / 2)
+            points.extend(x + steps / 2)
+            points.extend(x - steps / 2)
         elif fd_method == FD.FORWARD:
-            fp = f_fval(x + delta)
-            fm = fval
+            points.extend(x + steps)
         elif fd_method == FD.BACKWARD:
-            fp = fval
-            fm = f_fval(x - delta)
+            points.extend(x - steps)
         else:
-            raise ValueError("Method not recognized.")
+            points.extend(x + 1j * steps)
+
+    # calculate value at x only if needed
+    if fd_method in [FD.CENTRAL, FD.COMPLEX] or fval is not None:
+        values = [fval] + _evaluate_points(points[1:], f_fval, f_batch)
+    else:
+        values = _evaluate_points(points, f_fval, f_batch)
+    fval, values = values[0], values[1:]
+
+    nablas = []
+    for i_delta, delta_vec in enumerate(delta_vecs):
+        if fd_method == FD.CENTRAL:
+            offset = 2 * n_groups * i_delta
+            fps = values[offset : offset + n_groups]
+            fms = values[offset + n_groups : offset + 2 * n_groups]
+            diffs = [fp - fm for fp, fm in zip(fps, fms)]
+        else:
+            fs = values[n_groups * i_delta : n_groups * (i_delta + 1)]
+            if fd_method == FD.FORWARD:
+                diffs = [fp - fval for fp in fs]
+            elif fd_method == FD.BACKWARD:
+                diffs = [fval - fm for fm in fs]
+            else:
+                diffs = [np.imag(f) for f in fs]
 
-        nabla_1.append((fp - fm) / delta_val)
+        nabla = [None] * n_par
+        for group, diff in zip(groups, diffs):
+            for ix in group:
+                if sparsity is None:
+                    nabla[ix] = diff / delta_vec[ix]
+                else:
+                    nabla[ix] = (
+                        np.where(sparsity[:, ix], diff, 0) / (delta_vec[ix])
+                    )
+        nablas.append(np.array(nabla))
 
-    return np.array(nabla_1)
+    return np.array(nablas)
 
 
 def fd_nabla_2(
@@ -663,9 +1111,14 @@ def fd_nabla_2(
     f_fval: Callable,
     delta_vec: np.ndarray,
     fd_method: str,
+    f_batch: Union[Callable, None] = None,
 ) -> np.ndarray:
     """Calculate FD approximation to 2nd order derivatives (e.g. Hessian).
 
+    Only the diagonal and lower triangular entries are approximated, the
+    upper ones follow from symmetry. Stencil points shared by several
+    entries are evaluated only once.
+
     Parameters
     ----------
     x: Parameter vector, shape (n_par,).
@@ -673,6 +1126,8 @@ def fd_nabla_2(
     f_fval: Function returning function values.
     delta_vec: Step size vector, shape (n_par,).
     fd_method: FD method.
+    f_batch:
+        Batched version of `f_fval`, see :func:`fd_nabla_1`.
 
     Returns
     -------
@@ -681,66 +1136,155 @@ def fd_nabla_2(
         Shape (n_par, n_par, ...) with ndim > 2 if `f_fval` is not
         scalar-valued.
     """
+    if fd_method not in FD.METHODS:
+        raise ValueError(f"Method {fd_method} not recognized.")
+
     # parameter dimension
     n_par = len(x)
+    steps = np.diag(delta_vec)
 
-    # needed for diagonal entries at least
-    if fval is None:
-        fval = f_fval(x)
+    # stencil points, with the reference point first, needed for diagonal
+    #  entries at least
+    points = [x]
 
-    # create empty matrix
-    nabla_2 = []
-    for _ in range(n_par):
-        nabla_2.append([None] * n_par)
+    def add(point: np.ndarray) -> int:
+        """Add a stencil point and return its index."""
+        points.append(point)
+        return len(points) - 1
 
-    # iterate over all parameter index tuples
+    # point indices, (f2p, fc, f2m) for diagonal and (fpp, fpm, fmp, fmm)
+    #  for off-diagonal entries, or (fp, fm) for complex steps
+    stencils = {}
     for ix1 in range(n_par):
-        delta1_val = delta_vec[ix1]
-        delta1 = delta1_val * unit_vec(dim=n_par, ix=ix1)
+        if fd_method == FD.COMPLEX:
+            # complex step in ix1, central difference in ix2
+            for ix2 in range(ix1 + 1):
+                stencils[ix1, ix2] = (
+                    add(x + 1j * steps[ix1] + steps[ix2]),
+                    add(x + 1j * steps[ix1] - steps[ix2]),
+                )
+            continue
+
+        delta1 = steps[ix1]
 
         # diagonal entry
         if fd_method == FD.CENTRAL:
-            f2p = f_fval(x + delta1)
-            fc = fval
-            f2m = f_fval(x - delta1)
+            stencils[ix1, ix1] = (add(x + delta1), 0, add(x - delta1))
         elif fd_method == FD.FORWARD:
-            f2p = f_fval(x + 2 * delta1)
-            fc = f_fval(x + delta1)
-            f2m = fval
+            stencils[ix1, ix1] = (add(x + 2 * delta1), add(x + delta1), 0)
         elif fd_method == FD.BACKWARD:
-            f2p = fval
-            fc = f_fval(x - delta1)
-            f2m = f_fval(x - 2 * delta1)
-        else:
-            raise ValueError(f"Method {fd_method} not recognized.")
-
-        nabla_2[ix1][ix1] = (f2p + f2m - 2 * fc) / delta1_val**2
+            stencils[ix1, ix1] = (0, add(x - delta1), add(x - 2 * delta1))
 
         # off-diagonals
         for ix2 in range(ix1):
-            delta2_val = delta_vec[ix2]
-            delta2 = delta2_val * unit_vec(dim=n_par, ix=ix2)
+            delta2 = steps[ix2]
 
             if fd_method == FD.CENTRAL:
-                fpp = f_fval(x + delta1 / 2 + delta2 / 2)
-                fpm = f_fval(x + delta1 / 2 - delta2 / 2)
-                fmp = f_fval(x - delta1 / 2 + delta2 / 2)
-                fmm = f_fval(x - delta1 / 2 - delta2 / 2)
+                stencils[ix1, ix2] = (
+                    add(x + delta1 / 2 + delta2 / 2),
+                    add(x + delta1 / 2 - delta2 / 2),
+                    add(x - delta1 / 2 + delta2 / 2),
+                    add(x - delta1 / 2 - delta2 / 2),
+                )
             elif fd_method == FD.FORWARD:
-                fpp = f_fval(x + delta1 + delta2)
-                fpm = f_fval(x + delta1 + 0)
-                fmp = f_fval(x + 0 + delta2)
-                fmm = fval
+                stencils[ix1, ix2] = (
+                    add(x + delta1 + delta2),
+                    add(x + delta1 + 0),
+                    add(x + 0 + delta2),
+                    0,
+                )
             elif fd_method == FD.BACKWARD:
-                fpp = fval
-                fpm = f_fval(x + 0 - delta2)
-                fmp = f_fval(x - delta1 + 0)
-                fmm = f_fval(x - delta1 - delta2)
-            else:
-                raise ValueError(f"Method {fd_method} not recognized.")
+                stencils[ix1, ix2] = (
+                    0,
+                    add(x + 0 - delta2),
+                    add(x - delta1 + 0),
+                    add(x - delta1 - delta2),
+                )
+
+    if fval is None and fd_method != FD.COMPLEX:
+        values = _evaluate_points(points, f_fval, f_batch)
+    else:
+        values = [fval] + _evaluate_points(points[1:], f_fval, f_batch)
 
+    # create empty matrix
+    nabla_2 = []
+    for _ in range(n_par):
+        nabla_2.append([None] * n_par)
+
+    for (ix1, ix2), stencil in stencils.items():
+        if fd_method == FD.COMPLEX:
+            fp, fm = (values[ix] for ix in stencil)
+            nabla_2[ix1][ix2] = nabla_2[ix2][ix1] = np.imag(fp - fm) / (
+                2 * delta_vec[ix1] * delta_vec[ix2]
+            )
+        elif ix1 == ix2:
+            f2p, fc, f2m = (values[ix] for ix in stencil)
+            nabla_2[ix1][ix1] = (f2p + f2m - 2 * fc) / delta_vec[ix1] ** 2
+        else:
+            fpp, fpm, fmp, fmm = (values[ix] for ix in stencil)
             nabla_2[ix1][ix2] = nabla_2[ix2][ix1] = (fpp - fpm - fmp + fmm) / (
-                delta1_val * delta2_val
+                delta_vec[ix1] * delta_vec[ix2]
             )
 
     return np.array(nabla_2)
+
+
+def perturbation_groups(sparsity: np.ndarray) -> list[np.ndarray]:
+    """Group parameters that can be perturbed together in FDs.
+
+    Parameters that do not affect the same outputs, i.e. whose columns in
+    the Jacobian sparsity pattern are structurally orthogonal, can be
+    perturbed in the same evaluation, as their effects can be separated
+    (Curtis, Powell and Reid, 1974). The groups are obtained by a greedy
+    largest-first colouring of the column intersection graph.
+
+    Parameters
+    ----------
+    sparsity:
+        Boolean Jacobian sparsity pattern, shape (n_out, n_par).
+
+    Returns
+    -------
+    groups:
+        The parameter indices of each group.
+    """
+    sparsity = np.asarray(sparsity, dtype=bool)
+    n_par = sparsity.shape[1]
+    # whether two parameters affect a common output
+    overlap = (sparsity.T.astype(int) @ sparsity.astype(int)) > 0
+
+    colors = np.full(n_par, -1)
+    for ix in np.argsort(-sparsity.sum(axis=0), kind="stable"):
+        used = set(colors[overlap[ix] & (colors >= 0)])
+        color = 0
+        while color in used:
+            color += 1
+        colors[ix] = color
+
+    return [
+        np.flatnonzero(colors == color) for color in range(colors.max() + 1)
+    ]
+
+
+def _evaluate_points(
+    points: list[np.ndarray],
+    f_fval: Callable,
+    f_batch: Union[Callable, None],
+) -> list:
+    """Evaluate a function at stencil points.
+
+    Each distinct point is evaluated once, via `f_batch` if not None, and
+    via `f_fval` otherwise.
+    """
+    if not points:
+        return []
+    point_keys = [point.tobytes() for point in points]
+    unique_points = dict(zip(point_keys, points))
+
+    if f_batch is not None:
+        unique_values = f_batch(np.array(list(unique_points.values())))
+    else:
+        unique_values = [f_fval(point) for point in unique_points.values()]
+    values = dict(zip(unique_points.keys(), unique_values))
+
+    return [values[point_key] for point_key in point_keys]
@@ -3,7 +3,17 @@ from typing import Callable, Union
 
 import numpy as np
 
-from ..C import FVAL, GRAD, HESS, MODE_FUN, MODE_RES, RES, SRES, ModeType
+from ..C import (
+    FVAL,
+    GRAD,
+    HESS,
+    HESSP,
+    MODE_FUN,
+    MODE_RES,
+    RES,
+    SRES,
+    ModeType,
+)
 from .base import ObjectiveBase, ResultDict
 
 
@@ -66,6 +76,14 @@ class Objective(ObjectiveBase):
         Parameter names. None if no names provided, otherwise a list of str,
         length dim_full (as in the Problem class). Can be read by the
         problem.
+    fun_batch:
+        Vectorized version of `fun` for function values only, i.e.
+
+            ``fun_batch(X) -> array_like, shape (k,)``
+
+        where the k rows of X with shape (k, n) are parameter vectors.
+        Used by :meth:`pypesto.objective.ObjectiveBase.call_batch`, if
+        provided.
     """
 
     def __init__(
@@ -77,6 +95,7 @@ class Objective(ObjectiveBase):
         res: Callable = None,
         sres: Union[Callable, bool] = None,
         x_names: Sequence[str] = None,
+        fun_batch: Callable = None,
     ):
         self.fun = fun
         self.grad = grad
@@ -84,6 +103,7 @@ class Objective(ObjectiveBase):
         self.hessp = hessp
         self.res = res
         self.sres = sres
+        self.fun_batch = fun_batch
         super().__init__(x_names)
 
     @property
@@ -104,8 +124,7 @@ class Objective(ObjectiveBase):
     @property
     def has_hessp(self) -> bool:
         """Check whether Hessian vector product is defined."""
-        # Not supported yet
-        return False
+        return callable(self.hessp)
 
     @property
     def has_res(self) -> bool:
@@ -152,6 +171,36 @@ class Objective(ObjectiveBase):
             raise ValueError("This mode is not supported.")
         return result
 
+    def call_unprocessed_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        **kwargs,
+    ) -> list[ResultDict]:
+        """See `ObjectiveBase` documentation."""
+        if (
+            self.fun_batch is not None
+            and mode == MODE_FUN
+            and sensi_orders == (0,)
+        ):
+            fvals = np.asarray(
+                self.fun_batch(X), dtype=np.result_type(X, float)
+            )
+            return [{FVAL: fval} for fval in fvals]
+        return super().call_unprocessed_batch(
+            X=X, sensi_orders=sensi_orders, mode=mode, **kwargs
+        )
+
+    def call_unprocessed_hessp(
+        self,
+        x: np.ndarray,
+        v: np.ndarray,
+        **kwargs,
+    ) -> ResultDict:
+        """See `ObjectiveBase` documentation."""
+        return {HESSP: self.hessp(x, v)}
+
     def _call_mode_fun(
         self,
         x: np.ndarray,
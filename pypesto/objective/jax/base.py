@@ -48,6 +48,7 @@ def _device_fun(base_objective: ObjectiveBase, x: jnp.array):
     )
 
 
+@partial(custom_jvp, nondiff_argnums=(0,))
 def _device_fun_value_and_grad(base_objective: ObjectiveBase, x: jnp.array):
     """Jax compatible objective gradient execution using external callback.
 
@@ -98,12 +99,35 @@ def _device_fun_jvp(
     return value, grad @ x_dot
 
 
+@_device_fun_value_and_grad.defjvp
+def _device_fun_value_and_grad_jvp(
+    base_objective: ObjectiveBase, primals: jnp.array, tangents: jnp.array
+):
+    """JVP implementation for device_fun_value_and_grad.
+
+    The tangent of the gradient is the Hessian-vector product of the base
+    objective, such that e.g. `jax.jvp` of `jax.grad` gives Hessian-vector
+    products (forward-over-reverse).
+    """
+    (x,) = primals
+    (x_dot,) = tangents
+    value, grad = _device_fun_value_and_grad(base_objective, x)
+    hessp = jax.pure_callback(
+        base_objective.get_hessp,
+        jax.ShapeDtypeStruct(x.shape, x.dtype),
+        x,
+        x_dot,
+    )
+    return (value, grad), (grad @ x_dot, hessp)
+
+
 class JaxObjective(ObjectiveBase):
     """Objective function that enables use of pypesto objectives in jax models.
 
-    The generated function should generally be compatible with jax, but cannot
-    compute higher order derivatives and is not vectorized (but still
-    compatible with jax.vmap)
+    The generated function should generally be compatible with jax and is
+    not vectorized (but still compatible with jax.vmap). Second order
+    derivatives are only available as Hessian-vector products, e.g. via
+    `jax.jvp` of `jax.grad`, if the wrapped objective supports them.
 
     Parameters
     ----------
@@ -146,6 +170,38 @@ class JaxObjective(ObjectiveBase):
                 and max(sensi_orders) == 0
             )
 
+    @property
+    def has_hessp(self) -> bool:
+        """Check whether Hessian-vector product is defined."""
+        return self.base_objective.has_hessp
+
+    def get_hessp(self, x: jnp.ndarray, v: jnp.ndarray) -> jnp.ndarray:
+        """
+        Get the product of the Hessian at x with a vector v.
+
+        Computed as the jvp of the gradient, which requires the inner
+        objective to support Hessian-vector products.
+        """
+        if not self.has_hessp:
+            raise ValueError(
+                "This Objective cannot compute Hessian-vector products."
+            )
+        return jax.jvp(jax.grad(self.jax_objective), (x,), (v,))[1]
+
+    def call_unprocessed_hessp(
+        self,
+        x: np.ndarray,
+        v: np.ndarray,
+        **kwargs,
+    ) -> ResultDict:
+        """
+        See :class:`ObjectiveBase` for more documentation.
+
+        Delegates to the inner objective, e.g. for use in an
+        :class:`pypesto.objective.AggregatedObjective`.
+        """
+        return self.base_objective.call_unprocessed_hessp(x, v, **kwargs)
+
     def __call__(
         self,
         x: jnp.ndarray,
@@ -0,0 +1,160 @@
+"""Concurrent evaluation of objectives in thread or process pools."""
+
+import time
+from collections.abc import Sequence
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Union
+
+import cloudpickle as pickle
+
+from ..C import RDATAS
+from .base import ObjectiveBase
+
+# executor types
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTORS = [EXECUTOR_THREAD, EXECUTOR_PROCESS]
+
+
+class ObjectivePool:
+    """
+    Thread or process pool calling methods of objectives concurrently.
+
+    The pool is started on the first call of :meth:`map`. It is not copied
+    or pickled together with its owner, copies start their own pool.
+
+    Parameters
+    ----------
+    executor:
+        "thread" for a thread pool, which is beneficial if the objectives
+        release the GIL, as e.g. AMICI simulations do. "process" for a
+        process pool. Then, each worker process holds copies of the
+        objectives, taken when the pool is started, such that objective
+        state is not shared with the main process. Results of process
+        workers do not contain rdatas, as e.g. AMICI simulation results
+        cannot be pickled.
+    n_workers:
+        Maximum number of threads or processes. Defaults to the number of
+        calls on the first call of :meth:`map`.
+    """
+
+    def __init__(self, executor: str, n_workers: Union[int, None] = None):
+        if executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor {executor}, must be one of {EXECUTORS}."
+            )
+        self.executor: str = executor
+        self.n_workers: Union[int, None] = n_workers
+        self._pool: Union[Executor, None] = None
+
+    def __deepcopy__(self, memodict=None):
+        """Create a copy, without the started pool."""
+        return ObjectivePool(executor=self.executor, n_workers=self.n_workers)
+
+    def __getstate__(self):
+        """Get state for pickling, without the started pool."""
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def __del__(self):
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Shut down the pool, if started."""
+        pool = self.__dict__.get("_pool")
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def map(
+        self,
+        objectives: Sequence[ObjectiveBase],
+        calls: Sequence[tuple[int, str, dict]],
+    ) -> list[tuple[Any, float]]:
+        """
+        Call methods of objectives concurrently.
+
+        Parameters
+        ----------
+        objectives:
+            The objectives. For a process pool, the objectives passed on
+            the first call are used by the workers for all calls.
+        calls:
+            Tuples `(i_objective, method, kwargs)`, of the objective index,
+            the method name, and the keyword arguments of the method.
+
+        Returns
+        -------
+        For each call, the result and the wall time in seconds.
+        """
+        if self._pool is None:
+            n_workers = self.n_workers or len(calls)
+            if self.executor == EXECUTOR_THREAD:
+                self._pool = ThreadPoolExecutor(max_workers=n_workers)
+            else:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    initializer=_init_process_objectives,
+                    initargs=(pickle.dumps(list(objectives)),),
+                )
+
+        if self.executor == EXECUTOR_THREAD:
+            futures = [
+                self._pool.submit(
+                    call_objective, objectives[i_obj], method, kwargs
+                )
+                for i_obj, method, kwargs in calls
+            ]
+        else:
+            futures = [
+                self._pool.submit(_call_process_objective, *call)
+                for call in calls
+            ]
+        return [future.result() for future in futures]
+
+
+# objectives of process pool workers
+_process_objectives: Union[Sequence[ObjectiveBase], None] = None
+
+
+def _init_process_objectives(pickled_objectives: bytes) -> None:
+    """Initialize a worker process with copies of the objectives."""
+    global _process_objectives
+    _process_objectives = pickle.loads(pickled_objectives)
+
+
+def call_objective(
+    objective: ObjectiveBase, method: str, kwargs: dict
+) -> tuple[Any, float]:
+    """Call a method of an objective and measure the wall time."""
+    start = time.perf_counter()
+    result = getattr(objective, method)(**kwargs)
+    return result, time.perf_counter() - start
+
+
+def _call_process_objective(
+    i_obj: int, method: str, kwargs: dict
+) -> tuple[Any, float]:
+    """Call a method of an objective in a process pool worker.
+
+    Rdatas are removed from the result, as they are not picklable in
+    general.
+    """
+    result, elapsed = call_objective(
+        _process_objectives[i_obj], method, kwargs
+    )
+    if isinstance(result, dict):
+        result = _drop_rdatas(result)
+    elif isinstance(result, list):
+        result = [_drop_rdatas(rval) for rval in result]
+    return result, elapsed
+
+
+def _drop_rdatas(result: dict) -> dict:
+    """Remove rdatas from an objective result."""
+    return {key: value for key, value in result.items() if key != RDATAS}
@@ -1,8 +1,10 @@
 from collections.abc import Sequence
+from typing import Union
 
 import numpy as np
+import scipy.sparse
 
-from ..C import GRAD, HESS, RES, SRES
+from ..C import GRAD, HESS, HESSP, RES, SRES
 
 
 class PrePostProcessor:
@@ -36,6 +38,23 @@ class PrePostProcessor:
         """
         return x
 
+    def preprocess_direction(self, v: np.ndarray) -> np.ndarray:  # pylint: disable=R0201
+        """
+        Just return v without modifications.
+
+        Parameters
+        ----------
+        v:
+            Direction in the optimization parameter space, e.g. for
+            Hessian vector products.
+
+        Returns
+        -------
+        v:
+            Direction in the simulation parameter space.
+        """
+        return v
+
     def postprocess(self, result: dict) -> dict:  # pylint: disable=R0201
         """
         Convert all arrays into np.ndarrays if necessary, and return them.
@@ -70,19 +89,175 @@ class PrePostProcessor:
         Convert all array_like objects to np.ndarrays.
 
         This has the advantage of a uniform output datatype which offers
-        various methods to assess the data.
+        various methods to assess the data. Sparse matrices are kept.
         """
-        keys = [GRAD, HESS, RES, SRES]
+        keys = [GRAD, HESS, HESSP, RES, SRES]
         for key in keys:
             if key in result:
                 value = result[key]
-                if value is not None:
+                if value is not None and not scipy.sparse.issparse(value):
                     result[key] = np.array(value)
         return result
 
 
+class ParameterIndexMap:
+    """
+    Cached index maps between full and reduced parameter vectors.
+
+    The reduced vector contains only the free parameters, in the order of
+    the full vector. The index arrays are computed once and updated
+    incrementally when single parameters are fixed or freed, instead of
+    being recomputed from the list of fixed indices.
+
+    Parameters
+    ----------
+    dim_full:
+        Dimension of the full vector including fixed parameters.
+    x_fixed_indices:
+        Indices (zero-based) of the fixed parameters.
+    """
+
+    def __init__(self, dim_full: int, x_fixed_indices: Sequence[int] = ()):
+        self.dim_full: int = int(dim_full)
+        self.free_mask: np.ndarray = np.ones(self.dim_full, dtype=bool)
+        self.free_mask[np.asarray(x_fixed_indices, dtype=int)] = False
+        #: indices of the free parameters in the full vector
+        self.x_free_indices: np.ndarray = np.flatnonzero(self.free_mask)
+        #: positions of the parameters in the reduced vector, -1 if fixed
+        self.free_positions: np.ndarray = np.cumsum(self.free_mask) - 1
+        self.free_positions[~self.free_mask] = -1
+        self._matrix_indices: Union[tuple[np.ndarray, np.ndarray], None] = None
+
+    @property
+    def dim(self) -> int:
+        """Dimension of the reduced vector."""
+        return self.x_free_indices.size
+
+    @property
+    def matrix_indices(self) -> tuple[np.ndarray, np.ndarray]:
+        """Open mesh indexing the free block of a full matrix."""
+        if self._matrix_indices is None:
+            self._matrix_indices = np.ix_(
+                self.x_free_indices, self.x_free_indices
+            )
+        return self._matrix_indices
+
+    def fix(self, index: int) -> None:
+        """Mark a single parameter as fixed, updating the maps in place."""
+        index = range(self.dim_full)[index]
+        if not self.free_mask[index]:
+            return
+        position = self.free_positions[index]
+        self.x_free_indices = np.delete(self.x_free_indices, position)
+        self.free_mask[index] = False
+        self.free_positions[index] = -1
+        self.free_positions[index + 1 :][self.free_mask[index + 1 :]] -= 1
+        self._matrix_indices = None
+
+    def unfix(self, index: int) -> None:
+        """Mark a single parameter as free, updating the maps in place."""
+        index = range(self.dim_full)[index]
+        if self.free_mask[index]:
+            return
+        position = np.searchsorted(self.x_free_indices, index)
+        self.x_free_indices = np.insert(self.x_free_indices, position, index)
+        self.free_mask[index] = True
+        self.free_positions[index] = position
+        self.free_positions[index + 1 :][self.free_mask[index + 1 :]] += 1
+        self._matrix_indices = None
+
+    def copy(self) -> "ParameterIndexMap":
+        """Create an independent copy."""
+        index_map = ParameterIndexMap.__new__(ParameterIndexMap)
+        index_map.dim_full = self.dim_full
+        index_map.free_mask = self.free_mask.copy()
+        index_map.x_free_indices = self.x_free_indices.copy()
+        index_map.free_positions = self.free_positions.copy()
+        index_map._matrix_indices = self._matrix_indices
+        return index_map
+
+    def free_index(self, full_index: int) -> int:
+        """Get the position of a free parameter in the reduced vector."""
+        position = int(self.free_positions[full_index])
+        if position < 0:
+            raise ValueError(
+                "Cannot compute index in free vector: Index is fixed."
+            )
+        return position
+
+    def to_full(
+        self,
+        x: np.ndarray,
+        fill_value: Union[float, None] = np.nan,
+        out: Union[np.ndarray, None] = None,
+    ) -> np.ndarray:
+        """
+        Embed reduced vectors in full vectors.
+
+        Parameters
+        ----------
+        x:
+            The reduced vector(s), the parameter dimension being the last.
+        fill_value:
+            Value at the fixed indices. If None, `out` is not written there,
+            e.g. if it already holds the fixed values.
+        out:
+            Preallocated output array of shape `x.shape[:-1] + (dim_full,)`,
+            e.g. reused for repeated evaluations.
+        """
+        if out is None:
+            out = np.empty(
+                x.shape[:-1] + (self.dim_full,), dtype=np.result_type(x, float)
+            )
+        if fill_value is not None:
+            out[..., ~self.free_mask] = fill_value
+        out[..., self.x_free_indices] = x
+        return out
+
+    def to_full_matrix(
+        self, x: np.ndarray, fill_value: float = np.nan
+    ) -> np.ndarray:
+        """Embed a reduced matrix in a full one.
+
+        Sparse matrices are embedded as sparse matrices, with implicit zeros
+        at the fixed indices.
+        """
+        if scipy.sparse.issparse(x):
+            x = x.tocoo()
+            return scipy.sparse.csr_matrix(
+                (
+                    x.data,
+                    (self.x_free_indices[x.row], self.x_free_indices[x.col]),
+                ),
+                shape=(self.dim_full, self.dim_full),
+            )
+        out = np.full(
+            (self.dim_full, self.dim_full),
+            fill_value,
+            dtype=np.result_type(x, float),
+        )
+        out[self.matrix_indices] = x
+        return out
+
+    def reduce(self, x_full: np.ndarray) -> np.ndarray:
+        """Restrict full vector(s) to the free indices of the last axis."""
+        if scipy.sparse.issparse(x_full):
+            return x_full[:, self.x_free_indices]
+        return np.take(x_full, self.x_free_indices, axis=-1)
+
+    def reduce_matrix(self, x_full: np.ndarray) -> np.ndarray:
+        """Restrict a full matrix to the free block."""
+        return x_full[self.matrix_indices]
+
+
 class FixedParametersProcessor(PrePostProcessor):
-    """Extends the processor to handle the fixing of parameters."""
+    """
+    Extends the processor to handle the fixing of parameters.
+
+    If `index_map` is provided, it is used, and shared, as the map of the
+    free and fixed indices. Otherwise, it is created from `x_fixed_indices`,
+    and `x_free_indices` must be their sorted complement.
+    """
 
     def __init__(
         self,
@@ -90,22 +265,65 @@ class FixedParametersProcessor(PrePostProcessor):
         x_free_indices: Sequence[int],
         x_fixed_indices: Sequence[int],
         x_fixed_vals: Sequence[float],
+        index_map: Union[ParameterIndexMap, None] = None,
     ):
         super().__init__()
         self.dim_full: int = dim_full
-        self.x_free_indices: np.ndarray = np.array(x_free_indices, dtype=int)
+        # counts updates of the fixed parameters, to invalidate derived data
+        self.revision: int = -1
+        if index_map is None:
+            index_map = ParameterIndexMap(
+                dim_full=dim_full, x_fixed_indices=x_fixed_indices
+            )
+            if not np.array_equal(
+                index_map.x_free_indices,
+                np.asarray(x_free_indices, dtype=int),
+            ):
+                raise ValueError(
+                    "x_free_indices must be the sorted complement of "
+                    "x_fixed_indices."
+                )
+        self.index_map: ParameterIndexMap = index_map
+        self.set_fixed_values(x_fixed_indices, x_fixed_vals)
+
+    @property
+    def x_free_indices(self) -> np.ndarray:
+        """Indices of the free parameters."""
+        return self.index_map.x_free_indices
+
+    def set_fixed_values(
+        self, x_fixed_indices: Sequence[int], x_fixed_vals: Sequence[float]
+    ) -> None:
+        """Set the values of the fixed parameters.
+
+        The indices must match the fixed indices of `index_map`, which is
+        expected to be updated already.
+        """
         self.x_fixed_indices: np.ndarray = np.array(x_fixed_indices, dtype=int)
         self.x_fixed_vals: np.ndarray = np.array(x_fixed_vals, dtype=float)
+        # full vector with the fixed values set, copied for each call
+        self._x_full: np.ndarray = np.zeros(self.dim_full)
+        self._x_full[self.x_fixed_indices] = self.x_fixed_vals
+        self.revision += 1
 
     def preprocess(self, x: np.ndarray) -> np.ndarray:
-        """Embed optimization vector to full vector with all parameters."""
+        """Embed optimization vector to full vector with all parameters.
+
+        A new vector is returned, as objectives may keep references to
+        their inputs. See :class:`pypesto.objective.CallPlan` for
+        evaluations reusing one full vector.
+        """
         x = super().preprocess(x)
 
-        x_full = np.zeros(self.dim_full)
-        x_full[self.x_free_indices] = x
-        x_full[self.x_fixed_indices] = self.x_fixed_vals
+        return self.index_map.to_full(
+            x, fill_value=None, out=self._x_full.copy()
+        )
+
+    def preprocess_direction(self, v: np.ndarray) -> np.ndarray:
+        """Embed direction to full vector, with no change in fixed ones."""
+        v = super().preprocess_direction(v)
 
-        return x_full
+        return self.index_map.to_full(v, fill_value=0.0)
 
     def reduce(self, x: np.ndarray) -> np.ndarray:
         """
@@ -132,20 +350,18 @@ class FixedParametersProcessor(PrePostProcessor):
         """Constrain results to optimization parameter dimensions."""
         result = super().postprocess(result)
 
-        if result.get(GRAD, None) is not None:
-            grad = result[GRAD]
-            if grad.size == self.dim_full:
-                grad = grad[self.x_free_indices]
-                result[GRAD] = grad
+        index_map = self.index_map
+        for key in (GRAD, HESSP):
+            if result.get(key, None) is not None:
+                if result[key].size == self.dim_full:
+                    result[key] = index_map.reduce(result[key])
         if result.get(HESS, None) is not None:
             hess = result[HESS]
             if hess.shape[0] == self.dim_full:
-                hess = hess[np.ix_(self.x_free_indices, self.x_free_indices)]
-                result[HESS] = hess
+                result[HESS] = index_map.reduce_matrix(hess)
         if result.get(SRES, None) is not None:
             sres = result[SRES]
             if sres.shape[-1] == self.dim_full:
-                sres = sres[..., self.x_free_indices]
-                result[SRES] = sres
+                result[SRES] = index_map.reduce(sres)
 
         return result
@@ -41,12 +41,20 @@ class NegLogParameterPriors(ObjectiveBase):
     A prior instance can be added to e.g. an objective, that gives the
     likelihood, by an AggregatedObjective.
 
+    Priors created via :func:`get_parameter_prior_dict` additionally
+    specify their type, parameters and parameter scale. These priors are
+    grouped by type and scale, and each group is evaluated vectorized for
+    all its parameters, instead of calling the callables per parameter.
+
     Notes
     -----
     All callables should correspond to log-densities. That is, they return
     log-densities and their corresponding derivatives.
     Internally, values are multiplied by -1, since pyPESTO expects the
     Objective function to be of a negative log-density type.
+
+    The Hessian of the priors is diagonal, see
+    :meth:`hessian_diagonal_neg_log_density`.
     """
 
     def __init__(
@@ -73,6 +81,16 @@ class NegLogParameterPriors(ObjectiveBase):
         other = NegLogParameterPriors(deepcopy(self.prior_list))
         return other
 
+    @property
+    def prior_list(self) -> list[dict]:
+        """The prior dictionaries."""
+        return self._prior_list
+
+    @prior_list.setter
+    def prior_list(self, prior_list: list[dict]):
+        self._prior_list = prior_list
+        self._groups, self._custom_rows = _group_priors(prior_list)
+
     def call_unprocessed(
         self,
         x: np.ndarray,
@@ -88,21 +106,19 @@ class NegLogParameterPriors(ObjectiveBase):
         result:
             A dict containing the results.
         """
-        res = {}
-
-        res[C.FVAL] = self.neg_log_density(x)
-
         if mode == C.MODE_FUN:
-            for order in sensi_orders:
-                if order == 0:
-                    continue
-                elif order == 1:
-                    res[C.GRAD] = self.gradient_neg_log_density(x)
-                elif order == 2:
-                    res[C.HESS] = self.hessian_neg_log_density(x)
-                else:
-                    raise ValueError(f"Invalid sensi order {order}.")
-
+            _check_fun_sensi_orders(sensi_orders)
+            fval, grad, hess_diag = self._evaluate(
+                x, max(sensi_orders, default=0)
+            )
+            res = {C.FVAL: fval}
+            if 1 in sensi_orders:
+                res[C.GRAD] = grad
+            if 2 in sensi_orders:
+                res[C.HESS] = np.diag(hess_diag)
+            return res
+
+        res = {C.FVAL: self.neg_log_density(x)}
         if mode == C.MODE_RES:
             for order in sensi_orders:
                 if order == 0:
@@ -114,6 +130,122 @@ class NegLogParameterPriors(ObjectiveBase):
 
         return res
 
+    def call_unprocessed_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: C.ModeType,
+        **kwargs,
+    ) -> list[ResultDict]:
+        """
+        Call objective function for multiple parameter vectors.
+
+        In function mode, each group of priors is evaluated for all parameter
+        vectors at once.
+
+        Returns
+        -------
+        results:
+            For each parameter vector, a dict containing the results.
+        """
+        if mode != C.MODE_FUN:
+            return super().call_unprocessed_batch(
+                X=X, sensi_orders=sensi_orders, mode=mode, **kwargs
+            )
+        _check_fun_sensi_orders(sensi_orders)
+
+        fvals, grads, hess_diags = self._evaluate(
+            X, max(sensi_orders, default=0)
+        )
+        results = [{C.FVAL: fval} for fval in fvals]
+        for i_vector, result in enumerate(results):
+            if 1 in sensi_orders:
+                result[C.GRAD] = grads[i_vector]
+            if 2 in sensi_orders:
+                result[C.HESS] = np.diag(hess_diags[i_vector])
+        return results
+
+    def _evaluate(
+        self, x: np.ndarray, max_order: int
+    ) -> tuple[
+        Union[float, np.ndarray],
+        Union[np.ndarray, None],
+        Union[np.ndarray, None],
+    ]:
+        """Evaluate the negative log-density and its derivatives.
+
+        Parameters
+        ----------
+        x:
+            A parameter vector, or parameter vectors with shape
+            `(n_vectors, n_parameters)`.
+        max_order:
+            The maximum sensitivity order to compute.
+
+        Returns
+        -------
+        The negative log-density, and for `max_order` >= 1 (else None) the
+        gradient, and for `max_order` >= 2 the Hessian diagonal. The
+        leading dimensions are those of `x`.
+        """
+        x = np.asarray(x, dtype=float)
+        fval = np.zeros(x.shape[:-1])
+        grad = np.zeros_like(x) if max_order >= 1 else None
+        hess_diag = np.zeros_like(x) if max_order >= 2 else None
+
+        for group in self._groups:
+            values = group.log_density(x[..., group.indices], max_order)
+            fval -= values[0].sum(axis=-1)
+            if grad is not None:
+                group.add_to(grad, -values[1])
+            if hess_diag is not None:
+                group.add_to(hess_diag, -values[2])
+
+        for row in self._custom_rows:
+            prior = self.prior_list[row]
+            index = prior["index"]
+            values = x[..., index]
+            fval -= _evaluate_elementwise(prior["density_fun"], values)
+            if grad is not None:
+                grad[..., index] -= _evaluate_elementwise(
+                    prior["density_dx"], values
+                )
+            if hess_diag is not None:
+                hess_diag[..., index] -= _evaluate_elementwise(
+                    prior["density_ddx"], values
+                )
+
+        if fval.ndim == 0:
+            fval = float(fval)
+        return fval, grad, hess_diag
+
+    def is_constant(
+        self,
+        sensi_orders: tuple[int, ...],
+        mode: C.ModeType,
+        x_free_indices: Sequence[int] = None,
+    ) -> bool:
+        """See `ObjectiveBase` documentation.
+
+        The priors are constant if they only involve fixed parameters. The
+        Hessian is constant for uniform, normal and Laplace priors on
+        linear-scale parameters.
+        """
+        if (
+            mode == C.MODE_FUN
+            and sensi_orders
+            and set(sensi_orders) == {2}
+            and not self._custom_rows
+            and all(group.constant_hessian for group in self._groups)
+        ):
+            return True
+        if x_free_indices is None:
+            return not self.prior_list
+        x_free_indices = set(x_free_indices)
+        return all(
+            prior["index"] not in x_free_indices for prior in self.prior_list
+        )
+
     def check_sensi_orders(
         self,
         sensi_orders: tuple[int, ...],
@@ -146,6 +278,20 @@ class NegLogParameterPriors(ObjectiveBase):
 
         return True
 
+    @property
+    def has_hessp(self) -> bool:
+        """Check whether Hessian-vector product is defined."""
+        return True
+
+    def call_unprocessed_hessp(
+        self,
+        x: np.ndarray,
+        v: np.ndarray,
+        **kwargs,
+    ) -> ResultDict:
+        """See `ObjectiveBase` documentation."""
+        return {C.HESSP: self.hessian_vp_neg_log_density(x, v)}
+
     def check_mode(self, mode: C.ModeType) -> bool:
         """See `ObjectiveBase` documentation."""
         if mode == C.MODE_FUN:
@@ -163,48 +309,34 @@ class NegLogParameterPriors(ObjectiveBase):
 
     def neg_log_density(self, x):
         """Evaluate the negative log-density at x."""
-        density_val = 0
-        for prior in self.prior_list:
-            density_val -= prior["density_fun"](x[prior["index"]])
-
-        return density_val
+        return self._evaluate(x, 0)[0]
 
     def gradient_neg_log_density(self, x):
         """Evaluate the gradient of the negative log-density at x."""
-        grad = np.zeros_like(x)
-
-        for prior in self.prior_list:
-            grad[prior["index"]] -= prior["density_dx"](x[prior["index"]])
-
-        return grad
+        return self._evaluate(x, 1)[1]
 
     def hessian_neg_log_density(self, x):
         """Evaluate the hessian of the negative log-density at x."""
-        hessian = np.zeros((len(x), len(x)))
-
-        for prior in self.prior_list:
-            hessian[prior["index"], prior["index"]] -= prior["density_ddx"](
-                x[prior["index"]]
-            )
+        return np.diag(self.hessian_diagonal_neg_log_density(x))
 
-        return hessian
+    def hessian_diagonal_neg_log_density(self, x):
+        """Evaluate the diagonal of the (diagonal) hessian at x."""
+        return self._evaluate(x, 2)[2]
 
     def hessian_vp_neg_log_density(self, x, p):
         """Compute vector product of the hessian at x with a vector p."""
-        h_dot_p = np.zeros_like(p)
-
-        for prior in self.prior_list:
-            h_dot_p[prior["index"]] -= (
-                prior["density_ddx"](x[prior["index"]]) * p[prior["index"]]
-            )
-
-        return h_dot_p
+        return self.hessian_diagonal_neg_log_density(x) * p
 
     def residual(self, x):
         """Evaluate the residual representation of the prior at x."""
-        return np.asarray(
-            [prior["residual"](x[prior["index"]]) for prior in self.prior_list]
-        )
+        x = np.asarray(x, dtype=float)
+        res = np.zeros(len(self.prior_list))
+        for group in self._groups:
+            res[group.rows] = group.residual(x[group.indices], 0)[0]
+        for row in self._custom_rows:
+            prior = self.prior_list[row]
+            res[row] = prior["residual"](x[prior["index"]])
+        return res
 
     def residual_jacobian(self, x):
         """
@@ -213,15 +345,230 @@ class NegLogParameterPriors(ObjectiveBase):
         Evaluate the Jacobian of the residual representation of the prior
         for a parameter vector x w.r.t. x, if available.
         """
+        x = np.asarray(x, dtype=float)
         sres = np.zeros((len(self.prior_list), len(x)))
-        for iprior, prior in enumerate(self.prior_list):
-            sres[iprior, prior["index"]] = prior["residual_dx"](
-                x[prior["index"]]
-            )
+        for group in self._groups:
+            sres[group.rows, group.indices] = group.residual(
+                x[group.indices], 1
+            )[1]
+        for row in self._custom_rows:
+            prior = self.prior_list[row]
+            sres[row, prior["index"]] = prior["residual_dx"](x[prior["index"]])
 
         return sres
 
 
+class _PriorGroup:
+    """Priors of one type on parameters of one scale.
+
+    All priors of a group are evaluated at once, for parameter values
+    arrays whose last dimension corresponds to the priors of the group.
+
+    Parameters
+    ----------
+    prior_type:
+        The prior type, see :func:`_prior_densities`. Types evaluated on
+        the parameter scale are treated as types evaluated on the linear
+        scale of linear-scale parameters.
+    scale:
+        The parameter scale.
+    rows:
+        The positions of the priors in the prior list.
+    indices:
+        The parameter indices.
+    prior_parameters:
+        The prior parameters, with shape `(n_priors, 2)`.
+    """
+
+    def __init__(
+        self,
+        prior_type: str,
+        scale: str,
+        rows: Sequence[int],
+        indices: Sequence[int],
+        prior_parameters: Sequence[Sequence[float]],
+    ):
+        self.prior_type: str = prior_type
+        self.scale: str = scale
+        self.rows: np.ndarray = np.array(rows, dtype=int)
+        self.indices: np.ndarray = np.array(indices, dtype=int)
+        # first and second prior parameters, see `_prior_densities`
+        prior_parameters = np.array(prior_parameters, dtype=float)
+        self.par0: np.ndarray = prior_parameters[:, 0]
+        self.par1: np.ndarray = prior_parameters[:, 1]
+        # whether each parameter appears once, i.e. values can be assigned
+        self.unique_indices: bool = len(set(indices)) == len(indices)
+        self.constant_hessian: bool = scale == C.LIN and prior_type in (
+            C.UNIFORM,
+            C.NORMAL,
+            C.LAPLACE,
+        )
+
+    def add_to(self, target: np.ndarray, values: np.ndarray) -> None:
+        """Add values of the priors to the parameter entries of target."""
+        if self.unique_indices:
+            target[..., self.indices] += values
+        else:
+            np.add.at(target.T, self.indices, values.T)
+
+    def _transform(
+        self, x: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get linear-scale values, and their first and second derivatives."""
+        if self.scale == C.LIN:
+            return x, np.ones_like(x), np.zeros_like(x)
+        if self.scale == C.LOG:
+            y = np.exp(x)
+            return y, y, y
+        log10 = np.log(10)
+        y = 10**x
+        return y, log10 * y, log10**2 * y
+
+    def log_density(
+        self, x: np.ndarray, max_order: int
+    ) -> list[Union[np.ndarray, None]]:
+        """Evaluate the log-densities and their derivatives up to max_order.
+
+        Returns
+        -------
+        Log-densities and first and second derivatives w.r.t. `x`, None for
+        orders exceeding `max_order`.
+        """
+        y, dy, ddy = self._transform(x)
+
+        if self.prior_type == C.UNIFORM:
+            lb, ub = self.par0, self.par1
+            f = np.where((lb <= y) & (y <= ub), -np.log(ub - lb), -np.inf)
+            df = np.zeros_like(y)
+            ddf = np.zeros_like(y)
+        elif self.prior_type == C.NORMAL:
+            mean, sigma2 = self.par0, self.par1**2
+            f = -np.log(2 * np.pi * sigma2) / 2 - (y - mean) ** 2 / (
+                2 * sigma2
+            )
+            df = -(y - mean) / sigma2
+            ddf = np.broadcast_to(-1 / sigma2, y.shape)
+        elif self.prior_type == C.LAPLACE:
+            mean, scale = self.par0, self.par1
+            f = -np.log(2 * scale) - np.abs(y - mean) / scale
+            df = np.where(y > mean, -1 / scale, 1 / scale)
+            ddf = np.zeros_like(y)
+        else:  # C.LOG_NORMAL
+            mean, sigma = self.par0, self.par1
+            log_y = np.log(y)
+            f = -np.log(np.sqrt(2 * np.pi) * sigma * y) - (
+                log_y - mean
+            ) ** 2 / (2 * sigma**2)
+            df = -1 / y - (log_y - mean) / (sigma**2 * y)
+            ddf = 1 / y**2 - (1 - log_y + mean) / (sigma**2 * y**2)
+
+        values = [f, None, None]
+        if max_order >= 1:
+            values[1] = df * dy
+        if max_order >= 2:
+            values[2] = ddf * dy**2 + df * ddy
+        return values
+
+    def residual(
+        self, x: np.ndarray, max_order: int
+    ) -> list[Union[np.ndarray, None]]:
+        """Evaluate the residuals and their derivatives up to max_order."""
+        y, dy, _ = self._transform(x)
+
+        if self.prior_type == C.UNIFORM:
+            lb, ub = self.par0, self.par1
+            res = np.where((lb <= y) & (y <= ub), 0.0, np.inf)
+            dres = np.zeros_like(y)
+        elif self.prior_type == C.NORMAL:
+            mean, sigma = self.par0, self.par1
+            res = (y - mean) / (np.sqrt(2) * sigma)
+            dres = np.broadcast_to(1 / (np.sqrt(2) * sigma), y.shape)
+        elif self.prior_type == C.LAPLACE:
+            mean, scale = self.par0, self.par1
+            res = np.sqrt(np.abs(y - mean) / scale)
+            at_mean = y == mean
+            if max_order >= 1 and np.any(at_mean):
+                logger.warning(
+                    "x == mean in d_res_dx of Laplace prior. Returning NaN."
+                )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                dres = np.where(
+                    at_mean,
+                    np.nan,
+                    (y - mean) / (2 * np.sqrt(scale * np.abs(y - mean) ** 3)),
+                )
+        else:
+            raise ValueError(
+                f"Priors of type {self.prior_type} have no residuals."
+            )
+
+        values = [res, None]
+        if max_order >= 1:
+            values[1] = dres * dy
+        return values
+
+
+# prior types supported by `_PriorGroup`
+_GROUP_PRIOR_TYPES = {
+    C.UNIFORM: C.UNIFORM,
+    C.PARAMETER_SCALE_UNIFORM: C.UNIFORM,
+    C.NORMAL: C.NORMAL,
+    C.PARAMETER_SCALE_NORMAL: C.NORMAL,
+    C.LAPLACE: C.LAPLACE,
+    C.PARAMETER_SCALE_LAPLACE: C.LAPLACE,
+    C.LOG_NORMAL: C.LOG_NORMAL,
+}
+
+
+def _group_priors(
+    prior_list: list[dict],
+) -> tuple[list[_PriorGroup], list[int]]:
+    """Group priors by type and scale.
+
+    Returns
+    -------
+    The groups, and the positions of priors that cannot be grouped, as they
+    are only defined via callables.
+    """
+    grouped: dict[tuple[str, str], list[int]] = {}
+    custom_rows = []
+    for row, prior in enumerate(prior_list):
+        prior_type = _GROUP_PRIOR_TYPES.get(prior.get("type"))
+        if prior_type is None or prior.get("scale") is None:
+            custom_rows.append(row)
+            continue
+        grouped.setdefault((prior_type, prior["scale"]), []).append(row)
+
+    groups = [
+        _PriorGroup(
+            prior_type=prior_type,
+            scale=scale,
+            rows=rows,
+            indices=[prior_list[row]["index"] for row in rows],
+            prior_parameters=[prior_list[row]["parameters"] for row in rows],
+        )
+        for (prior_type, scale), rows in grouped.items()
+    ]
+    return groups, custom_rows
+
+
+def _check_fun_sensi_orders(sensi_orders: tuple[int, ...]) -> None:
+    """Raise if sensitivity orders are not supported in function mode."""
+    if any(not (0 <= order <= 2) for order in sensi_orders):
+        raise ValueError(f"Invalid sensi orders {sensi_orders}.")
+
+
+def _evaluate_elementwise(
+    fun: Callable, values: np.ndarray
+) -> Union[float, np.ndarray]:
+    """Evaluate a scalar prior function for each of the given values."""
+    if values.ndim == 0:
+        return fun(values[()])
+    return np.fromiter(
+        (fun(value) for value in values), dtype=float, count=len(values)
+    )
+
+
 def get_parameter_prior_dict(
     index: int,
     prior_type: str,
@@ -250,6 +597,16 @@ def get_parameter_prior_dict(
         prior_type, prior_parameters
     )
 
+    # specification for vectorized evaluation, priors on the parameter scale
+    #  are evaluated like priors on linear-scale parameters
+    spec = {
+        "type": prior_type,
+        "parameters": prior_parameters,
+        "scale": C.LIN
+        if prior_type.startswith("parameterScale")
+        else parameter_scale,
+    }
+
     if parameter_scale == C.LIN or prior_type.startswith("parameterScale"):
         return {
             "index": index,
@@ -258,6 +615,7 @@ def get_parameter_prior_dict(
             "density_ddx": dd_log_f_ddx,
             "residual": res,
             "residual_dx": d_res_dx,
+            **spec,
         }
 
     elif parameter_scale == C.LOG:
@@ -302,6 +660,7 @@ def get_parameter_prior_dict(
             "density_ddx": dd_log_f_log,
             "residual": res_log,
             "residual_dx": d_res_log,
+            **spec,
         }
 
     elif parameter_scale == C.LOG10:
@@ -347,6 +706,7 @@ def get_parameter_prior_dict(
             "density_ddx": dd_log_f_log10,
             "residual": res_log,
             "residual_dx": d_res_log,
+            **spec,
         }
 
     else:
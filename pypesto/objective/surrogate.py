@@ -0,0 +1,440 @@
+"""Surrogate-assisted evaluation of expensive objectives."""
+
+import time
+from collections.abc import Sequence
+from typing import Union
+
+import numpy as np
+import scipy.linalg
+from scipy.spatial.distance import cdist, pdist
+
+from ..C import FVAL, MODE_FUN, ModeType
+from ..history import MemoryHistory
+from .base import ObjectiveBase, ResultDict
+
+
+class GaussianProcessSurrogate:
+    """
+    Gaussian process regression model of objective function values.
+
+    Uses a squared exponential (radial basis function) kernel on parameters
+    scaled to the unit box spanned by the training points, and a constant
+    mean. For a vanishing noise level, the posterior mean is the radial
+    basis function interpolant of the training values.
+
+    Parameters
+    ----------
+    length_scale:
+        Kernel length scale, relative to the scaled parameter space.
+        Defaults to the median distance between the training points.
+    noise:
+        Noise variance, relative to the variance of the training values.
+        Regularizes the kernel matrix of close training points.
+    """
+
+    def __init__(
+        self,
+        length_scale: Union[float, None] = None,
+        noise: float = 1e-8,
+    ):
+        if length_scale is not None and length_scale <= 0:
+            raise ValueError("length_scale must be positive.")
+        if noise < 0:
+            raise ValueError("noise must be non-negative.")
+        self.length_scale: Union[float, None] = length_scale
+        self.noise: float = noise
+        self._length_scale: float = 1.0
+        self._x_shift: Union[np.ndarray, None] = None
+        self._x_scale: Union[np.ndarray, None] = None
+        self._y_mean: float = 0.0
+        self._y_std: float = 1.0
+        self._z: Union[np.ndarray, None] = None
+        self._cho: Union[tuple[np.ndarray, bool], None] = None
+        self._alpha: Union[np.ndarray, None] = None
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Fit the model to training points.
+
+        Parameters
+        ----------
+        x:
+            Training parameters, of shape (n_points, dim).
+        y:
+            Finite training values, of shape (n_points,).
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        self._x_shift = x.min(axis=0)
+        self._x_scale = np.ptp(x, axis=0)
+        self._x_scale[self._x_scale == 0] = 1.0
+        self._z = (x - self._x_shift) / self._x_scale
+
+        self._y_mean = float(y.mean())
+        self._y_std = float(y.std()) or 1.0
+
+        self._length_scale = self.length_scale
+        if self._length_scale is None:
+            distances = pdist(self._z)
+            distances = distances[distances > 0]
+            self._length_scale = (
+                float(np.median(distances)) if distances.size else 1.0
+            )
+
+        kernel = self._kernel(self._z, self._z)
+        # increase the regularization until the matrix is numerically
+        #  positive definite
+        jitter = max(self.noise, 1e-12)
+        while True:
+            try:
+                self._cho = scipy.linalg.cho_factor(
+                    kernel + jitter * np.eye(len(kernel)), lower=True
+                )
+                break
+            except np.linalg.LinAlgError:
+                jitter *= 10
+        self._alpha = scipy.linalg.cho_solve(
+            self._cho, (y - self._y_mean) / self._y_std
+        )
+
+    def predict(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Predict values.
+
+        Parameters
+        ----------
+        x:
+            Parameters, of shape (n_points, dim).
+
+        Returns
+        -------
+        The posterior mean and standard deviation, of shape (n_points,).
+        """
+        if self._alpha is None:
+            raise RuntimeError("The surrogate has not been fitted.")
+        z = (np.asarray(x, dtype=float) - self._x_shift) / self._x_scale
+        kernel = self._kernel(z, self._z)
+        mean = kernel @ self._alpha * self._y_std + self._y_mean
+        var = 1.0 - np.sum(
+            kernel * scipy.linalg.cho_solve(self._cho, kernel.T).T, axis=1
+        )
+        std = np.sqrt(np.maximum(var, 0.0)) * self._y_std
+        return mean, std
+
+    def _kernel(self, z1: np.ndarray, z2: np.ndarray) -> np.ndarray:
+        """Evaluate the squared exponential kernel."""
+        return np.exp(
+            -0.5 * cdist(z1, z2, "sqeuclidean") / self._length_scale**2
+        )
+
+
+class SurrogateObjective(ObjectiveBase):
+    """
+    Wrapper screening objective evaluations with a surrogate model.
+
+    Global optimizers and startpoint checks spend much of the simulation
+    time on parameters with obviously bad objective function values. This
+    wrapper records the evaluations of the wrapped objective in a
+    :class:`pypesto.history.MemoryHistory`, fits a surrogate model of the
+    function values to them, and answers function value requests from the
+    surrogate, unless the candidate is promising. Then, it escalates to the
+    wrapped objective.
+
+    A candidate is promising if the lower confidence bound
+    `mean - kappa * std` of the surrogate is not above the `trust_quantile`
+    quantile of the recorded function values. Requests for derivatives or
+    residuals, or with additional keyword arguments, are always evaluated
+    by the wrapped objective, and so are all requests until `min_points`
+    evaluations were recorded.
+
+    Batch evaluations, e.g. of the combinations of the reference set in
+    :class:`pypesto.optimize.ESSOptimizer`, are screened jointly, and only
+    the promising candidates are evaluated, as one batch.
+
+    .. note::
+        Function values of rejected candidates are the surrogate
+        predictions, not simulation results.
+
+    Parameters
+    ----------
+    objective:
+        The objective to wrap.
+    surrogate:
+        The surrogate model, with methods `fit(x, y)` and `predict(x)`
+        returning means and standard deviations. Defaults to a
+        :class:`GaussianProcessSurrogate`.
+    history:
+        History recording the evaluations of the wrapped objective, as
+        training points of the surrogate. Can be pre-filled from previous
+        runs. Defaults to an empty history.
+    min_points:
+        Minimum number of recorded function values before the surrogate is
+        used. Defaults to the number of parameters plus one.
+    max_points:
+        Maximum number of training points, the most recent ones are used.
+        Limits the cubic cost of fitting.
+    refit_interval:
+        Number of new recorded function values after which the surrogate is
+        fitted again.
+    trust_quantile:
+        Quantile of the recorded function values a candidate must be
+        expected to reach to be evaluated.
+    kappa:
+        Number of standard deviations of the lower confidence bound.
+    x_names:
+        Parameter names. Defaults to the names of `objective`.
+
+    Attributes
+    ----------
+    n_fits:
+        Number of fits of the surrogate.
+    fit_time:
+        Total wall time in seconds spent fitting the surrogate.
+    n_screened:
+        Number of candidates screened by the surrogate.
+    n_escalated:
+        Number of screened candidates evaluated by the wrapped objective.
+    n_rejected:
+        Number of screened candidates answered by the surrogate.
+    """
+
+    def __init__(
+        self,
+        objective: ObjectiveBase,
+        surrogate: Union[GaussianProcessSurrogate, None] = None,
+        history: Union[MemoryHistory, None] = None,
+        min_points: Union[int, None] = None,
+        max_points: int = 200,
+        refit_interval: int = 1,
+        trust_quantile: float = 0.25,
+        kappa: float = 2.0,
+        x_names: Sequence[str] = None,
+    ):
+        if not isinstance(objective, ObjectiveBase):
+            raise TypeError("objective must be an ObjectiveBase instance")
+        if min_points is not None and min_points < 2:
+            raise ValueError("min_points must be at least 2.")
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2.")
+        if refit_interval < 1:
+            raise ValueError("refit_interval must be positive.")
+        if not 0 <= trust_quantile <= 1:
+            raise ValueError("trust_quantile must be in [0, 1].")
+        if x_names is None:
+            x_names = objective._x_names
+        super().__init__(x_names)
+        self.base_objective = objective
+        if surrogate is None:
+            surrogate = GaussianProcessSurrogate()
+        self.surrogate = surrogate
+        if history is None:
+            history = MemoryHistory()
+        self.evaluations: MemoryHistory = history
+        self.min_points: Union[int, None] = min_points
+        self.max_points: int = max_points
+        self.refit_interval: int = refit_interval
+        self.trust_quantile: float = trust_quantile
+        self.kappa: float = kappa
+
+        self.n_fits: int = 0
+        self.fit_time: float = 0.0
+        self.n_screened: int = 0
+        self.n_escalated: int = 0
+        self.n_rejected: int = 0
+        # number of history entries and threshold at the last fit
+        self._n_fitted: int = 0
+        self._threshold: float = np.inf
+
+    @property
+    def rejection_rate(self) -> float:
+        """Fraction of screened candidates answered by the surrogate."""
+        if not self.n_screened:
+            return 0.0
+        return self.n_rejected / self.n_screened
+
+    @property
+    def threshold(self) -> float:
+        """Function value promising candidates are expected to reach."""
+        return self._threshold
+
+    def initialize(self):
+        """See `ObjectiveBase` documentation."""
+        self.base_objective.initialize()
+
+    def check_mode(self, mode: ModeType) -> bool:
+        """See `ObjectiveBase` documentation."""
+        return self.base_objective.check_mode(mode)
+
+    def check_sensi_orders(
+        self,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+    ) -> bool:
+        """See `ObjectiveBase` documentation."""
+        return self.base_objective.check_sensi_orders(sensi_orders, mode)
+
+    def get_config(self) -> dict:
+        """Return basic information of the objective configuration."""
+        info = super().get_config()
+        info["surrogate"] = type(self.surrogate).__name__
+        info["min_points"] = self.min_points
+        info["max_points"] = self.max_points
+        info["refit_interval"] = self.refit_interval
+        info["trust_quantile"] = self.trust_quantile
+        info["kappa"] = self.kappa
+        info["base_objective"] = self.base_objective.get_config()
+        return info
+
+    def predict(
+        self, x: np.ndarray
+    ) -> Union[tuple[np.ndarray, np.ndarray], None]:
+        """
+        Predict function values by the surrogate.
+
+        Parameters
+        ----------
+        x:
+            Parameter vectors of the wrapped objective, i.e. including fixed
+            parameters, of shape (n_points, dim_full).
+
+        Returns
+        -------
+        The predicted means and standard deviations, or None if not enough
+        function values were recorded yet.
+        """
+        x = np.atleast_2d(x)
+        if not self._update_fit(x.shape[1]):
+            return None
+        return self.surrogate.predict(x)
+
+    def screen(self, x: np.ndarray) -> np.ndarray:
+        """
+        Decide which candidates are promising.
+
+        Parameters
+        ----------
+        x:
+            Parameter vectors of the wrapped objective, i.e. including fixed
+            parameters, of shape (n_points, dim_full).
+
+        Returns
+        -------
+        For each candidate, whether it should be evaluated by the wrapped
+        objective. All candidates are promising if the surrogate is not
+        trusted yet.
+        """
+        x = np.atleast_2d(x)
+        prediction = self.predict(x)
+        if prediction is None:
+            return np.ones(len(x), dtype=bool)
+        mean, std = prediction
+        return mean - self.kappa * std <= self._threshold
+
+    def call_unprocessed(
+        self,
+        x: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        **kwargs,
+    ) -> ResultDict:
+        """
+        See `ObjectiveBase` for more documentation.
+
+        Screens function value requests by the surrogate, and evaluates
+        the wrapped objective otherwise.
+        """
+        return self.call_unprocessed_batch(
+            x[None, :], sensi_orders, mode, **kwargs
+        )[0]
+
+    def call_unprocessed_batch(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        **kwargs,
+    ) -> list[ResultDict]:
+        """
+        See `ObjectiveBase` for more documentation.
+
+        Screens function value requests by the surrogate, and evaluates the
+        promising parameter vectors as one batch.
+        """
+        if sensi_orders != (0,) or mode != MODE_FUN or kwargs:
+            return self._evaluate(X, sensi_orders, mode, **kwargs)
+
+        prediction = self.predict(X)
+        if prediction is None:
+            return self._evaluate(X, sensi_orders, mode)
+        mean, std = prediction
+        promising = mean - self.kappa * std <= self._threshold
+        self.n_screened += len(X)
+        self.n_escalated += int(promising.sum())
+        self.n_rejected += int((~promising).sum())
+
+        results: list[ResultDict] = [{FVAL: float(fval)} for fval in mean]
+        i_promising = np.flatnonzero(promising)
+        if i_promising.size:
+            evaluated = self._evaluate(X[i_promising], sensi_orders, mode)
+            for i_x, result in zip(i_promising, evaluated):
+                results[i_x] = result
+        return results
+
+    def _evaluate(
+        self,
+        X: np.ndarray,
+        sensi_orders: tuple[int, ...],
+        mode: ModeType,
+        **kwargs,
+    ) -> list[ResultDict]:
+        """Evaluate the wrapped objective, and record the results."""
+        if len(X) == 1:
+            results = [
+                self.base_objective.call_unprocessed(
+                    X[0], sensi_orders, mode, **kwargs
+                )
+            ]
+        else:
+            results = self.base_objective.call_unprocessed_batch(
+                X, sensi_orders, mode, **kwargs
+            )
+        for x, result in zip(X, results):
+            self.evaluations.update(x.copy(), sensi_orders, mode, result)
+        return results
+
+    def _update_fit(self, dim: int) -> bool:
+        """Fit the surrogate, if due.
+
+        Returns whether the surrogate can be used.
+        """
+        n_recorded = len(self.evaluations)
+        if (
+            self._n_fitted
+            and n_recorded - self._n_fitted < self.refit_interval
+        ):
+            return True
+
+        fvals = np.asarray(self.evaluations.get_fval_trace(), dtype=float)
+        # entries without function values, e.g. gradient evaluations, are
+        #  recorded as nan
+        i_fvals = np.flatnonzero(~np.isnan(fvals))[-self.max_points :]
+        min_points = self.min_points or dim + 1
+        if i_fvals.size < min_points:
+            return bool(self._n_fitted)
+
+        fvals = fvals[i_fvals]
+        finite = np.isfinite(fvals)
+        if not finite.any():
+            return bool(self._n_fitted)
+        # failed simulations mark bad regions with the worst recorded value
+        fvals[~finite] = fvals[finite].max()
+        x = np.array(self.evaluations.get_x_trace(list(i_fvals)))
+
+        start = time.perf_counter()
+        self.surrogate.fit(x, fvals)
+        self.fit_time += time.perf_counter() - start
+        self.n_fits += 1
+        self._n_fitted = n_recorded
+        self._threshold = float(np.quantile(fvals, self.trust_quantile))
+        return True
@@ -0,0 +1,61 @@
+import logging
+from collections.abc import Sequence
+
+from ..C import MODE_FUN, ModeType
+from ..engine import Task
+from .base import ObjectiveBase, ResultDict
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectiveCallTask(Task):
+    """Evaluate an objective at a single parameter vector.
+
+    Supports both synchronous execution by any engine, and asynchronous
+    execution via :meth:`pypesto.objective.ObjectiveBase.call_async` by
+    :class:`pypesto.engine.AsyncioEngine`.
+
+    Attributes
+    ----------
+    objective:
+        The objective to evaluate.
+    x:
+        The parameter vector.
+    sensi_orders:
+        Specifies which sensitivities to compute, e.g. (0,1) -> fval, grad.
+    mode:
+        Whether to compute function values or residuals.
+    id:
+        The task ID.
+    """
+
+    shared_attributes = ("objective",)
+
+    def __init__(
+        self,
+        objective: ObjectiveBase,
+        x: Sequence[float],
+        sensi_orders: tuple[int, ...] = (0,),
+        mode: ModeType = MODE_FUN,
+        id: str = None,
+    ):
+        super().__init__()
+        self.objective = objective
+        self.x = x
+        self.sensi_orders = sensi_orders
+        self.mode = mode
+        self.id = id
+
+    def execute(self) -> ResultDict:
+        """Evaluate the objective and return the result dict."""
+        logger.debug(f"Executing task {self.id}.")
+        return self.objective(
+            self.x, self.sensi_orders, self.mode, return_dict=True
+        )
+
+    async def execute_async(self) -> ResultDict:
+        """Evaluate the objective asynchronously."""
+        logger.debug(f"Executing task {self.id}.")
+        return await self.objective.call_async(
+            self.x, self.sensi_orders, self.mode, return_dict=True
+        )
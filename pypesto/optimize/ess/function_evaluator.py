@@ -83,7 +83,11 @@ class FunctionEvaluator:
         -------
         The objective function values in the same order as the inputs.
         """
-        res = np.fromiter(map(self.single, xs), dtype=float)
+        if not len(xs):
+            return np.array([])
+        res = np.asarray(
+            self.problem.objective.call_batch(np.asarray(xs)), dtype=float
+        )
         self.n_eval += len(xs)
         self.n_eval_round += len(xs)
         return res
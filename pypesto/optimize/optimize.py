@@ -7,7 +7,12 @@ from ..engine import Engine, SingleCoreEngine
 from ..history import HistoryOptions
 from ..problem import Problem
 from ..result import Result
-from ..startpoint import StartpointMethod, to_startpoint_method, uniform
+from ..startpoint import (
+    CheckedStartpoints,
+    StartpointMethod,
+    to_startpoint_method,
+    uniform,
+)
 from ..store import autosave
 from .optimizer import Optimizer, ScipyOptimizer
 from .options import OptimizeOptions
@@ -15,6 +20,7 @@ from .task import OptimizerTask
 from .util import (
     assign_ids,
     bound_n_starts_from_env,
+    check_intermediate_autosave,
     postprocess_hdf5_history,
     preprocess_hdf5_history,
 )
@@ -141,9 +147,17 @@ def minimize(
         history_options, engine
     )
 
+    # startpoints with poor function values are expected to take longer
+    costs = [None] * n_starts
+    if (
+        isinstance(startpoint_method, CheckedStartpoints)
+        and startpoint_method.fvals is not None
+    ):
+        costs = startpoint_method.fvals
+
     # define tasks
     tasks = []
-    for startpoint, id in zip(startpoints, ids):
+    for startpoint, id, cost in zip(startpoints, ids, costs):
         task = OptimizerTask(
             optimizer=optimizer,
             problem=problem,
@@ -151,20 +165,55 @@ def minimize(
             id=id,
             history_options=history_options,
             optimize_options=options,
+            cost=cost,
         )
         tasks.append(task)
 
-    # perform multistart optimization
-    ret = engine.execute(tasks, progress_bar=progress_bar)
+    # intermediate results are saved to the same file, which requires
+    #  overwriting
+    autosave_intermediate = options.autosave_interval is not None
+    if autosave_intermediate and not check_intermediate_autosave(
+        filename, overwrite
+    ):
+        autosave_intermediate = False
+
+    # perform multistart optimization, collecting results as they finish
+    ret = []
+    results_iter = engine.execute_iter(tasks, progress_bar=progress_bar)
+    try:
+        for _, optimizer_result in results_iter:
+            ret.append(optimizer_result)
+            result.optimize_result.append(optimizer_result, sort=False)
+
+            if (
+                autosave_intermediate
+                and len(ret) % options.autosave_interval == 0
+            ):
+                result.optimize_result.sort()
+                autosave(
+                    filename=filename,
+                    result=result,
+                    store_type="optimize",
+                    overwrite=True,
+                )
+                overwrite = True
+
+            if options.early_stopping is not None and options.early_stopping(
+                result
+            ):
+                logger.info(
+                    f"Early stopping of multistart optimization after "
+                    f"{len(ret)} of {len(tasks)} starts."
+                )
+                break
+    finally:
+        # cancel remaining tasks in case of early stopping
+        results_iter.close()
 
     # merge hdf5 history files
     if history_requires_postprocessing:
         postprocess_hdf5_history(ret, history_file, history_options)
 
-    # aggregate results
-    for optimizer_result in ret:
-        result.optimize_result.append(optimizer_result)
-
     # sort by best fval
     result.optimize_result.sort()
 
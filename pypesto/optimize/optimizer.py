@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import scipy.optimize
+import scipy.sparse
 
 from ..C import FVAL, GRAD, INNER_PARAMETERS, MODE_FUN, MODE_RES, SPLINE_KNOTS
 from ..history import HistoryOptions, NoHistory, OptimizerHistory
@@ -18,7 +19,7 @@ from ..problem import HierarchicalProblem, Problem
 from ..result import OptimizerResult
 from .load import fill_result_from_history
 from .options import OptimizeOptions
-from .util import check_finite_bounds
+from .util import LastPointEvaluator, check_finite_bounds
 
 if TYPE_CHECKING:
     import fides
@@ -376,8 +377,14 @@ class ScipyOptimizer(Optimizer):
             ls_method = self.method[3:]
             bounds = (lb, ub)
 
-            fun = objective.get_res
-            jac = objective.get_sres if objective.has_sres else "2-point"
+            if objective.has_sres:
+                # residuals and sensitivities are computed jointly
+                evaluator = LastPointEvaluator(objective, mode=MODE_RES)
+                fun = evaluator.fun
+                jac = evaluator.jac
+            else:
+                fun = objective.get_res
+                jac = "2-point"
             # TODO: pass jac computing methods in options
 
             if self.options is not None:
@@ -476,15 +483,15 @@ class ScipyOptimizer(Optimizer):
                 def fun(x):
                     return objective(x, sensi_orders=(0, 1))
 
+                jac = True
+            elif objective.has_grad and method_supports_grad:
+                # function values and gradients are computed jointly
+                evaluator = LastPointEvaluator(objective)
+                fun = evaluator.fun
+                jac = evaluator.jac
             else:
                 fun = objective.get_fval
-            jac = (
-                objective.get_grad
-                if objective.has_grad
-                and method_supports_grad
-                and objective.grad is not True
-                else (True if objective.grad is True else None)
-            )
+                jac = None
             hess = (
                 objective.get_hess
                 if objective.has_hess and method_supports_hess
@@ -589,9 +596,13 @@ class IpoptOptimizer(Optimizer):
         bounds = np.array([problem.lb, problem.ub]).T
 
         if self.approx_grad:
+            fun = objective.get_fval
             jac = None
         elif objective.has_grad:
-            jac = objective.get_grad
+            # function values and gradients are computed jointly
+            evaluator = LastPointEvaluator(objective)
+            fun = evaluator.fun
+            jac = evaluator.jac
         else:
             raise ValueError(
                 "For IPOPT, the objective must either be able to return "
@@ -599,7 +610,7 @@ class IpoptOptimizer(Optimizer):
             )
 
         ret = cyipopt.minimize_ipopt(
-            fun=objective.get_fval,
+            fun=fun,
             x0=x0,
             method=None,  # ipopt does not use this argument for anything
             jac=jac,
@@ -1218,12 +1229,16 @@ class NLoptOptimizer(Optimizer):
         opt.set_lower_bounds(problem.lb)
         opt.set_upper_bounds(problem.ub)
 
+        # reuse gradient evaluations for function value requests at the
+        #  same point
+        evaluator = LastPointEvaluator(problem.objective, sensi_orders=(0,))
+
         def nlopt_objective(x, grad):
             if grad.size > 0:
                 sensi_orders = (0, 1)
             else:
                 sensi_orders = (0,)
-            r = problem.objective(x, sensi_orders, MODE_FUN, True)
+            r = evaluator.evaluate(x, sensi_orders)
             if grad.size > 0:
                 grad[:] = r[GRAD]  # note that this must be inplace
             return r[FVAL]
@@ -1282,6 +1297,26 @@ class NLoptOptimizer(Optimizer):
         return True
 
 
+def _dense_outputs(fun):
+    """Wrap a function to convert sparse matrix outputs to dense arrays.
+
+    Fides solves its trust-region subproblems with dense linear algebra, so
+    sparse Hessians or residual sensitivities are densified once per call.
+    """
+
+    @wraps(fun)
+    def wrapped_fun(*args, **kwargs):
+        ret = fun(*args, **kwargs)
+        if not isinstance(ret, tuple):
+            return ret
+        return tuple(
+            value.toarray() if scipy.sparse.issparse(value) else value
+            for value in ret
+        )
+
+    return wrapped_fun
+
+
 class FidesOptimizer(Optimizer):
     """
     Global/Local optimization using the trust region optimizer fides.
@@ -1410,7 +1445,7 @@ class FidesOptimizer(Optimizer):
             args["sensi_orders"] = (0, 1)
 
         opt = fides.Optimizer(
-            fun=problem.objective,
+            fun=_dense_outputs(problem.objective),
             funargs=args,
             ub=problem.ub,
             lb=problem.lb,
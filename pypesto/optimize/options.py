@@ -1,4 +1,7 @@
-from typing import Union
+from typing import TYPE_CHECKING, Callable, Union
+
+if TYPE_CHECKING:
+    from ..result import Result
 
 
 class OptimizeOptions(dict):
@@ -22,6 +25,17 @@ class OptimizeOptions(dict):
         Whether the optimal value recorded by pyPESTO in the history has
         priority over the optimal value reported by the optimizer (True)
         or not (False).
+    autosave_interval:
+        If not None, and a `filename` is passed to
+        :func:`pypesto.optimize.minimize`, the results obtained so far are
+        saved every `autosave_interval` finished starts, and not only once
+        all starts have finished.
+    early_stopping:
+        If not None, a callable that is called with the
+        :class:`pypesto.Result` containing all starts finished so far,
+        whenever a start has finished. If it returns True, the multistart
+        optimization is terminated and starts that have not been started
+        yet are discarded.
     """
 
     def __init__(
@@ -30,6 +44,8 @@ class OptimizeOptions(dict):
         report_sres: bool = True,
         report_hess: bool = True,
         history_beats_optimizer: bool = True,
+        autosave_interval: Union[int, None] = None,
+        early_stopping: Union[Callable[["Result"], bool], None] = None,
     ):
         super().__init__()
 
@@ -37,6 +53,10 @@ class OptimizeOptions(dict):
         self.report_sres: bool = report_sres
         self.report_hess: bool = report_hess
         self.history_beats_optimizer: bool = history_beats_optimizer
+        self.autosave_interval: Union[int, None] = autosave_interval
+        self.early_stopping: Union[
+            Callable[["Result"], bool], None
+        ] = early_stopping
 
     def __getattr__(self, key):
         try:
@@ -1,4 +1,6 @@
+import hashlib
 import logging
+import re
 
 import numpy as np
 
@@ -15,6 +17,8 @@ logger = logging.getLogger(__name__)
 class OptimizerTask(Task):
     """A multistart optimization task, performed in `pypesto.minimize`."""
 
+    shared_attributes = ("optimizer", "problem")
+
     def __init__(
         self,
         optimizer: "pypesto.optimize.Optimizer",
@@ -23,6 +27,7 @@ class OptimizerTask(Task):
         id: str,
         history_options: HistoryOptions,
         optimize_options: "pypesto.optimize.OptimizeOptions",
+        cost: float = None,
     ):
         """Create the task object.
 
@@ -40,6 +45,9 @@ class OptimizerTask(Task):
             Options object applying to optimization.
         history_options:
             Optimizer history options.
+        cost:
+            Hint on the expected cost of the optimization, used by engines
+            for scheduling. See :attr:`pypesto.engine.Task.cost`.
         """
         super().__init__()
 
@@ -49,6 +57,29 @@ class OptimizerTask(Task):
         self.id = id
         self.optimize_options = optimize_options
         self.history_options = history_options
+        self.cost = cost
+
+    def fingerprint(self) -> str:
+        """Get a fingerprint of the task configuration.
+
+        A hash of the start point, the optimizer and optimize options, and
+        the bounds, fixed parameters and parameter names of the problem.
+        """
+        problem = self.problem
+        config = (
+            repr(self.optimizer),
+            repr(self.optimize_options),
+            problem.dim_full,
+            problem.x_fixed_indices,
+            problem.x_fixed_vals,
+            problem.x_names,
+        )
+        # memory addresses, e.g. in default representations, vary
+        config = re.sub(r" at 0x[0-9a-fA-F]+", "", repr(config))
+        hash_ = hashlib.sha256(config.encode())
+        for array in (self.x0, problem.lb_full, problem.ub_full):
+            hash_.update(np.ascontiguousarray(array, dtype=float).tobytes())
+        return hash_.hexdigest()[:16]
 
     def execute(self) -> OptimizerResult:
         """Execute the task."""
@@ -70,3 +101,19 @@ class OptimizerTask(Task):
         if not self.optimize_options.report_sres:
             optimizer_result.sres = None
         return optimizer_result
+
+    def on_failure(self, error: Exception) -> OptimizerResult:
+        """Report a failed start, if failed starts are allowed."""
+        if not self.optimize_options.allow_failed_starts:
+            raise error
+        logger.error(f"start {self.id} failed: {error}")
+        optimizer_result = OptimizerResult(
+            x0=self.x0,
+            fval=np.inf,
+            exitflag=-1,
+            message=str(error),
+            id=self.id,
+        )
+        optimizer_result.update_to_full(self.problem)
+        optimizer_result.optimizer = str(self.optimizer)
+        return optimizer_result
@@ -4,6 +4,7 @@ import logging
 import os
 from collections.abc import Iterable
 from pathlib import Path
+from typing import Callable, Union
 
 import h5py
 import numpy as np
@@ -11,6 +12,7 @@ import numpy as np
 from .. import C
 from ..engine import Engine, SingleCoreEngine
 from ..history import CsvHistoryTemplateError, HistoryOptions, HistoryTypeError
+from ..objective import ObjectiveBase
 from ..result import Result
 from .optimizer import OptimizerResult
 
@@ -115,6 +117,48 @@ def postprocess_hdf5_history(
     history_options.storage_file = storage_file
 
 
+def check_intermediate_autosave(
+    filename: Union[str, Path, Callable, None],
+    overwrite: bool,
+) -> bool:
+    """Check whether intermediate results can be autosaved.
+
+    Intermediate results are repeatedly written to the same file. This
+    requires a fixed filename, and must not overwrite existing optimization
+    results unless `overwrite` is set.
+
+    Parameters
+    ----------
+    filename:
+        The `filename` passed to :func:`pypesto.optimize.minimize`.
+    overwrite:
+        Whether existing optimization results may be overwritten.
+
+    Returns
+    -------
+    Whether intermediate results can be autosaved.
+    """
+    if filename is None:
+        return False
+    if not isinstance(filename, (str, Path)) or filename == "Auto":
+        logger.warning(
+            "Intermediate autosaving requires a fixed filename, "
+            "results will only be saved once all starts have finished."
+        )
+        return False
+    if overwrite or not os.path.exists(filename):
+        return True
+    with h5py.File(filename, "r") as f:
+        storage_used = "optimize" in f.keys()
+    if storage_used:
+        logger.warning(
+            f"There is already an optimize-result saved in {filename}, "
+            "intermediate results will not be saved. Set overwrite=True "
+            "to overwrite it."
+        )
+    return not storage_used
+
+
 def bound_n_starts_from_env(n_starts: int):
     """Bound number of optimization starts from environment variable.
 
@@ -188,3 +232,82 @@ def check_finite_bounds(lb, ub):
             "Selected optimizer cannot work with unconstrained "
             "optimization problems."
         )
+
+
+class LastPointEvaluator:
+    """
+    Fused evaluation of function values and derivatives at the last point.
+
+    Many optimizers request the function value and the gradient (or the
+    residuals and their sensitivities) at the same point via separate
+    callbacks. Evaluating the objective separately for each callback
+    duplicates e.g. forward sensitivity simulations. Instead, this
+    evaluator computes all sensitivity orders in `sensi_orders` at once,
+    and serves all callbacks at the same point from these results. Thus,
+    the objective, and its history, register a single evaluation per
+    distinct point.
+
+    Parameters
+    ----------
+    objective:
+        The objective to evaluate.
+    sensi_orders:
+        The sensitivity orders to compute at each distinct point.
+    mode:
+        The objective mode.
+    """
+
+    def __init__(
+        self,
+        objective: ObjectiveBase,
+        sensi_orders: tuple[int, ...] = (0, 1),
+        mode: C.ModeType = C.MODE_FUN,
+    ):
+        self.objective: ObjectiveBase = objective
+        self.sensi_orders: tuple[int, ...] = sensi_orders
+        self.mode: C.ModeType = mode
+        if mode == C.MODE_FUN:
+            self._keys = (C.FVAL, C.GRAD, C.HESS)
+        else:
+            self._keys = (C.RES, C.SRES)
+
+        self._x: Union[np.ndarray, None] = None
+        self._result: dict = {}
+
+    def evaluate(self, x: np.ndarray, sensi_orders: tuple[int, ...]) -> dict:
+        """Get the results for `sensi_orders` at `x`.
+
+        Results at the last point are reused if they contain all requested
+        orders. Otherwise, the requested orders and `self.sensi_orders` are
+        computed.
+        """
+        if (
+            self._x is None
+            or not np.array_equal(x, self._x)
+            or any(
+                self._keys[order] not in self._result for order in sensi_orders
+            )
+        ):
+            self._result = self.objective(
+                x,
+                tuple(sorted(set(sensi_orders) | set(self.sensi_orders))),
+                self.mode,
+                return_dict=True,
+            )
+            self._x = np.array(x, dtype=float)
+        # copy arrays, such that the optimizer cannot modify the stored ones
+        return {
+            key: value.copy() if isinstance(value, np.ndarray) else value
+            for key, value in (
+                (self._keys[order], self._result[self._keys[order]])
+                for order in sensi_orders
+            )
+        }
+
+    def fun(self, x: np.ndarray) -> Union[float, np.ndarray]:
+        """Get the function value, or the residuals, at `x`."""
+        return self.evaluate(x, (0,))[self._keys[0]]
+
+    def jac(self, x: np.ndarray) -> np.ndarray:
+        """Get the gradient, or the residual sensitivities, at `x`."""
+        return self.evaluate(x, (1,))[self._keys[1]]
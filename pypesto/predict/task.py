@@ -26,6 +26,8 @@ class PredictorTask(Task):
         The input ID.
     """
 
+    shared_attributes = ("predictor",)
+
     def __init__(
         self,
         predictor,  #: 'pypesto.predict.Predictor',  # noqa: F821
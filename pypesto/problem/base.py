@@ -11,8 +11,10 @@ from typing import (
 
 import numpy as np
 import pandas as pd
+import scipy.sparse
 
 from ..objective import ObjectiveBase
+from ..objective.pre_post_process import ParameterIndexMap
 from ..objective.priors import NegLogParameterPriors
 from ..startpoint import StartpointMethod, to_startpoint_method, uniform
 
@@ -119,6 +121,8 @@ class Problem:
         self.dim_full: int = (
             dim_full if dim_full is not None else self.lb_full.size
         )
+        self._index_map: Optional[ParameterIndexMap] = None
+        self._index_map_key: Optional[tuple] = None
 
         if x_fixed_indices is None:
             x_fixed_indices = []
@@ -168,27 +172,27 @@ class Problem:
     @property
     def lb(self) -> np.ndarray:
         """Return lower bounds of free parameters."""
-        return self.lb_full[self.x_free_indices]
+        return self.lb_full[self.index_map.x_free_indices]
 
     @property
     def ub(self) -> np.ndarray:
         """Return upper bounds of free parameters."""
-        return self.ub_full[self.x_free_indices]
+        return self.ub_full[self.index_map.x_free_indices]
 
     @property
     def lb_init(self) -> np.ndarray:
         """Return initial lower bounds of free parameters."""
-        return self.lb_init_full[self.x_free_indices]
+        return self.lb_init_full[self.index_map.x_free_indices]
 
     @property
     def ub_init(self) -> np.ndarray:
         """Return initial upper bounds of free parameters."""
-        return self.ub_init_full[self.x_free_indices]
+        return self.ub_init_full[self.index_map.x_free_indices]
 
     @property
     def x_guesses(self) -> np.ndarray:
         """Return guesses of the free parameter values."""
-        return self.x_guesses_full[:, self.x_free_indices]
+        return self.x_guesses_full[:, self.index_map.x_free_indices]
 
     @property
     def dim(self) -> int:
@@ -198,7 +202,24 @@ class Problem:
     @property
     def x_free_indices(self) -> list[int]:
         """Return non fixed parameters."""
-        return sorted(set(range(0, self.dim_full)) - set(self.x_fixed_indices))
+        return self.index_map.x_free_indices.tolist()
+
+    @property
+    def index_map(self) -> ParameterIndexMap:
+        """
+        Return the cached map between full and reduced vectors.
+
+        The map is updated incrementally by :meth:`fix_parameters` and
+        :meth:`unfix_parameters`, and rebuilt if `dim_full` or
+        `x_fixed_indices` were changed otherwise.
+        """
+        key = (self.dim_full, tuple(self.x_fixed_indices))
+        if self._index_map_key != key:
+            self._index_map = ParameterIndexMap(
+                dim_full=self.dim_full, x_fixed_indices=self.x_fixed_indices
+            )
+            self._index_map_key = key
+        return self._index_map
 
     def normalize(self) -> None:
         """
@@ -226,7 +247,9 @@ class Problem:
                 (self.x_guesses_full.shape[0], self.dim_full)
             )
             x_guesses_full[:] = np.nan
-            x_guesses_full[:, self.x_free_indices] = self.x_guesses_full
+            x_guesses_full[
+                :, self.index_map.x_free_indices
+            ] = self.x_guesses_full
             self.x_guesses_full = x_guesses_full
 
         # make objective aware of fixed parameters
@@ -235,6 +258,7 @@ class Problem:
             x_free_indices=self.x_free_indices,
             x_fixed_indices=self.x_fixed_indices,
             x_fixed_vals=self.x_fixed_vals,
+            index_map=self.index_map,
         )
 
         # sanity checks
@@ -291,6 +315,7 @@ class Problem:
         """Fix specified parameters to specified values."""
         parameter_indices = _make_iterable_if_value(parameter_indices, "int")
         parameter_vals = _make_iterable_if_value(parameter_vals, "float")
+        index_map = self.index_map
 
         # first clean to-be-fixed indices to avoid redundancies
         for iter_index, (x_index, x_value) in enumerate(
@@ -309,6 +334,8 @@ class Problem:
             else:
                 self.x_fixed_indices.append(index)
                 self.x_fixed_vals.append(val)
+                index_map.fix(index)
+        self._index_map_key = (self.dim_full, tuple(self.x_fixed_indices))
 
         self.normalize()
 
@@ -318,6 +345,7 @@ class Problem:
         """Free specified parameters."""
         # check and adapt input
         parameter_indices = _make_iterable_if_value(parameter_indices, "int")
+        index_map = self.index_map
 
         # first clean to-be-freed indices
         for iter_index, x_index in enumerate(parameter_indices):
@@ -328,6 +356,8 @@ class Problem:
                 fixed_x_index = self.x_fixed_indices.index(index)
                 self.x_fixed_indices.pop(fixed_x_index)
                 self.x_fixed_vals.pop(fixed_x_index)
+                index_map.unfix(index)
+        self._index_map_key = (self.dim_full, tuple(self.x_fixed_indices))
 
         self.normalize()
 
@@ -355,14 +385,15 @@ class Problem:
         if len(x) == self.dim_full:
             return x
 
-        # Note: The funny indexing construct is to handle residual gradients,
-        # where the last dimension is assumed to be the parameter one.
-        x_full = np.zeros(x.shape[:-1] + (self.dim_full,))
-        x_full[:] = np.nan
-        x_full[..., self.x_free_indices] = x
-        if x_fixed_vals is not None:
-            x_full[..., self.x_fixed_indices] = x_fixed_vals
-        return x_full
+        # Note: The last dimension is assumed to be the parameter one, to
+        # handle residual gradients.
+        if x_fixed_vals is None:
+            return self.index_map.to_full(x)
+        x_full = np.empty(
+            x.shape[:-1] + (self.dim_full,), dtype=np.result_type(x, float)
+        )
+        x_full[..., self.x_fixed_indices] = x_fixed_vals
+        return self.index_map.to_full(x, fill_value=None, out=x_full)
 
     def get_full_matrix(
         self, x: Union[np.ndarray, None]
@@ -378,17 +409,14 @@ class Problem:
         if x is None:
             return None
 
-        # make sure it is an array
-        x = np.array(x)
+        # make sure it is an array, keeping sparse matrices
+        if not scipy.sparse.issparse(x):
+            x = np.array(x)
 
-        if len(x) == self.dim_full:
+        if x.shape[0] == self.dim_full:
             return x
 
-        x_full = np.zeros((self.dim_full, self.dim_full))
-        x_full[:, :] = np.nan
-        x_full[np.ix_(self.x_free_indices, self.x_free_indices)] = x
-
-        return x_full
+        return self.index_map.to_full_matrix(x)
 
     def get_reduced_vector(
         self,
@@ -411,13 +439,12 @@ class Problem:
             return None
 
         if x_indices is None:
-            x_indices = self.x_free_indices
+            x_indices = self.index_map.x_free_indices
 
         if len(x_full) == len(x_indices):
             return x_full
 
-        x = [x_full[idx] for idx in x_indices]
-        return np.array(x)
+        return np.asarray(x_full)[x_indices]
 
     def get_reduced_matrix(
         self, x_full: Union[np.ndarray, None]
@@ -433,12 +460,13 @@ class Problem:
         if x_full is None:
             return None
 
-        if len(x_full) == self.dim:
-            return x_full
+        if not scipy.sparse.issparse(x_full):
+            x_full = np.asarray(x_full)
 
-        x = x_full[np.ix_(self.x_free_indices, self.x_free_indices)]
+        if x_full.shape[0] == self.dim:
+            return x_full
 
-        return x
+        return self.index_map.reduce_matrix(x_full)
 
     def full_index_to_free_index(self, full_index: int):
         """
@@ -452,12 +480,7 @@ class Problem:
         -------
         free_index: The index in the free vector.
         """
-        fixed_indices = np.asarray(self.x_fixed_indices)
-        if full_index in fixed_indices:
-            raise ValueError(
-                "Cannot compute index in free vector: Index is fixed."
-            )
-        return full_index - sum(fixed_indices < full_index)
+        return self.index_map.free_index(full_index)
 
     def print_parameter_summary(self) -> None:
         """
@@ -2,6 +2,7 @@ import logging
 from collections.abc import Iterable
 
 import numpy as np
+import scipy.sparse
 from scipy.stats import multivariate_normal
 
 from ..problem import Problem
@@ -69,6 +70,8 @@ def approximate_parameter_profile(
     x = optimizer_result.x
     fval = optimizer_result.fval
     hess = problem.get_reduced_matrix(optimizer_result.hess)
+    if scipy.sparse.issparse(hess):
+        hess = hess.toarray()
 
     # ratio scaling factor
     ratio_scaling = np.exp(global_opt - fval)
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 class ProfilerTask(Task):
     """A parameter likelihood profiling task."""
 
+    shared_attributes = ("optimizer", "problem")
+
     def __init__(
         self,
         current_profile: ProfilerResult,
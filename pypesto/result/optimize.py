@@ -9,6 +9,7 @@ from typing import Union
 
 import numpy as np
 import pandas as pd
+import scipy.sparse
 
 from ..history import HistoryBase
 from ..problem import Problem
@@ -18,6 +19,13 @@ OptimizationResult = Union["OptimizerResult", "OptimizeResult"]
 logger = logging.getLogger(__name__)
 
 
+def _as_array(value):
+    """Convert to a numpy array, keeping sparse matrices."""
+    if value is None or scipy.sparse.issparse(value):
+        return value
+    return np.array(value)
+
+
 class OptimizerResult(dict):
     """
     The result of an optimizer run.
@@ -39,11 +47,12 @@ class OptimizerResult(dict):
     grad:
         The gradient at `x`.
     hess:
-        The Hessian at `x`.
+        The Hessian at `x`. Possibly a :mod:`scipy.sparse` matrix.
     res:
         The residuals at `x`.
     sres:
-        The residual sensitivities at `x`.
+        The residual sensitivities at `x`. Possibly a :mod:`scipy.sparse`
+        matrix.
     n_fval
         Number of function evaluations.
     n_grad:
@@ -101,9 +110,9 @@ class OptimizerResult(dict):
         self.x: np.ndarray = np.array(x) if x is not None else None
         self.fval: float = fval
         self.grad: np.ndarray = np.array(grad) if grad is not None else None
-        self.hess: np.ndarray = np.array(hess) if hess is not None else None
+        self.hess: np.ndarray = _as_array(hess)
         self.res: np.ndarray = np.array(res) if res is not None else None
-        self.sres: np.ndarray = np.array(sres) if sres is not None else None
+        self.sres: np.ndarray = _as_array(sres)
         self.n_fval: int = n_fval
         self.n_grad: int = n_grad
         self.n_hess: int = n_hess
@@ -1,10 +1,10 @@
 from collections.abc import Sequence
-from typing import Union
+from typing import Callable, Union
 
 import numpy as np
 
 from ..history import NoHistory
-from ..objective import NegLogPriors, ObjectiveBase
+from ..objective import CallPlan, NegLogPriors, ObjectiveBase
 from ..problem import Problem
 from ..result import McmcPtResult
 from ..util import tqdm
@@ -46,6 +46,8 @@ class MetropolisSampler(InternalSampler):
         self.trace_neglogpost: Union[Sequence[float], None] = None
         self.trace_neglogprior: Union[Sequence[float], None] = None
         self.temper_lpost: bool = False
+        self._neglogpost_fval: Union[CallPlan, None] = None
+        self._neglogprior_fval: Union[CallPlan, Callable, None] = None
 
     @classmethod
     def default_options(cls):
@@ -64,6 +66,12 @@ class MetropolisSampler(InternalSampler):
             self.neglogprior = lambda x: -0.0
         else:
             self.neglogprior = problem.x_priors
+        # avoid call overhead in the sampling loop
+        self._neglogpost_fval = CallPlan(self.neglogpost)
+        if isinstance(self.neglogprior, ObjectiveBase):
+            self._neglogprior_fval = CallPlan(self.neglogprior)
+        else:
+            self._neglogprior_fval = self.neglogprior
         self.trace_x = [x0]
         self.trace_neglogpost = [self.neglogpost(x0)]
         self.trace_neglogprior = [self.neglogprior(x0)]
@@ -119,7 +127,7 @@ class MetropolisSampler(InternalSampler):
             lpost_new = -np.inf
         else:
             # compute log posterior
-            lpost_new = -self.neglogpost(x_new)
+            lpost_new = -self._neglogpost_fval(x_new)
 
         # check posterior evaluation is successful
         if np.isnan(lpost_new):
@@ -127,7 +135,7 @@ class MetropolisSampler(InternalSampler):
             lpost_new = -np.inf
 
         # compute log prior
-        lprior_new = -self.neglogprior(x_new)
+        lprior_new = -self._neglogprior_fval(x_new)
 
         if not self.temper_lpost:
             # extract current log likelihood value
@@ -54,7 +54,14 @@ class NoStartpoints(StartpointMethod):
 
 
 class CheckedStartpoints(StartpointMethod, ABC):
-    """Startpoints checked for function value and/or gradient finiteness."""
+    """Startpoints checked for function value and/or gradient finiteness.
+
+    Attributes
+    ----------
+    fvals:
+        Function values of the most recently generated startpoints, as
+        evaluated during checking, or None if they were not evaluated.
+    """
 
     def __init__(
         self,
@@ -78,6 +85,7 @@ class CheckedStartpoints(StartpointMethod, ABC):
         self.use_guesses: bool = use_guesses
         self.check_fval: bool = check_fval
         self.check_grad: bool = check_grad
+        self.fvals: np.ndarray | None = None
 
     def __call__(
         self,
@@ -85,6 +93,8 @@ class CheckedStartpoints(StartpointMethod, ABC):
         problem: pypesto.problem.Problem,
     ) -> np.ndarray:
         """Generate checked startpoints."""
+        self.fvals = None
+
         # shape: (n_guesses, dim)
         x_guesses = problem.x_guesses
         if not self.use_guesses:
@@ -201,6 +211,8 @@ class CheckedStartpoints(StartpointMethod, ABC):
         # sort startpoints by function value
         xs_order = np.argsort(fvals)
         xs = xs[xs_order, :]
+        if self.check_fval:
+            self.fvals = fvals[xs_order]
 
         return xs
 
@@ -5,6 +5,7 @@ from numbers import Integral, Number, Real
 
 import h5py
 import numpy as np
+import scipy.sparse
 
 
 def write_array(f: h5py.Group, path: str, values: Collection) -> None:
@@ -97,3 +98,44 @@ def write_int_array(
 
     if len(values):
         dset[:] = values
+
+
+def write_sparse_matrix(
+    f: h5py.Group, path: str, matrix: scipy.sparse.spmatrix
+) -> None:
+    """
+    Write sparse matrix to hdf5.
+
+    The matrix is stored in CSR format as a group with the datasets `data`,
+    `indices` and `indptr`, and its shape as attribute.
+
+    Parameters
+    ----------
+    f:
+        h5py.Group where the group should be created
+    path:
+        path of the group to create
+    matrix:
+        sparse matrix to write
+    """
+    matrix = scipy.sparse.csr_matrix(matrix)
+    grp = f.create_group(path)
+    grp.create_dataset("data", data=matrix.data)
+    grp.create_dataset("indices", data=matrix.indices)
+    grp.create_dataset("indptr", data=matrix.indptr)
+    grp.attrs["shape"] = matrix.shape
+
+
+def read_sparse_matrix(grp: h5py.Group) -> scipy.sparse.csr_matrix:
+    """
+    Read sparse matrix written by :func:`write_sparse_matrix`.
+
+    Parameters
+    ----------
+    grp:
+        h5py.Group containing the matrix
+    """
+    return scipy.sparse.csr_matrix(
+        (grp["data"][:], grp["indices"][:], grp["indptr"][:]),
+        shape=tuple(grp.attrs["shape"]),
+    )
@@ -13,6 +13,7 @@ from ..history import Hdf5History
 from ..objective import Objective, ObjectiveBase
 from ..problem import Problem
 from ..result import McmcPtResult, OptimizerResult, ProfilerResult, Result
+from .hdf5 import read_sparse_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -74,9 +75,12 @@ def read_hdf5_optimization(
                 result["history"].recover_options(file_name)
                 continue
         if optimization_key in f[f"/optimization/results/{opt_id}"]:
-            result[optimization_key] = f[
-                f"/optimization/results/{opt_id}/{optimization_key}"
-            ][:]
+            entry = f[f"/optimization/results/{opt_id}/{optimization_key}"]
+            if isinstance(entry, h5py.Group):
+                # sparse matrix
+                result[optimization_key] = read_sparse_matrix(entry)
+            else:
+                result[optimization_key] = entry[:]
         elif optimization_key in f[f"/optimization/results/{opt_id}"].attrs:
             result[optimization_key] = f[
                 f"/optimization/results/{opt_id}"
@@ -8,9 +8,10 @@ from typing import Union
 
 import h5py
 import numpy as np
+import scipy.sparse
 
 from ..result import ProfilerResult, Result, SampleResult
-from .hdf5 import write_array, write_float_array
+from .hdf5 import write_array, write_float_array, write_sparse_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -140,6 +141,8 @@ class OptimizationResultHDF5Writer:
                         continue
                     if isinstance(start[key], np.ndarray):
                         write_array(start_grp, key, start[key])
+                    elif scipy.sparse.issparse(start[key]):
+                        write_sparse_matrix(start_grp, key, start[key])
                     elif start[key] is not None:
                         start_grp.attrs[key] = start[key]
                 f.flush()
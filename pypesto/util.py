@@ -12,7 +12,7 @@ from operator import itemgetter
 from typing import Any, Callable, Optional, Union
 
 import numpy as np
-from scipy import cluster
+from scipy import cluster, sparse
 from tqdm import tqdm as _tqdm
 
 
@@ -63,8 +63,11 @@ def res_to_fval(res: np.ndarray) -> float:
 
 @_check_none
 def sres_to_schi2(res: np.ndarray, sres: np.ndarray) -> np.ndarray:
-    """Translate residual sensitivities to chi2 gradient."""
-    return 2 * res.dot(sres)
+    """Translate residual sensitivities to chi2 gradient.
+
+    `sres` may be a sparse matrix.
+    """
+    return 2 * np.asarray(sres.transpose().dot(res))
 
 
 @_check_none
@@ -98,9 +101,13 @@ def sres_to_fim(sres: np.ndarray) -> np.ndarray:
     """Translate residual sensitivities to FIM.
 
     The FIM is based on the function values, not chi2, i.e. has a normalization
-    of 0.5 as in :func:`res_to_fval`.
+    of 0.5 as in :func:`res_to_fval`. For sparse `sres`, the FIM is
+    returned as a dense array.
     """
-    return sres.transpose().dot(sres)
+    fim = sres.transpose().dot(sres)
+    if sparse.issparse(fim):
+        fim = fim.toarray()
+    return fim
 
 
 def is_none_or_nan(x: Union[Number, None]) -> bool:
@@ -151,3 +151,113 @@ def test_exceptions():
 
     with pytest.raises(ValueError):
         pypesto.objective.AggregatedObjective([])
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_executor(executor):
+    """Test concurrent evaluation of the objectives."""
+    objectives = [
+        rosen_for_sensi(max_sensi_order=2)["obj"],
+        poly_for_sensi(max_sensi_order=2)["obj"],
+        NegLogParameterPriors([get_parameter_prior_dict(0, "normal", [0, 1])]),
+    ]
+    x = np.array([0.3, -0.7])
+    expected = pypesto.objective.AggregatedObjective(objectives)(x, (0, 1, 2))
+    aggregated = pypesto.objective.AggregatedObjective(
+        objectives, executor=executor, n_workers=2
+    )
+    for _ in range(2):
+        for actual, value in zip(aggregated(x, (0, 1, 2)), expected):
+            assert np.allclose(actual, value)
+    batch = aggregated.call_batch(np.array([x, x]), (0, 1))
+    assert np.allclose(batch[1][1], expected[1])
+    assert np.all(aggregated.component_times > 0)
+    aggregated.shutdown()
+
+    with pytest.raises(ValueError):
+        pypesto.objective.AggregatedObjective(objectives, executor="gpu")
+
+
+def test_constant_objectives():
+    """Test that constant objectives are evaluated only once."""
+    n_calls = []
+
+    def density(x):
+        n_calls.append(1)
+        return -(x**2)
+
+    prior = NegLogParameterPriors(
+        [
+            {
+                "index": 1,
+                "density_fun": density,
+                "density_dx": lambda x: -2 * x,
+                "density_ddx": lambda x: -2.0,
+            }
+        ]
+    )
+    aggregated = pypesto.objective.AggregatedObjective(
+        [rosen_for_sensi(max_sensi_order=2)["obj"], prior]
+    )
+
+    # the prior depends on a free parameter
+    aggregated(np.array([0.5, 1.0]))
+    aggregated(np.array([0.5, 2.0]))
+    assert len(n_calls) == 2
+
+    # the prior only depends on a fixed parameter
+    problem = pypesto.Problem(
+        aggregated,
+        lb=[-2, -2],
+        ub=[2, 2],
+        x_fixed_indices=[1],
+        x_fixed_vals=[2],
+    )
+    n_calls.clear()
+    for x in [0.1, 0.2, 0.3]:
+        fval, grad = problem.objective(np.array([x]), (0, 1))
+        assert np.isclose(
+            fval, rosen_for_sensi(2)["obj"](np.array([x, 2])) + 4
+        )
+    assert len(n_calls) == 1
+
+    # fixing another parameter resets the constant results
+    problem.unfix_parameters(1)
+    problem.fix_parameters(0, 0.1)
+    problem.objective(np.array([1.0]))
+    problem.objective(np.array([2.0]))
+    assert len(n_calls) == 3
+
+
+def test_sparse_sres():
+    """Test aggregation of sparse residual sensitivities."""
+    import scipy.sparse
+
+    def sres(x):
+        return scipy.sparse.identity(3, format="csr")
+
+    dense = pypesto.Objective(res=lambda x: x - 1, sres=lambda x: np.eye(3))
+    sparse = pypesto.Objective(res=lambda x: x - 1, sres=sres)
+    problem = pypesto.Problem(
+        pypesto.objective.AggregatedObjective([dense, sparse]),
+        lb=-5 * np.ones(3),
+        ub=5 * np.ones(3),
+        x_fixed_indices=[1],
+        x_fixed_vals=[1.0],
+    )
+    res, sres = problem.objective(
+        np.zeros(2), sensi_orders=(0, 1), mode=MODE_RES
+    )
+    assert scipy.sparse.issparse(sres)
+    assert np.array_equal(
+        sres.toarray(), np.vstack([np.eye(3)] * 2)[:, [0, 2]]
+    )
+
+    result = pypesto.optimize.minimize(
+        problem,
+        pypesto.optimize.ScipyOptimizer("ls_trf"),
+        n_starts=1,
+        progress_bar=False,
+    )
+    assert np.allclose(result.optimize_result[0].x, 1)
+    assert np.allclose(result.optimize_result[0].grad[[0, 2]], 0)
@@ -1,16 +1,21 @@
 """Test the execution engines."""
 
+import asyncio
 import copy
+import logging
 import os
+import time
 
 import amici
 import benchmark_models_petab as models
 import cloudpickle as pickle
 import numpy as np
+import scipy.optimize as so
 
 import pypesto
 import pypesto.optimize
 import pypesto.petab
+from pypesto.engine.task import order_by_cost
 
 from ..util import rosen_for_sensi
 
@@ -22,7 +27,9 @@ def test_basic():
         pypesto.engine.MultiProcessEngine(n_procs=2, method="spawn"),
         pypesto.engine.MultiProcessEngine(n_procs=2, method="fork"),
         pypesto.engine.MultiProcessEngine(n_procs=2, method="forkserver"),
+        pypesto.engine.MultiProcessEngine(n_procs=2, chunksize=2),
         pypesto.engine.MultiThreadEngine(n_threads=4),
+        pypesto.engine.AsyncioEngine(max_concurrency=4),
     ]:
         _test_basic(engine)
 
@@ -44,6 +51,34 @@ def _test_basic(engine):
     assert len(result.optimize_result) == 2
 
 
+def test_persistent_multi_process_engine():
+    """Test reusing worker processes and shared objects across calls."""
+    objective = rosen_for_sensi(max_sensi_order=2)["obj"]
+    problem = pypesto.Problem(objective, 0 * np.ones(2), 1 * np.ones(2))
+    optimizer = pypesto.optimize.ScipyOptimizer(options={"maxiter": 10})
+
+    with pypesto.engine.MultiProcessEngine(
+        n_procs=2, persistent=True
+    ) as engine:
+        for _ in range(2):
+            result = pypesto.optimize.minimize(
+                problem=problem,
+                n_starts=3,
+                engine=engine,
+                optimizer=optimizer,
+                progress_bar=False,
+            )
+            assert len(result.optimize_result) == 3
+        pool = engine._pool
+        shared_dir = engine._shared_objects.directory
+        # problem and optimizer are stored once under their content keys
+        assert len(os.listdir(shared_dir)) == 2
+
+    assert engine._pool is None
+    assert not os.path.exists(shared_dir)
+    assert pool is not None
+
+
 def test_petab():
     for engine in [
         pypesto.engine.SingleCoreEngine(),
@@ -145,3 +180,348 @@ def test_pickle_objective():
         == objective2.amici_solver.getSensitivityMethod()
     )
     assert len(objective.edatas) == len(objective2.edatas)
+
+
+def test_execute_iter():
+    """Test streaming result delivery in order of completion."""
+
+    class SquareTask(pypesto.engine.Task):
+        def __init__(self, x):
+            super().__init__()
+            self.x = x
+
+        def execute(self):
+            return self.x**2
+
+    tasks = [SquareTask(x) for x in range(10)]
+    for engine in [
+        pypesto.engine.SingleCoreEngine(),
+        pypesto.engine.MultiProcessEngine(n_procs=2),
+        pypesto.engine.MultiProcessEngine(n_procs=2, persistent=True),
+        pypesto.engine.MultiThreadEngine(n_threads=2),
+    ]:
+        indexed_results = list(engine.execute_iter(tasks, progress_bar=False))
+        assert sorted(indexed_results) == [(x, x**2) for x in range(10)]
+        assert engine.execute(tasks, progress_bar=False) == [
+            x**2 for x in range(10)
+        ]
+
+        # closing early does not break the engine
+        results_iter = engine.execute_iter(tasks, progress_bar=False)
+        next(results_iter)
+        results_iter.close()
+        assert len(engine.execute(tasks, progress_bar=False)) == 10
+
+        if isinstance(engine, pypesto.engine.MultiProcessEngine):
+            engine.close()
+
+
+def test_order_by_cost():
+    """Test that expensive tasks are scheduled first."""
+
+    class CostTask(pypesto.engine.Task):
+        def __init__(self, cost):
+            super().__init__()
+            self.cost = cost
+
+        def execute(self):
+            return self.cost
+
+    costs = [1.0, None, 3.0, np.nan, 2.0, 3.0]
+    tasks = [CostTask(cost) for cost in costs]
+    assert order_by_cost(tasks) == [2, 5, 4, 0, 1, 3]
+
+    # with a single worker, completion order equals submission order
+    engine = pypesto.engine.MultiProcessEngine(n_procs=1)
+    assert [
+        i_task for i_task, _ in engine.execute_iter(tasks, progress_bar=False)
+    ] == [2, 5, 4, 0, 1, 3]
+    # results are still returned in order of submission
+    assert engine.execute(tasks[:3], progress_bar=False) == costs[:3]
+
+
+class FaultyTask(pypesto.engine.Task):
+    """Task that crashes, hangs, or raises, depending on its mode."""
+
+    def __init__(self, mode, marker=None):
+        super().__init__()
+        self.mode = mode
+        self.marker = marker
+
+    def execute(self):
+        if self.marker is not None and not os.path.exists(self.marker):
+            # fail only in the first attempt
+            open(self.marker, "w").close()
+            os._exit(1)
+        if self.mode == "crash":
+            os._exit(1)
+        if self.mode == "hang":
+            time.sleep(60)
+        if self.mode == "raise":
+            raise ValueError("Task failed.")
+        return os.getpid()
+
+    def on_failure(self, error):
+        return error
+
+
+def test_fault_tolerant_multi_process_engine(tmp_path):
+    """Test timeouts, retries and worker recycling."""
+    engine = pypesto.engine.MultiProcessEngine(
+        n_procs=2, task_timeout=2, n_retries=1, max_tasks_per_worker=1
+    )
+    tasks = [
+        FaultyTask("ok"),
+        FaultyTask("crash"),
+        FaultyTask("hang"),
+        FaultyTask("raise"),
+        FaultyTask("ok", marker=str(tmp_path / "marker")),
+        FaultyTask("ok"),
+    ]
+    results = engine.execute(tasks, progress_bar=False)
+
+    for i_task in (1, 2, 3):
+        assert isinstance(results[i_task], pypesto.engine.TaskFailedError)
+        assert results[i_task].n_attempts == 2
+    assert "time limit" in str(results[2])
+    assert "ValueError" in str(results[3])
+    # the retry succeeded
+    assert isinstance(results[4], int)
+    # workers are recycled after each task
+    assert len({results[0], results[4], results[5]}) == 3
+
+
+def test_failed_starts():
+    """Test that crashing starts are reported as failed results."""
+    objective = rosen_for_sensi(max_sensi_order=2)["obj"]
+    problem = pypesto.Problem(objective, 0 * np.ones(2), 1 * np.ones(2))
+
+    class CrashingOptimizer(pypesto.optimize.ScipyOptimizer):
+        def minimize(self, problem, x0, id, *args, **kwargs):
+            if id == "1":
+                os._exit(1)
+            return super().minimize(problem, x0, id, *args, **kwargs)
+
+    result = pypesto.optimize.minimize(
+        problem=problem,
+        optimizer=CrashingOptimizer(options={"maxiter": 10}),
+        n_starts=3,
+        engine=pypesto.engine.MultiProcessEngine(n_procs=2, n_retries=1),
+        progress_bar=False,
+    )
+
+    assert len(result.optimize_result) == 3
+    failed = [r for r in result.optimize_result if r.exitflag == -1]
+    assert len(failed) == 1
+    assert failed[0].id == "1"
+    assert failed[0].x0.shape == (2,)
+
+
+class ThreadReportTask(pypesto.engine.Task):
+    """Task reporting the thread settings it is executed with."""
+
+    shared_attributes = ("problem",)
+
+    def __init__(self, problem):
+        super().__init__()
+        self.problem = problem
+
+    def execute(self):
+        return (
+            self.problem.objective.n_threads,
+            os.environ.get("OMP_NUM_THREADS"),
+        )
+
+
+def test_resource_plan():
+    """Test splitting cores between workers and objectives."""
+    plan = pypesto.engine.ResourcePlan(n_cores=8, n_workers=2)
+    assert plan.n_threads_per_worker == 4
+    plan = pypesto.engine.ResourcePlan(n_cores=8, n_threads_per_worker=2)
+    assert plan.n_workers == 4
+    assert plan.get_environment()["OPENBLAS_NUM_THREADS"] == "1"
+
+    objective = rosen_for_sensi(max_sensi_order=2)["obj"]
+    objective.n_threads = 1
+    problem = pypesto.Problem(objective, 0 * np.ones(2), 1 * np.ones(2))
+    tasks = [ThreadReportTask(problem) for _ in range(3)]
+
+    for engine in [
+        pypesto.engine.MultiProcessEngine(resource_plan=plan),
+        pypesto.engine.MultiProcessEngine(resource_plan=plan, persistent=True),
+        pypesto.engine.MultiThreadEngine(resource_plan=plan),
+    ]:
+        assert getattr(engine, "n_procs", None) or engine.n_threads == 4
+        results = engine.execute(tasks, progress_bar=False)
+        for n_threads, omp_num_threads in results:
+            assert n_threads == 2
+            if not isinstance(engine, pypesto.engine.MultiThreadEngine):
+                assert omp_num_threads == "1"
+        if isinstance(engine, pypesto.engine.MultiProcessEngine):
+            engine.close()
+
+    # the objective of the original problem is not modified
+    assert objective.n_threads == 1
+
+
+class MarkerTask(pypesto.engine.Task):
+    """Task leaving a marker file on each execution."""
+
+    def __init__(self, id, directory):
+        super().__init__()
+        self.id = id
+        self.directory = directory
+
+    def execute(self):
+        with open(
+            os.path.join(
+                self.directory, f"{self.id}_{os.getpid()}_{time.time()}"
+            ),
+            "w",
+        ):
+            pass
+        return int(self.id) ** 2
+
+
+def test_resumable_engine(tmp_path):
+    """Test resuming an interrupted execution from a journal."""
+    journal_file = str(tmp_path / "tasks.journal")
+    marker_dir = tmp_path / "markers"
+    marker_dir.mkdir()
+    tasks = [MarkerTask(str(i), str(marker_dir)) for i in range(6)]
+
+    engine = pypesto.engine.ResumableEngine(
+        pypesto.engine.SingleCoreEngine(), filename=journal_file
+    )
+    # interrupt after 2 tasks
+    results_iter = engine.execute_iter(tasks, progress_bar=False)
+    for _ in range(2):
+        next(results_iter)
+    results_iter.close()
+    assert len(os.listdir(marker_dir)) == 2
+
+    # simulate a record truncated by killing the process while writing
+    with open(journal_file, "ab") as f:
+        f.write(b"\x01\x02")
+
+    engine = pypesto.engine.ResumableEngine(
+        pypesto.engine.MultiProcessEngine(n_procs=2), filename=journal_file
+    )
+    results = engine.execute(tasks, progress_bar=False)
+    assert results == [i**2 for i in range(6)]
+    # only the remaining tasks were executed
+    assert len(os.listdir(marker_dir)) == 6
+
+    # everything is journaled now
+    assert engine.execute(tasks, progress_bar=False) == results
+    assert len(os.listdir(marker_dir)) == 6
+
+
+def test_resumable_minimize(tmp_path, caplog):
+    """Test resuming a multistart optimization."""
+    objective = rosen_for_sensi(max_sensi_order=2)["obj"]
+    problem = pypesto.Problem(objective, 0 * np.ones(2), 1 * np.ones(2))
+    engine = pypesto.engine.ResumableEngine(
+        filename=str(tmp_path / "minimize.journal")
+    )
+    kwargs = {
+        "problem": problem,
+        "optimizer": pypesto.optimize.ScipyOptimizer(options={"maxiter": 10}),
+        "engine": engine,
+        "progress_bar": False,
+    }
+    # start points are reproducible via the seed
+    np.random.seed(0)
+    result1 = pypesto.optimize.minimize(n_starts=2, **kwargs)
+    np.random.seed(0)
+    result2 = pypesto.optimize.minimize(n_starts=3, **kwargs)
+
+    assert len(result2.optimize_result) == 3
+    for optimizer_result in result1.optimize_result:
+        reused = [
+            r for r in result2.optimize_result if r.id == optimizer_result.id
+        ][0]
+        assert np.array_equal(reused.x0, optimizer_result.x0)
+        assert reused.time == optimizer_result.time
+
+    # results of differently configured tasks are not reused
+    np.random.seed(0)
+    kwargs["optimizer"] = pypesto.optimize.ScipyOptimizer(
+        options={"maxiter": 5}
+    )
+    with caplog.at_level(logging.WARNING):
+        result3 = pypesto.optimize.minimize(n_starts=3, **kwargs)
+    assert "3 task ids with a different configuration" in caplog.text
+    for optimizer_result in result2.optimize_result:
+        rerun = [
+            r for r in result3.optimize_result if r.id == optimizer_result.id
+        ][0]
+        assert np.array_equal(rerun.x0, optimizer_result.x0)
+        assert rerun.time != optimizer_result.time
+
+
+class SlowObjective(pypesto.Objective):
+    """Objective waiting for a simulated remote service."""
+
+    async def call_unprocessed_async(self, x, sensi_orders, mode, **kwargs):
+        await asyncio.sleep(0.2)
+        return self.call_unprocessed(x, sensi_orders, mode, **kwargs)
+
+
+def test_asyncio_engine():
+    """Test concurrent evaluation of asynchronous objectives."""
+    objective = SlowObjective(fun=so.rosen, grad=so.rosen_der)
+    xs = np.random.randn(200, 3)
+    tasks = [
+        pypesto.objective.ObjectiveCallTask(objective, x, sensi_orders=(0, 1))
+        for x in xs
+    ]
+
+    start = time.time()
+    results = pypesto.engine.AsyncioEngine(max_concurrency=100).execute(
+        tasks, progress_bar=False
+    )
+    # two rounds of 100 concurrent evaluations, instead of 200 sequential
+    assert time.time() - start < 10
+    for x, result in zip(xs, results):
+        assert np.isclose(result[pypesto.C.FVAL], so.rosen(x))
+        assert np.allclose(result[pypesto.C.GRAD], so.rosen_der(x))
+
+    # closing the iterator early cancels pending tasks
+    results_iter = pypesto.engine.AsyncioEngine(
+        max_concurrency=2
+    ).execute_iter(tasks, progress_bar=False)
+    next(results_iter)
+    start = time.time()
+    results_iter.close()
+    assert time.time() - start < 1
+
+
+class ArrayTask(pypesto.engine.Task):
+    """Task with large array input and output."""
+
+    def __init__(self, x: np.ndarray):
+        super().__init__()
+        self.x = x
+
+    def execute(self):
+        return self.x.sum(), 2 * self.x
+
+
+def test_array_transfer():
+    """Test transferring large arrays via memory-mapped files."""
+    tasks = [ArrayTask(np.full((500, 500), float(i))) for i in range(4)]
+    for engine in [
+        pypesto.engine.MultiProcessEngine(n_procs=2),
+        pypesto.engine.MultiProcessEngine(n_procs=2, persistent=True),
+        pypesto.engine.MultiProcessEngine(n_procs=2, n_retries=1),
+        pypesto.engine.MultiProcessEngine(n_procs=2, array_threshold=None),
+    ]:
+        with engine:
+            results = engine.execute(tasks, progress_bar=False)
+        for i_task, (total, doubled) in enumerate(results):
+            assert total == i_task * 500**2
+            assert np.all(doubled == 2 * i_task)
+            # results are writable without affecting other results
+            doubled[0, 0] = -1
+        assert results[0][1][0, 1] == 0
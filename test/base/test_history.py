@@ -5,7 +5,9 @@ import tempfile
 import unittest
 from collections.abc import Sequence
 from stat import S_IMODE, S_IWGRP, S_IWOTH, S_IWRITE
+from unittest.mock import patch
 
+import h5py
 import numpy as np
 import pytest
 import scipy.optimize as so
@@ -583,6 +585,32 @@ def test_history_properties(history: pypesto.HistoryBase):
         assert all(np.isnan(res) for res in ress)
 
 
+def test_hdf5_history_hessp():
+    """Test that Hessian-vector products are written to file in bulk."""
+    file = tempfile.mkstemp(suffix=".hdf5")[1]
+    history = pypesto.Hdf5History(id="id", file=file)
+    history.update(np.zeros(2), (0,), "mode_fun", {FVAL: 1.0})
+
+    opened = []
+    h5py_file = h5py.File
+
+    def counting_file(*args, **kwargs):
+        opened.append(1)
+        return h5py_file(*args, **kwargs)
+
+    with patch("pypesto.history.hdf5.h5py.File", counting_file):
+        for _ in range(5):
+            history.update_hessp(np.zeros(2))
+    assert not opened
+    assert history.n_hessp == 5
+
+    # written on the next update, and on finalization
+    history.update(np.zeros(2), (0,), "mode_fun", {FVAL: 1.0})
+    history.update_hessp(np.zeros(2))
+    history.finalize()
+    assert pypesto.Hdf5History.load(id="id", file=file).n_hessp == 6
+
+
 def test_trace_subset(history: pypesto.HistoryBase):
     """Test whether selecting only a trace subset works."""
     if not history.implements_trace():
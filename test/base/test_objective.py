@@ -1,16 +1,26 @@
 """Test the :class:`pypesto.Objective`."""
 
 import copy
+import logging
 import numbers
 from functools import partial
 
 import numpy as np
 import pytest
+import scipy.optimize as so
 import sympy as sp
 
 import pypesto
+from pypesto.objective.amici.amici_util import (
+    create_identity_parameter_mapping,
+)
 
-from ..util import CRProblem, poly_for_sensi, rosen_for_sensi
+from ..util import (
+    CRProblem,
+    load_amici_objective,
+    poly_for_sensi,
+    rosen_for_sensi,
+)
 
 
 @pytest.fixture(params=[True, False])
@@ -290,6 +300,25 @@ def test_jax(max_sensi_order, integrated, enable_x64):
                 f_prime = jax.jacfwd(jax_op_out)(g) * g_prime
                 np.testing.assert_allclose(f_prime, rj, atol=atol, rtol=rtol)
 
+    # Hessian-vector products via forward-over-reverse autodiff
+    obj_hessp = JaxObjective(
+        pypesto.Objective(
+            fun=so.rosen, grad=so.rosen_der, hessp=so.rosen_hess_prod
+        )
+    )
+    x, v = np.array([0.5, 1.5]), np.array([0.3, -1.2])
+    hessp_ref = so.rosen_hess_prod(x, v)
+    rtol = 1e-8 if enable_x64 else 1e-4
+    hessp = jax.jvp(jax.grad(obj_hessp.jax_objective), (x,), (v,))[1]
+    np.testing.assert_allclose(hessp, hessp_ref, rtol=rtol)
+    np.testing.assert_allclose(obj_hessp.get_hessp(x, v), hessp_ref, rtol=rtol)
+    # also as part of an aggregated objective
+    aggregated = pypesto.objective.AggregatedObjective([obj_hessp])
+    assert aggregated.has_hessp
+    np.testing.assert_allclose(
+        aggregated.get_hessp(x, v), hessp_ref, rtol=rtol
+    )
+
 
 @pytest.fixture(
     params=[pypesto.FD.CENTRAL, pypesto.FD.FORWARD, pypesto.FD.BACKWARD]
@@ -418,3 +447,604 @@ def test_fds(fd_method, fd_delta):
         assert obj_fd.delta_fun.updates == 0
     else:
         assert obj_fd.delta_fun.updates > 1
+
+
+def test_fd_batch(fd_method):
+    """Test batched and concurrent evaluation of FD stencils."""
+    n_par = 4
+    x = np.array([0.3, -1.2, 2.0, 0.7])
+    evaluated = []
+
+    def fun(x):
+        evaluated.append(x)
+        return np.sum(np.sin(x) * x[::-1])
+
+    obj = pypesto.Objective(fun=fun)
+    obj_fd = pypesto.FD(obj, grad=True, hess=True, method=fd_method)
+    result = obj_fd(x, sensi_orders=(0, 1, 2), return_dict=True)
+
+    # each stencil point is evaluated once, points shared by the gradient
+    #  and the diagonal and off-diagonal Hessian stencils only once
+    n_off_diagonal = n_par * (n_par - 1) // 2
+    if fd_method == pypesto.FD.CENTRAL:
+        # x, x +- delta_i / 2, x +- delta_i, x +- delta_i / 2 +- delta_j / 2
+        n_evaluations = 1 + 2 * n_par + 2 * n_par + 4 * n_off_diagonal
+    else:
+        # x, x +- delta_i, x +- 2 delta_i, x +- (delta_i + delta_j)
+        n_evaluations = 1 + n_par + n_par + n_off_diagonal
+    assert len(evaluated) == n_evaluations
+    assert len({x.tobytes() for x in evaluated}) == len(evaluated)
+
+    for executor in ["thread", "process"]:
+        obj_fd_pool = pypesto.FD(
+            pypesto.Objective(fun=lambda x: np.sum(np.sin(x) * x[::-1])),
+            grad=True,
+            hess=True,
+            method=fd_method,
+            executor=executor,
+            n_workers=2,
+        )
+        result_pool = obj_fd_pool(x, sensi_orders=(0, 1, 2), return_dict=True)
+        for key in [pypesto.C.FVAL, pypesto.C.GRAD, pypesto.C.HESS]:
+            assert np.array_equal(result[key], result_pool[key]), key
+
+    # step size selection evaluates all test step sizes as one batch
+    batches = []
+    obj_batch = pypesto.Objective(
+        fun=fun,
+        fun_batch=lambda X: batches.append(X) or [fun(x) for x in X],
+    )
+    obj_fd = pypesto.FD(obj_batch, grad=True, delta_fun=pypesto.FDDelta.ALWAYS)
+    obj_fd(x, sensi_orders=(1,))
+    n_test_deltas = len(obj_fd.delta_fun.test_deltas)
+    if fd_method == pypesto.FD.CENTRAL:
+        assert len(batches[0]) == 2 * n_par * n_test_deltas
+    assert len(batches) == 2
+
+
+def test_fd_hess_via_grad_delta():
+    """Test that the Hessian from gradients uses `delta_grad`."""
+    x = np.array([0.5, -1.0, 2.0])
+    obj = pypesto.Objective(
+        fun=lambda x: np.sum(x**4), grad=lambda x: 4 * x**3
+    )
+    delta_grad = 0.1
+    obj_fd = pypesto.FD(
+        obj,
+        hess=True,
+        hess_via_fval=False,
+        delta_fun=1e-6,
+        delta_grad=delta_grad,
+    )
+    hess = obj_fd.get_hess(x)
+    # central FD of 4 x^3 with step size h: 12 x^2 + h^2
+    assert np.allclose(hess, np.diag(12 * x**2 + delta_grad**2))
+
+    # evaluations with a missing (None) value are repeated, and do not
+    #  replace stored values
+    memo = {x.tobytes(): {pypesto.C.FVAL: None, pypesto.C.GRAD: 4 * x**3}}
+    f_batch = obj_fd._get_f_batch(
+        pypesto.C.FVAL, (0,), pypesto.C.MODE_FUN, memo, {}
+    )
+    assert f_batch(x[None, :]) == [np.sum(x**4)]
+    assert np.array_equal(memo[x.tobytes()][pypesto.C.GRAD], 4 * x**3)
+
+
+def test_fd_complex_step():
+    """Test complex step derivatives."""
+    x = np.array([0.3, -1.2, 2.0, 0.7])
+    obj = pypesto.Objective(
+        fun=lambda x: np.sum(np.sin(x) * x[::-1]),
+        grad=lambda x: np.cos(x) * x[::-1] + np.sin(x[::-1]),
+    )
+    grad = obj.get_grad(x)
+
+    # exact up to rounding, also for tiny step sizes
+    obj_fd = pypesto.FD(
+        obj, grad=True, hess=True, method=pypesto.FD.COMPLEX, delta_fun=1e-20
+    )
+    assert np.allclose(obj_fd.get_grad(x), grad, rtol=1e-14, atol=1e-14)
+
+    obj_fd = pypesto.FD(obj, grad=True, hess=True, method=pypesto.FD.COMPLEX)
+    obj_fd_central = pypesto.FD(obj, grad=True, hess=True, delta_fun=1e-4)
+    assert np.allclose(
+        obj_fd.get_hess(x), obj_fd_central.get_hess(x), rtol=1e-6, atol=1e-6
+    )
+
+
+def test_fd_sparsity():
+    """Test perturbation groups for sparse Jacobians."""
+    # three conditions with two parameters each
+    n_res = n_par = 6
+    evaluated = []
+
+    def res(x):
+        evaluated.append(x)
+        return np.array(
+            [
+                x[0] * x[1],
+                x[0] + x[1],
+                np.sin(x[2]) * x[3],
+                x[2] - x[3],
+                x[4] ** 2 * x[5],
+                x[4] - x[5],
+            ]
+        )
+
+    sparsity = np.kron(np.eye(3, dtype=bool), np.ones((2, 2), dtype=bool))
+    groups = pypesto.objective.finite_difference.perturbation_groups(sparsity)
+    assert len(groups) == 2
+    assert sorted(np.concatenate(groups)) == list(range(n_par))
+    for group in groups:
+        # no shared residuals
+        assert not (sparsity[:, group].sum(axis=1) > 1).any()
+
+    x = np.linspace(0.5, 1.5, n_par)
+    obj = pypesto.Objective(res=res)
+    sres = pypesto.FD(obj, sres=True).get_sres(x)
+    assert sres.shape == (n_res, n_par)
+
+    for res_sparsity in [sparsity, pypesto.FD.DETECT]:
+        obj_fd = pypesto.FD(obj, sres=True, res_sparsity=res_sparsity)
+        for method in [pypesto.FD.CENTRAL, pypesto.FD.COMPLEX]:
+            obj_fd.method = method
+            evaluated.clear()
+            assert np.allclose(obj_fd.get_sres(x), sres, atol=1e-6)
+        # one evaluation per group, after detection
+        assert len(evaluated) == len(groups)
+        assert np.array_equal(obj_fd.res_sparsity, sparsity)
+
+    with pytest.raises(ValueError):
+        pypesto.FD(obj, res_sparsity="dense")
+
+
+def test_fd_sparsity_detect_incidental_zero(caplog):
+    """Test that detection keeps entries vanishing at the first point."""
+    obj = pypesto.Objective(res=lambda x: np.array([x[0] * x[1], x[1] ** 2]))
+    obj_fd = pypesto.FD(obj, sres=True, res_sparsity=pypesto.FD.DETECT)
+
+    # d(x0 * x1)/dx1 and d(x1 ** 2)/dx1 vanish at x1 = 0 = x0
+    x = np.array([0.0, 0.0])
+    with caplog.at_level(logging.INFO):
+        assert np.allclose(obj_fd.get_sres(x), 0.0)
+    assert "Detected res_sparsity" in caplog.text
+    assert np.array_equal(obj_fd.res_sparsity, [[True, True], [False, True]])
+
+    x = np.array([2.0, 3.0])
+    assert np.allclose(obj_fd.get_sres(x), [[3.0, 2.0], [0.0, 6.0]])
+
+
+def test_hessp():
+    """Test Hessian-vector products."""
+    import scipy.optimize as so
+
+    x = np.array([0.3, -1.2, 2.0, 0.7])
+    v = np.array([1.0, 0.5, -2.0, 0.0])
+    hess = so.rosen_hess(x)
+
+    obj = pypesto.Objective(
+        fun=so.rosen, grad=so.rosen_der, hessp=so.rosen_hess_prod
+    )
+    assert obj.has_hessp
+    assert np.allclose(obj.get_hessp(x, v), hess @ v)
+    assert not pypesto.Objective(fun=so.rosen, hess=so.rosen_hess).has_hessp
+    with pytest.raises(ValueError):
+        pypesto.Objective(fun=so.rosen).get_hessp(x, v)
+
+    # via FDs of gradients
+    obj_grad = pypesto.Objective(fun=so.rosen, grad=so.rosen_der)
+    for method in pypesto.FD.METHODS:
+        obj_fd = pypesto.FD(obj_grad, method=method)
+        assert obj_fd.has_hessp
+        assert np.allclose(
+            obj_fd.get_hessp(x, v), hess @ v, rtol=1e-4, atol=1e-4
+        )
+    assert not pypesto.FD(obj_grad, hessp=False).has_hessp
+    assert np.array_equal(pypesto.FD(obj).get_hessp(x, v), hess @ v)
+
+    # with priors, fixed parameters, and history
+    prior = pypesto.objective.NegLogParameterPriors(
+        [
+            pypesto.objective.get_parameter_prior_dict(
+                ix, "normal", [0.0, 2.0]
+            )
+            for ix in range(len(x))
+        ]
+    )
+    posterior = pypesto.objective.AggregatedObjective([obj, prior])
+    assert posterior.has_hessp
+    problem = pypesto.Problem(
+        posterior,
+        lb=-5 * np.ones(4),
+        ub=5 * np.ones(4),
+        x_fixed_indices=[3],
+        x_fixed_vals=[x[3]],
+    )
+    problem.objective.history = pypesto.history.MemoryHistory()
+    hessp = problem.objective.get_hessp(x[:3], v[:3])
+    expected = (hess + np.eye(4) / 4)[:3, :3] @ v[:3]
+    assert np.allclose(hessp, expected)
+    assert problem.objective.history.n_hessp == 1
+    assert len(problem.objective.history) == 0
+
+
+def test_amici_hessp_reuses_sres():
+    """Test that Hessian-vector products at one point simulate once."""
+    objective = load_amici_objective("conversion_reaction")[0]
+    assert objective.has_hessp
+
+    n_simulations = []
+    call_unprocessed = objective.call_unprocessed
+
+    def counting_call_unprocessed(*args, **kwargs):
+        n_simulations.append(1)
+        return call_unprocessed(*args, **kwargs)
+
+    objective.call_unprocessed = counting_call_unprocessed
+
+    x = np.array([-0.3, -0.7])
+    fim = objective(x, sensi_orders=(2,))
+    n_simulations.clear()
+    for v in np.eye(2):
+        assert np.allclose(objective.get_hessp(x, v), fim @ v)
+    assert len(n_simulations) == 1
+
+    # a new point requires a new simulation
+    objective.get_hessp(x + 0.1, np.ones(2))
+    objective.get_hessp(x + 0.1, np.zeros(2))
+    assert len(n_simulations) == 2
+
+    # as do changes of the solver settings or the data
+    objective.amici_solver.setRelativeTolerance(1e-10)
+    objective.get_hessp(x + 0.1, np.ones(2))
+    assert len(n_simulations) == 3
+    edata = objective.edatas[0]
+    edata.setObservedData(2 * np.asarray(edata.getObservedData()))
+    objective.get_hessp(x + 0.1, np.ones(2))
+    assert len(n_simulations) == 4
+
+    # the sensitivities are not copied
+    assert objective._hessp_sres is not None
+    assert copy.deepcopy(objective)._hessp_sres is None
+
+
+def _test_call_batch(objective, X, sensi_orders, mode=pypesto.C.MODE_FUN):
+    """Check that batched and single evaluations agree."""
+    results = objective.call_batch(
+        X, sensi_orders=sensi_orders, mode=mode, return_dict=True
+    )
+    assert len(results) == len(X)
+    for x, result in zip(X, results):
+        expected = objective(
+            x, sensi_orders=sensi_orders, mode=mode, return_dict=True
+        )
+        for key in (
+            pypesto.C.FVAL,
+            pypesto.C.GRAD,
+            pypesto.C.HESS,
+            pypesto.C.RES,
+            pypesto.C.SRES,
+        ):
+            if key in expected:
+                assert np.allclose(result[key], expected[key]), key
+
+
+def test_call_batch():
+    """Test batched evaluation with the default and native implementations."""
+    X = np.random.uniform(-1, 1, size=(5, 2))
+
+    objective = rosen_for_sensi(max_sensi_order=2)["obj"]
+    _test_call_batch(objective, X, (0, 1, 2))
+
+    # vectorized function
+    def fun(x):
+        raise AssertionError("fun_batch should be used")
+
+    objective = pypesto.Objective(
+        fun=fun, fun_batch=lambda X: np.sum(X**2, axis=1)
+    )
+    assert np.allclose(objective.call_batch(X), np.sum(X**2, axis=1))
+
+    # priors
+    prior_list = [
+        pypesto.objective.get_parameter_prior_dict(0, "normal", [0, 1]),
+        pypesto.objective.get_parameter_prior_dict(
+            1, "laplace", [0.5, 2], "log10"
+        ),
+    ]
+    priors = pypesto.objective.NegLogParameterPriors(prior_list)
+    _test_call_batch(priors, X, (0, 1, 2))
+    _test_call_batch(priors, X, (0, 1), mode=pypesto.C.MODE_RES)
+
+    # aggregated
+    aggregated = pypesto.objective.AggregatedObjective(
+        [rosen_for_sensi(max_sensi_order=2)["obj"], priors]
+    )
+    _test_call_batch(aggregated, X, (0, 1))
+
+    # amici, with a single simulation call for all vectors and conditions
+    amici_objective = load_amici_objective("conversion_reaction")[0]
+    amici_objective.edatas = amici_objective.edatas * 2
+    amici_objective.parameter_mapping = create_identity_parameter_mapping(
+        amici_objective.amici_model, 2
+    )
+    _test_call_batch(amici_objective, X, (0, 1))
+    _test_call_batch(amici_objective, X, (0, 1), mode=pypesto.C.MODE_RES)
+
+    # fixed parameters
+    problem = pypesto.Problem(
+        aggregated,
+        lb=[-2, -2],
+        ub=[2, 2],
+        x_fixed_indices=[1],
+        x_fixed_vals=[0.5],
+    )
+    _test_call_batch(problem.objective, X[:, :1], (0, 1))
+
+
+def test_cached_objective():
+    """Test memoization of objective evaluations."""
+    n_calls = []
+
+    def fun(x):
+        n_calls.append(0)
+        return np.sum(x**2)
+
+    def grad(x):
+        n_calls.append(1)
+        return 2 * x
+
+    objective = pypesto.objective.CachedObjective(
+        pypesto.Objective(fun=fun, grad=grad), max_size=2
+    )
+    x0, x1, x2 = np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.zeros(2)
+
+    # higher orders are not served from lower orders
+    assert objective(x0) == 5
+    fval, grad0 = objective(x0, sensi_orders=(0, 1))
+    assert fval == 5 and np.allclose(grad0, [2, 4])
+    assert (objective.n_hits, objective.n_misses) == (0, 2)
+
+    # lower orders are served from higher orders, results are copies
+    grad0[:] = 0
+    assert objective(x0) == 5
+    assert np.allclose(objective(x0, sensi_orders=(1,)), [2, 4])
+    assert objective.call_unprocessed(x0, (0,), pypesto.C.MODE_FUN) == {
+        pypesto.C.FVAL: 5
+    }
+    assert objective.n_hits == 3
+    n_evals = len(n_calls)
+
+    # least recently used entries are evicted
+    objective(x1)
+    objective(x0)
+    objective(x2)
+    assert len(n_calls) == n_evals + 2
+    objective(x0)
+    assert len(n_calls) == n_evals + 2
+    objective(x1)
+    assert len(n_calls) == n_evals + 3
+
+    # batched evaluation only evaluates uncached vectors
+    assert np.allclose(
+        objective.call_batch(np.array([x0, x1, x2])), [5, 25, 0]
+    )
+    assert len(n_calls) == n_evals + 4
+    assert 0 < objective.hit_rate < 1
+
+    # copies start with an empty cache
+    other = copy.deepcopy(objective)
+    assert other.n_hits == objective.n_hits
+    assert not other._cache
+
+    objective.clear()
+    assert (objective.n_hits, objective.n_misses) == (0, 0)
+
+    # fixed parameters are handled by the wrapper
+    problem = pypesto.Problem(
+        objective,
+        lb=[-5, -5],
+        ub=[5, 5],
+        x_fixed_indices=[1],
+        x_fixed_vals=[2],
+    )
+    assert problem.objective(np.array([1.0])) == 5
+    assert problem.objective(np.array([1.0])) == 5
+    assert problem.objective.n_hits == 1
+
+
+def test_condition_cache():
+    """Test caching of AMICI simulation results per condition."""
+    import amici
+
+    from pypesto.objective.amici import ConditionCache
+
+    reference, model = load_amici_objective("conversion_reaction")
+    # two conditions with a shared and a condition-specific parameter
+    parameter_mapping = create_identity_parameter_mapping(model, 2)
+    for condition_ix in range(2):
+        parameter_mapping[condition_ix].map_sim_var[
+            "k2"
+        ] = f"k2_{condition_ix}"
+    kwargs = {
+        "amici_model": model,
+        "amici_solver": reference.amici_solver,
+        "max_sensi_order": 2,
+        "x_ids": ["k1", "k2_0", "k2_1"],
+        "parameter_mapping": parameter_mapping,
+    }
+    edatas = [amici.ExpData(edata) for edata in reference.edatas * 2]
+    reference = pypesto.AmiciObjective(edatas=edatas, **kwargs)
+    edatas = [amici.ExpData(edata) for edata in edatas]
+    objective = pypesto.AmiciObjective(
+        edatas=edatas, condition_cache=ConditionCache(max_size=2), **kwargs
+    )
+    cache = objective.condition_cache
+
+    def assert_matches_reference(x, sensi_orders=(0, 1), **kwargs):
+        for value, expected in zip(
+            objective(x, sensi_orders=sensi_orders, **kwargs),
+            reference(x, sensi_orders=sensi_orders, **kwargs),
+        ):
+            assert np.allclose(value, expected)
+
+    x = np.array([-0.3, -0.7, -0.5])
+    assert_matches_reference(x)
+    assert (cache.n_hits, cache.n_misses) == (0, 2)
+
+    # only the condition with a changed parameter is simulated
+    x[2] = -0.6
+    assert_matches_reference(x)
+    assert (cache.n_hits, cache.n_misses) == (1, 3)
+
+    # lower orders and the FIM are served from first order results
+    assert np.isclose(objective(x), reference(x))
+    assert_matches_reference(x, sensi_orders=(0, 1, 2))
+    assert (cache.n_hits, cache.n_misses) == (5, 3)
+    assert cache.hit_rate == 5 / 8
+    assert cache.time_saved >= 0
+
+    # residuals require different simulation results
+    assert_matches_reference(x, mode=pypesto.C.MODE_RES)
+    assert cache.n_misses == 5
+    # the least recently used entry of the second condition was evicted
+    assert len(cache) == 4
+
+    # batch evaluations use the cache, too
+    X = np.array([x, x + [0.1, 0, 0]])
+    for value, expected in zip(
+        objective.call_batch(X, sensi_orders=(0, 1)),
+        reference.call_batch(X, sensi_orders=(0, 1)),
+    ):
+        assert np.allclose(value[0], expected[0])
+        assert np.allclose(value[1], expected[1])
+    assert cache.n_hits == 7
+
+    # copies have their own, empty cache
+    copied = copy.deepcopy(objective)
+    assert len(copied.condition_cache) == 0
+    assert len(cache) == 4
+
+    cache.clear()
+    assert (len(cache), cache.n_hits, cache.n_misses) == (0, 0, 0)
+
+    # conditions do not evict each other's results
+    n_conditions = 5
+    objective = pypesto.AmiciObjective(
+        amici_model=model,
+        amici_solver=reference.amici_solver,
+        edatas=[amici.ExpData(edata) for edata in edatas[:1] * n_conditions],
+        parameter_mapping=create_identity_parameter_mapping(
+            model, n_conditions
+        ),
+        condition_cache=ConditionCache(max_size=1),
+    )
+    for _ in range(3):
+        objective(np.array([-0.3, -0.7]))
+    cache = objective.condition_cache
+    assert (cache.n_hits, cache.n_misses) == (2 * n_conditions, n_conditions)
+    assert len(cache) == n_conditions
+
+
+def test_surrogate_objective():
+    """Test surrogate-assisted screening of objective evaluations."""
+    n_calls = []
+
+    def fun(x):
+        n_calls.append(x)
+        return np.sum(x**2)
+
+    # the surrogate reproduces the training points
+    surrogate = pypesto.objective.GaussianProcessSurrogate()
+    rng = np.random.default_rng(0)
+    x_train = rng.uniform(-1, 1, size=(30, 2))
+    surrogate.fit(x_train, np.sum(x_train**2, axis=1))
+    mean, std = surrogate.predict(x_train)
+    assert np.allclose(mean, np.sum(x_train**2, axis=1), atol=1e-4)
+    assert np.all(std < 1e-2)
+
+    objective = pypesto.objective.SurrogateObjective(
+        pypesto.Objective(fun=fun, grad=lambda x: 2 * x),
+        min_points=10,
+        refit_interval=5,
+    )
+    problem = pypesto.Problem(
+        objective,
+        lb=[-5, -5, -5],
+        ub=[5, 5, 5],
+        x_fixed_indices=[2],
+        x_fixed_vals=[0.0],
+    )
+    objective = problem.objective
+
+    # all evaluations are escalated until enough points were recorded
+    assert objective.screen(np.zeros((3, 3))).all()
+    for x in rng.uniform(-5, 5, size=(10, 2)):
+        assert problem.objective(x) == np.sum(x**2)
+    assert len(n_calls) == len(objective.evaluations) == 10
+    assert objective.n_screened == objective.n_fits == 0
+
+    # obviously bad candidates are rejected, promising ones are evaluated
+    candidates = np.array([[0.1, 0.0], [5.0, 5.0], [-5.0, 5.0]])
+    fvals = np.array(problem.objective.call_batch(candidates))
+    assert objective.n_fits == 1
+    assert (objective.n_screened, objective.n_escalated) == (3, 1)
+    assert objective.rejection_rate == 2 / 3
+    assert fvals[0] == np.sum(candidates[0] ** 2)
+    assert np.all(fvals[1:] > objective.threshold)
+    assert len(n_calls) == 11
+    # true evaluations are made with full parameter vectors
+    assert n_calls[-1].size == 3
+
+    # derivatives are always evaluated
+    problem.objective(np.array([5.0, 5.0]), sensi_orders=(0, 1))
+    assert len(n_calls) == 12
+
+    # the surrogate is refitted after refit_interval new function values
+    for x in rng.uniform(-0.1, 0.1, size=(5, 2)):
+        problem.objective(x)
+    assert objective.n_fits == 2
+    assert objective.fit_time > 0
+
+
+def test_call_plan():
+    """Test that call plans are equivalent to regular calls."""
+    objective = rosen_for_sensi(max_sensi_order=2)["obj"]
+    problem = pypesto.Problem(
+        objective,
+        lb=-2 * np.ones(4),
+        ub=2 * np.ones(4),
+        x_fixed_indices=[1],
+        x_fixed_vals=[0.5],
+    )
+    x = np.array([0.1, -0.3, 0.7])
+
+    for sensi_orders in [(0,), (1,), (0, 1, 2)]:
+        plan = pypesto.objective.CallPlan(problem.objective, sensi_orders)
+        expected = problem.objective(x, sensi_orders, return_dict=True)
+        actual = plan(x)
+        if len(sensi_orders) == 1:
+            actual = (actual,)
+        for order, value in zip(sensi_orders, actual):
+            key = (pypesto.C.FVAL, pypesto.C.GRAD, pypesto.C.HESS)[order]
+            assert np.allclose(value, expected[key])
+
+    # the history is updated
+    plan = pypesto.objective.CallPlan(problem.objective, (0, 1))
+    problem.objective.history = pypesto.MemoryHistory()
+    plan(x)
+    plan(x)
+    assert problem.objective.history.n_fval == 2
+    assert problem.objective.history.n_grad == 2
+    assert np.allclose(problem.objective.history.get_x_trace(0), x)
+
+    # the plan is rebuilt when fixed parameters change
+    problem.unfix_parameters(1)
+    x = np.array([0.1, 0.2, -0.3, 0.7])
+    assert np.allclose(plan(x)[1], problem.objective(x, (1,)))
+
+    # invalid calls are rejected on construction
+    with pytest.raises(ValueError):
+        pypesto.objective.CallPlan(
+            rosen_for_sensi(max_sensi_order=0)["obj"], (1,)
+        )
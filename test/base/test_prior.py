@@ -173,6 +173,67 @@ def test_derivatives(prior_type_list, scale):
         )
 
 
+def test_vectorized(prior_type_list, scale):
+    """
+    Tests that the vectorized evaluation matches the prior callables.
+    """
+    rng = np.random.default_rng(0)
+    prior_list = [
+        get_parameter_prior_dict(
+            iprior % 3,
+            prior_type,
+            (
+                [-1, 1]
+                if prior_type in ["uniform", "parameterScaleUniform"]
+                else [0.3 * iprior, 1 + iprior]
+            ),
+            scale,
+        )
+        for iprior, prior_type in enumerate(prior_type_list * 2)
+    ]
+    vectorized = NegLogParameterPriors(prior_list)
+    # without the prior specification, the callables are used
+    callables = NegLogParameterPriors(
+        [
+            {
+                key: value
+                for key, value in prior.items()
+                if key not in ["type", "parameters", "scale"]
+            }
+            for prior in prior_list
+        ]
+    )
+    assert not vectorized._custom_rows
+    assert len(callables._custom_rows) == len(prior_list)
+
+    X = np.array(
+        [
+            lin_to_scaled(value, scale)
+            for value in rng.uniform(0.2, 0.9, size=9)
+        ]
+    ).reshape(3, 3)
+    for x in X:
+        for actual, expected in zip(
+            vectorized(x, (0, 1, 2)), callables(x, (0, 1, 2))
+        ):
+            assert np.allclose(actual, expected)
+        if vectorized.has_res:
+            for actual, expected in zip(
+                vectorized(x, (0, 1), MODE_RES),
+                callables(x, (0, 1), MODE_RES),
+            ):
+                assert np.allclose(actual, expected)
+    for actual, expected in zip(
+        vectorized.call_batch(X, (0, 1, 2)), callables.call_batch(X, (0, 1, 2))
+    ):
+        for actual_value, expected_value in zip(actual, expected):
+            assert np.allclose(actual_value, expected_value)
+    assert np.allclose(
+        vectorized.hessian_diagonal_neg_log_density(X[0]),
+        np.diag(callables.get_hess(X[0])),
+    )
+
+
 def lin_to_scaled(x: float, scale: str):
     """
     transforms x to linear scale
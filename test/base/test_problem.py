@@ -1,8 +1,10 @@
 """Test :class:`pypesto.Problem`."""
 
+import numpy as np
 import pytest
 
 import pypesto
+from pypesto.objective.pre_post_process import ParameterIndexMap
 
 
 @pytest.fixture
@@ -70,6 +72,87 @@ def test_fix_parameters(problem):
         problem.fix_parameters(1, "2")
 
 
+def test_index_map(problem):
+    """Test incremental updates of the cached parameter index map."""
+    rng = np.random.default_rng(0)
+    index_map = problem.index_map
+    for index in rng.integers(0, problem.dim_full, size=30):
+        if index in problem.x_fixed_indices:
+            problem.unfix_parameters(index)
+        else:
+            problem.fix_parameters(index, 1.0)
+        # updated in place, and equal to the map rebuilt from scratch
+        assert problem.index_map is index_map
+        expected = ParameterIndexMap(problem.dim_full, problem.x_fixed_indices)
+        assert np.array_equal(
+            index_map.x_free_indices, expected.x_free_indices
+        )
+        assert np.array_equal(
+            index_map.free_positions, expected.free_positions
+        )
+        assert problem.x_free_indices == sorted(
+            set(range(problem.dim_full)) - set(problem.x_fixed_indices)
+        )
+
+    # direct modification of the fixed indices triggers a rebuild
+    problem.x_fixed_indices = [0, 1]
+    problem.x_fixed_vals = [42, 43]
+    assert problem.x_free_indices == list(range(2, 10))
+
+    # mapping between full and reduced vectors and matrices
+    x = np.arange(8.0)
+    x_full = problem.get_full_vector(x, problem.x_fixed_vals)
+    assert np.array_equal(x_full, [42, 43, *x])
+    assert np.array_equal(problem.get_reduced_vector(x_full), x)
+    sres_full = problem.get_full_vector(np.ones((3, 8)))
+    assert sres_full.shape == (3, 10)
+    assert np.isnan(sres_full[:, :2]).all()
+    hess = np.outer(x, x)
+    hess_full = problem.get_full_matrix(hess)
+    assert np.isnan(hess_full[0]).all()
+    assert np.array_equal(problem.get_reduced_matrix(hess_full), hess)
+
+    out = np.empty(10)
+    assert problem.index_map.to_full(x, fill_value=0.0, out=out) is out
+    assert np.array_equal(out, [0, 0, *x])
+
+
+def test_index_map_shared_with_objective():
+    """Test that the objective reuses the index map of the problem."""
+    objective = pypesto.Objective(
+        fun=lambda x: np.sum(np.arange(1, 5) * x**2),
+        grad=lambda x: 2 * np.arange(1, 5) * x,
+    )
+    problem = pypesto.Problem(
+        objective=objective,
+        lb=[-5] * 4,
+        ub=[5] * 4,
+        x_fixed_indices=[1],
+        x_fixed_vals=[1.0],
+    )
+    objective = problem.objective
+    processor = objective.pre_post_processor
+    assert processor.index_map is problem.index_map
+
+    def check(x):
+        x_full = problem.get_full_vector(x, problem.x_fixed_vals)
+        fval, grad = objective(x, sensi_orders=(0, 1))
+        assert fval == np.sum(np.arange(1, 5) * x_full**2)
+        assert np.array_equal(
+            grad, (2 * np.arange(1, 5) * x_full)[problem.x_free_indices]
+        )
+
+    check(np.array([1.0, 2.0, 3.0]))
+    # updated in place, and calls use the updated fixed parameters
+    problem.fix_parameters(2, 3.0)
+    assert objective.pre_post_processor is processor
+    assert np.array_equal(processor.x_free_indices, [0, 3])
+    check(np.array([1.0, 2.0]))
+    problem.unfix_parameters(1)
+    assert objective.pre_post_processor is processor
+    check(np.array([1.0, 2.0, 3.0]))
+
+
 def test_full_index_to_free_index(problem):
     """Test problem.full_index_to_free_index."""
     assert problem.full_index_to_free_index(2) == 0
@@ -107,8 +107,11 @@ def test_resampling(check_fval: bool, check_grad: bool):
     # check that function values are (not) finite
     if check_fval:
         assert np.isfinite(fvals).all()
+        # evaluated function values are exposed, e.g. as cost hints
+        assert np.allclose(startpoint_method.fvals, fvals)
     else:
         assert not np.isfinite(fvals).all()
+        assert startpoint_method.fvals is None
 
     # check that gradients are (not) finite
     if check_grad:
@@ -6,6 +6,7 @@ import tempfile
 import numpy as np
 import pytest
 import scipy.optimize as so
+import scipy.sparse
 
 import pypesto
 import pypesto.optimize as optimize
@@ -69,6 +70,49 @@ def test_storage_opt_result():
                     assert opt_res[key] == read_result.optimize_result[i][key]
 
 
+def test_storage_sparse_hess(hdf5_file):
+    """Test sparse Hessians from optimization to storage."""
+    hess = scipy.sparse.diags([1.0, 2.0, 3.0], format="csr")
+    objective = pypesto.Objective(
+        fun=lambda x: 0.5 * x @ hess @ x,
+        grad=lambda x: hess @ x,
+        hess=lambda x: hess,
+    )
+    problem = pypesto.Problem(
+        objective=objective,
+        lb=-np.ones(3),
+        ub=np.ones(3),
+        x_fixed_indices=[1],
+        x_fixed_vals=[0.0],
+    )
+    assert scipy.sparse.issparse(
+        problem.objective(np.ones(2), sensi_orders=(2,))
+    )
+
+    result = optimize.minimize(
+        problem=problem,
+        optimizer=optimize.FidesOptimizer(),
+        n_starts=2,
+        progress_bar=False,
+    )
+    for opt_res in result.optimize_result.list:
+        assert scipy.sparse.issparse(opt_res[HESS])
+        assert opt_res[HESS].shape == (3, 3)
+        np.testing.assert_array_equal(
+            opt_res[HESS].toarray(), np.diag([1.0, 0.0, 3.0])
+        )
+
+    OptimizationResultHDF5Writer(hdf5_file).write(result)
+    read_result = OptimizationResultHDF5Reader(hdf5_file).read()
+    for opt_res, read_opt_res in zip(
+        result.optimize_result.list, read_result.optimize_result.list
+    ):
+        assert scipy.sparse.issparse(read_opt_res[HESS])
+        np.testing.assert_array_equal(
+            opt_res[HESS].toarray(), read_opt_res[HESS].toarray()
+        )
+
+
 def test_storage_opt_result_update(hdf5_file):
     minimize_result = create_optimization_result()
     minimize_result_2 = create_optimization_result()
@@ -407,6 +407,59 @@ def test_mpipoolengine():
             os.remove("temp_result.h5")
 
 
+def test_mpi_work_stealing_engine():
+    """
+    Test the MPIWorkStealingEngine by calling an example script with mpiexec.
+    """
+    file_name = "temp_result_work_stealing.h5"
+    try:
+        path = os.path.dirname(__file__)
+        subprocess.check_call(
+            [  # noqa: S603,S607
+                "mpiexec",
+                "--oversubscribe",
+                "-np",
+                "3",
+                "python",
+                f"{path}/../../doc/example/example_MPIWorkStealing.py",
+            ]
+        )
+
+        with pytest.warns(UserWarning, match="You are loading a problem."):
+            result1 = read_result(file_name, problem=True, optimize=True)
+        assert len(result1.optimize_result) == 20
+
+        # compare to local execution from the same startpoints
+        objective = pypesto.Objective(
+            fun=sp.optimize.rosen,
+            grad=sp.optimize.rosen_der,
+            hess=sp.optimize.rosen_hess,
+        )
+        problem = pypesto.Problem(
+            objective=objective,
+            ub=result1.problem.ub,
+            lb=result1.problem.lb,
+            x_guesses=result1.problem.x_guesses,
+        )
+        result2 = optimize.minimize(
+            problem=problem,
+            optimizer=optimize.FidesOptimizer(verbose=40),
+            n_starts=20,
+            progress_bar=False,
+        )
+        x_by_id = {r.id: r.x for r in result2.optimize_result.list}
+        for optimizer_result in result1.optimize_result.list:
+            assert_almost_equal(
+                optimizer_result.x,
+                x_by_id[optimizer_result.id],
+                err_msg="The final parameter values "
+                "do not agree for the engines.",
+            )
+    finally:
+        if os.path.exists(file_name):
+            os.remove(file_name)
+
+
 def test_history_beats_optimizer():
     """Test overwriting from history vs whatever the optimizer reports."""
     problem = CRProblem(
@@ -573,6 +626,53 @@ def test_scipy_integrated_grad():
     )
 
 
+@pytest.mark.parametrize(
+    "optimizer",
+    [
+        optimize.ScipyOptimizer(method="L-BFGS-B", options={"maxiter": 10}),
+        optimize.ScipyOptimizer(method="ls_trf", options={"max_nfev": 10}),
+        optimize.NLoptOptimizer(options={"maxeval": 10}),
+    ],
+)
+def test_fused_evaluation(optimizer):
+    """Test that fval and grad callbacks share one evaluation per point."""
+    n_calls = []
+
+    def count(fun):
+        def wrapped(x):
+            n_calls.append(1)
+            return fun(x)
+
+        return wrapped
+
+    if optimizer.is_least_squares():
+        obj = pypesto.Objective(
+            res=count(lambda x: x - 1),
+            sres=lambda x: np.eye(len(x)),
+        )
+    else:
+        obj = pypesto.Objective(
+            fun=count(sp.optimize.rosen),
+            grad=sp.optimize.rosen_der,
+        )
+    problem = pypesto.Problem(
+        objective=obj, lb=-2 * np.ones(2), ub=2 * np.ones(2)
+    )
+    result = optimize.minimize(
+        problem=problem,
+        optimizer=optimizer,
+        n_starts=1,
+        progress_bar=False,
+    )
+    history = result.optimize_result.history[0]
+    if optimizer.is_least_squares():
+        assert history.n_res == len(n_calls)
+        assert history.n_sres <= history.n_res
+    else:
+        assert history.n_fval == len(n_calls)
+        assert history.n_grad <= history.n_fval
+
+
 def test_ipopt_approx_grad():
     integrated = False
     obj = rosen_for_sensi(max_sensi_order=0, integrated=integrated)["obj"]
@@ -678,3 +778,59 @@ def test_assign_ids():
 
     ids = assign_ids(n_starts=n_starts, ids=None, result=result)
     assert ids == [str(i) for i in range(n_starts, n_starts * 2)]
+
+
+@pytest.mark.parametrize(
+    "engine",
+    [
+        pypesto.engine.SingleCoreEngine(),
+        pypesto.engine.MultiThreadEngine(n_threads=2),
+        pypesto.engine.MultiProcessEngine(n_procs=2),
+    ],
+)
+def test_early_stopping_and_intermediate_autosave(engine, tmp_path):
+    """Test stopping the multistart early and saving intermediate results."""
+    problem = CRProblem().get_problem()
+    filename = tmp_path / "result.h5"
+
+    result = optimize.minimize(
+        problem=problem,
+        optimizer=optimize.ScipyOptimizer(options={"maxiter": 10}),
+        n_starts=20,
+        engine=engine,
+        options=optimize.OptimizeOptions(
+            autosave_interval=2,
+            early_stopping=lambda result: len(result.optimize_result) >= 4,
+        ),
+        filename=str(filename),
+        progress_bar=False,
+    )
+
+    assert len(result.optimize_result) == 4
+    # the final result overwrote the intermediate ones
+    assert len(read_result(filename, optimize=True).optimize_result) == 4
+
+
+@pytest.mark.parametrize("method", ["Newton-CG", "trust-ncg", "trust-krylov"])
+def test_hessp_optimization(method):
+    """Test that Hessian-vector products are used, if available."""
+    n_hessp = []
+
+    def hessp(x, v):
+        n_hessp.append(1)
+        return sp.optimize.rosen_hess_prod(x, v)
+
+    objective = pypesto.Objective(
+        fun=sp.optimize.rosen, grad=sp.optimize.rosen_der, hessp=hessp
+    )
+    problem = pypesto.Problem(objective, lb=-2 * np.ones(2), ub=2 * np.ones(2))
+    optimizer = optimize.ScipyOptimizer(method=method)
+    result = optimizer.minimize(
+        problem=problem,
+        x0=np.array([-1.2, 1.0]),
+        id="0",
+        history_options=pypesto.HistoryOptions(),
+        optimize_options=optimize.OptimizeOptions(),
+    )
+    assert np.allclose(result.x, [1, 1], atol=1e-3)
+    assert n_hessp
@@ -2,19 +2,34 @@
 This is for testing the pypesto.Objective.
 """
 
+import copy
 import os
+import pickle
 
 import amici
 import benchmark_models_petab as models
 import numpy as np
 import petab
 import pytest
+import scipy.sparse
 
 import pypesto
 import pypesto.optimize as optimize
 import pypesto.petab
 from pypesto import C
-from pypesto.objective.amici.amici_util import add_sim_grad_to_opt_grad
+from pypesto.objective.amici import SteadyStateStore
+from pypesto.objective.amici.amici_calculator import (
+    calculate_function_values,
+)
+from pypesto.objective.amici.amici_util import (
+    ParameterMappingPlan,
+    add_sim_grad_to_opt_grad,
+    add_sim_hess_to_opt_hess,
+    map_par_opt_to_par_sim,
+    sim_sres_to_opt_sres,
+)
+
+from .test_amici_predictor import conversion_reaction_model  # noqa: F401
 
 ATOL = 1e-1
 RTOL = 1e-0
@@ -49,6 +64,232 @@ def test_add_sim_grad_to_opt_grad():
     assert np.allclose(expected, opt_grad)
 
 
+def test_parameter_mapping_plan():
+    """Test the precompiled parameter mapping against the dict mapping."""
+    from amici.petab.parameter_mapping import (
+        ParameterMapping,
+        ParameterMappingForCondition,
+    )
+
+    par_opt_ids = ["opt_par_1", "opt_par_2", "opt_par_3"]
+    par_sim_ids = ["sim_par_1", "sim_par_2", "sim_par_3", "sim_par_4"]
+    condition_maps = [
+        # duplicate optimization parameters
+        {
+            "sim_par_1": "opt_par_1",
+            "sim_par_2": "opt_par_3",
+            "sim_par_3": "opt_par_3",
+            "sim_par_4": 2.0,
+        },
+        # unknown parameter ids, and no estimated parameters
+        {
+            "sim_par_1": 1.0,
+            "sim_par_2": "unknown",
+            "sim_par_3": 3.0,
+            "sim_par_4": 4.0,
+        },
+    ]
+    parameter_mapping = ParameterMapping(
+        [ParameterMappingForCondition(map_sim_var=m) for m in condition_maps]
+    )
+    plan = ParameterMappingPlan(par_opt_ids, par_sim_ids, parameter_mapping)
+    assert len(plan) == 2
+
+    class Model:
+        def getParameterIds(self):
+            return par_sim_ids
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=3)
+    for condition_ix, condition_map in enumerate(condition_maps):
+        assert np.array_equal(
+            plan.par_sim(condition_ix, x),
+            map_par_opt_to_par_sim(
+                condition_map, dict(zip(par_opt_ids, x)), Model()
+            ),
+            equal_nan=True,
+        )
+
+        n_sensi = sum(isinstance(v, str) for v in condition_map.values())
+        sim_grad = rng.normal(size=n_sensi)
+        sim_hess = rng.normal(size=(n_sensi, n_sensi))
+        sim_sres = rng.normal(size=(5, n_sensi))
+        grad, expected_grad = np.ones(3), np.ones(3)
+        hess, expected_hess = np.ones((3, 3)), np.ones((3, 3))
+        plan.add_grad(condition_ix, sim_grad, grad, coefficient=-2.0)
+        plan.add_hess(condition_ix, sim_hess, hess, coefficient=-2.0)
+        add_sim_grad_to_opt_grad(
+            par_opt_ids,
+            par_sim_ids,
+            condition_map,
+            sim_grad,
+            expected_grad,
+            coefficient=-2.0,
+        )
+        add_sim_hess_to_opt_hess(
+            par_opt_ids,
+            par_sim_ids,
+            condition_map,
+            sim_hess,
+            expected_hess,
+            coefficient=-2.0,
+        )
+        assert np.allclose(grad, expected_grad)
+        assert np.allclose(hess, expected_hess)
+        assert np.allclose(
+            plan.sres(condition_ix, sim_sres),
+            sim_sres_to_opt_sres(
+                par_opt_ids, par_sim_ids, condition_map, sim_sres
+            ),
+        )
+
+    # duplicates are summed up
+    sim_hess = np.arange(9.0).reshape(3, 3)
+    hess = np.zeros((3, 3))
+    plan.add_hess(0, sim_hess, hess)
+    assert np.allclose(hess, [[0, 0, 1 + 2], [0, 0, 0], [3 + 6, 0, 24]])
+
+
+def test_residual_assembly():
+    """Test dense and sparse residual sensitivity assembly."""
+    from amici.petab.parameter_mapping import (
+        ParameterMapping,
+        ParameterMappingForCondition,
+    )
+
+    x_ids = ["shared", "specific_1", "specific_2"]
+    par_sim_ids = ["k_shared", "k_specific", "k_fixed"]
+    parameter_mapping = ParameterMapping(
+        [
+            ParameterMappingForCondition(
+                map_sim_var={
+                    "k_shared": "shared",
+                    "k_specific": specific,
+                    "k_fixed": 1.0,
+                }
+            )
+            for specific in x_ids[1:]
+        ]
+    )
+
+    class Model:
+        def getParameterIds(self):
+            return par_sim_ids
+
+    class Solver:
+        def getSensitivityMethod(self):
+            return amici.SensitivityMethod_forward
+
+    rng = np.random.default_rng(0)
+    n_res = [3, 5]
+    rdatas = [
+        {
+            "status": 0,
+            "llh": 0.0,
+            "chi2": 0.0,
+            "res": rng.normal(size=n),
+            "sres": rng.normal(size=(n, 2)),
+        }
+        for n in n_res
+    ]
+    kwargs = {
+        "rdatas": rdatas,
+        "sensi_orders": (0, 1),
+        "mode": C.MODE_RES,
+        "amici_model": Model(),
+        "amici_solver": Solver(),
+        "edatas": [None] * len(rdatas),
+        "x_ids": x_ids,
+        "parameter_mapping": parameter_mapping,
+        "fim_for_hess": True,
+    }
+    dense = calculate_function_values(**kwargs)
+    sparse = calculate_function_values(**kwargs, sparse_sres=True)
+
+    expected_sres = np.zeros((8, 3))
+    expected_sres[:3, [0, 1]] = rdatas[0]["sres"]
+    expected_sres[3:, [0, 2]] = rdatas[1]["sres"]
+    assert np.array_equal(
+        dense[C.RES], np.hstack([rdata["res"] for rdata in rdatas])
+    )
+    assert np.array_equal(dense[C.SRES], expected_sres)
+    assert np.array_equal(sparse[C.RES], dense[C.RES])
+    assert scipy.sparse.issparse(sparse[C.SRES])
+    assert np.array_equal(sparse[C.SRES].toarray(), expected_sres)
+
+
+def test_sparse_fim():
+    """Test dense and sparse FIM assembly."""
+    from amici.petab.parameter_mapping import (
+        ParameterMapping,
+        ParameterMappingForCondition,
+    )
+
+    x_ids = ["shared", "specific_1", "specific_2"]
+    par_sim_ids = ["k_shared", "k_specific", "k_other"]
+    # the shared parameter is mapped to two simulation parameters in the
+    #  second condition
+    parameter_mapping = ParameterMapping(
+        [
+            ParameterMappingForCondition(
+                map_sim_var={
+                    "k_shared": "shared",
+                    "k_specific": "specific_1",
+                    "k_other": 1.0,
+                }
+            ),
+            ParameterMappingForCondition(
+                map_sim_var={
+                    "k_shared": "shared",
+                    "k_specific": "specific_2",
+                    "k_other": "shared",
+                }
+            ),
+        ]
+    )
+
+    class Model:
+        def getParameterIds(self):
+            return par_sim_ids
+
+    class Solver:
+        def getSensitivityMethod(self):
+            return amici.SensitivityMethod_forward
+
+    rng = np.random.default_rng(0)
+    fims = [rng.normal(size=(3, 3)) for _ in range(2)]
+    rdatas = [
+        {
+            "status": 0,
+            "llh": -1.0,
+            "sllh": rng.normal(size=3),
+            "FIM": fim + fim.T,
+        }
+        for fim in fims
+    ]
+    kwargs = {
+        "rdatas": rdatas,
+        "sensi_orders": (0, 1, 2),
+        "mode": C.MODE_FUN,
+        "amici_model": Model(),
+        "amici_solver": Solver(),
+        "edatas": [None] * len(rdatas),
+        "x_ids": x_ids,
+        "parameter_mapping": parameter_mapping,
+        "fim_for_hess": True,
+    }
+    dense = calculate_function_values(**kwargs)
+    sparse = calculate_function_values(**kwargs, sparse_fim=True)
+
+    assert dense[C.FVAL] == sparse[C.FVAL] == 2.0
+    assert np.array_equal(dense[C.GRAD], sparse[C.GRAD])
+    assert scipy.sparse.issparse(sparse[C.HESS])
+    assert np.allclose(sparse[C.HESS].toarray(), dense[C.HESS])
+    # condition-specific parameters do not interact
+    assert sparse[C.HESS][1, 2] == sparse[C.HESS][2, 1] == 0
+    assert sparse[C.HESS].nnz == 7
+
+
 @pytest.mark.flaky(reruns=2)
 def test_error_leastsquares_with_ssigma():
     model_name = "Zheng_PNAS2012"
@@ -130,3 +371,114 @@ def test_preeq_guesses():
     # assert that resetting works
     problem.objective.initialize()
     assert obj.steadystate_guesses["fval"] == np.inf
+
+
+def test_steadystate_store(conversion_reaction_model):  # noqa: F811
+    """Test warm starts of preequilibration from stored steady states."""
+    model = conversion_reaction_model
+    model.setTimepoints(np.linspace(0, 4, 10))
+    model.setParameters([4.0, 0.4])
+    solver = model.getSolver()
+    solver.setSensitivityMethod(amici.SensitivityMethod_forward)
+
+    edatas = []
+    for fixed_parameters in ([2.0, 0.0], [0.0, 4.0]):
+        model.setFixedParameters(fixed_parameters)
+        edata = amici.ExpData(amici.runAmiciSimulation(model, solver), 1, 0)
+        edata.fixedParametersPreequilibration = [1.0, 1.0]
+        edatas.append(edata)
+
+    store = SteadyStateStore(max_size=2)
+    objective = pypesto.AmiciObjective(
+        model, solver, edatas, steadystate_store=store
+    )
+    reference = pypesto.AmiciObjective(
+        model,
+        solver,
+        [amici.ExpData(edata) for edata in edatas],
+        guess_steadystate=False,
+    )
+    assert objective.guess_steadystate is False
+
+    # cold starts, then warm starts with unchanged results
+    xs = [np.array([4.0, 0.4]), np.array([3.0, 0.5]), np.array([4.0, 0.3])]
+    for x in xs:
+        for value, expected in zip(
+            objective(x, sensi_orders=(0, 1)),
+            reference(x, sensi_orders=(0, 1)),
+        ):
+            assert np.allclose(value, expected, rtol=1e-4)
+    assert (store.n_hits, store.n_misses) == (4, 2)
+    assert store.hit_rate == 4 / 6
+    assert isinstance(store.preeq_time_saved, float)
+
+    # the oldest states are replaced, the nearest one is used
+    assert len(store) == 4
+    nearest = store.get_nearest(0, np.array([3.1, 0.5]))
+    assert np.array_equal(nearest[0], xs[1])
+    nearest = store.get_nearest(1, np.array([4.0, 0.4]))
+    assert np.array_equal(nearest[0], xs[2])
+
+    # batch evaluations use the store, too
+    objective.call_batch(np.array(xs[:2]), sensi_orders=(0,))
+    assert store.n_hits == 8
+
+    # copies share the store
+    assert copy.deepcopy(objective).steadystate_store is store
+    assert pickle.loads(pickle.dumps(store)) is store  # noqa: S301
+
+    store.clear()
+    assert (len(store), store.n_hits, store.n_misses) == (0, 0, 0)
+
+    # with the condition cache, only simulated conditions are recorded
+    store = SteadyStateStore()
+    objective = pypesto.AmiciObjective(
+        model,
+        solver,
+        [amici.ExpData(edata) for edata in edatas],
+        steadystate_store=store,
+        condition_cache=True,
+    )
+    for x in [xs[0], xs[1], xs[0]]:
+        for value, expected in zip(
+            objective(x, sensi_orders=(0, 1)),
+            reference(x, sensi_orders=(0, 1)),
+        ):
+            assert np.allclose(value, expected, rtol=1e-4)
+    assert objective.condition_cache.n_hits == 2
+    assert (store.n_hits, store.n_misses) == (2, 2)
+    assert store._n_preeq == {True: 2, False: 2}
+
+
+def test_aggregated_process_executor():
+    """Test evaluating AMICI objectives in a process pool."""
+    petab_problem = petab.Problem.from_yaml(
+        os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "..",
+            "doc",
+            "example",
+            "conversion_reaction",
+            "conversion_reaction.yaml",
+        )
+    )
+    importer = pypesto.petab.PetabImporter(petab_problem)
+    amici_objective = importer.create_objective()
+    prior = pypesto.Objective(fun=lambda x: np.sum(x**2), grad=lambda x: 2 * x)
+    x = np.array(petab_problem.x_nominal_scaled)
+
+    expected = pypesto.objective.AggregatedObjective([amici_objective, prior])(
+        x, sensi_orders=(0, 1), return_dict=True
+    )
+    assert len(expected[C.RDATAS]) == 1
+
+    aggregated = pypesto.objective.AggregatedObjective(
+        [amici_objective, prior], executor="process", n_workers=2
+    )
+    result = aggregated(x, sensi_orders=(0, 1), return_dict=True)
+    assert np.isclose(result[C.FVAL], expected[C.FVAL])
+    assert np.allclose(result[C.GRAD], expected[C.GRAD])
+    # simulation results are not returned from worker processes
+    assert result[C.RDATAS] == []
+    aggregated.shutdown()
@@ -14,6 +14,7 @@ import pypesto.optimize as optimize
 import pypesto.petab
 import pypesto.sample as sample
 from pypesto.C import OBJECTIVE_NEGLOGLIKE, OBJECTIVE_NEGLOGPOST
+from pypesto.objective.pre_post_process import PrePostProcessor
 from pypesto.sample.pymc import PymcSampler
 
 
@@ -616,6 +617,42 @@ def test_empty_prior():
     assert (logprior_trace == 0.0).all()
 
 
+def test_custom_objective_call():
+    """Test sampling objectives that cannot be called via a call plan."""
+
+    class ShiftProcessor(PrePostProcessor):
+        def preprocess(self, x):
+            return x - 1.0
+
+    class CallObjective(pypesto.Objective):
+        def __call__(self, x, *args, **kwargs):
+            self.n_calls += 1
+            return super().__call__(x, *args, **kwargs)
+
+    # a custom processor, shifting the parameters
+    problem = pypesto.Problem(
+        objective=pypesto.Objective(fun=lambda x: -gaussian_llh(x)),
+        lb=[-10],
+        ub=[10],
+    )
+    problem.objective.pre_post_processor = ShiftProcessor()
+    sampler = sample.MetropolisSampler(options={"show_progress": False})
+    sampler.initialize(problem, np.array([1.0]))
+    sampler.sample(n_samples=10)
+    assert sampler.trace_neglogpost[0] == -gaussian_llh(0.0)
+    for x, neglogpost in zip(sampler.trace_x, sampler.trace_neglogpost):
+        assert neglogpost == -gaussian_llh(x - 1.0)
+
+    # an overridden `__call__`
+    objective = CallObjective(fun=lambda x: -gaussian_llh(x))
+    objective.n_calls = 0
+    problem = pypesto.Problem(objective=objective, lb=[-10], ub=[10])
+    sampler = sample.MetropolisSampler(options={"show_progress": False})
+    sampler.initialize(problem, np.array([1.0]))
+    sampler.sample(n_samples=10)
+    assert problem.objective.n_calls == 11
+
+
 @pytest.mark.flaky(reruns=2)
 def test_prior():
     """Check that priors are defined for sampling."""